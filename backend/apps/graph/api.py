@@ -1,28 +1,45 @@
 """
 Django Ninja API routes for graph visualization.
 
-Provides REST API endpoints for querying graph data from Neo4j.
+Provides REST API endpoints for querying graph data from Neo4j. Views are
+async and query through the async Neo4j driver, so under an ASGI server a
+worker keeps serving requests while graph queries are in flight.
 """
 
 import logging
+import os
+from typing import Any, Literal
 from uuid import UUID
 
-from django.shortcuts import get_object_or_404
+from django.http import HttpResponse
+from django.shortcuts import aget_object_or_404
 from ninja import Router
 
 from apps.crawl.models import CrawlTask
-from services.neo4j_sync import get_popular_keywords, get_task_graph_data, search_nodes
+from core.renderers import render_json
+from services.graph_cache import cached_graph_response, skip_response_cache
+from services.graph_format import to_columnar
+from services.neo4j_metrics import get_query_metrics
+from services.neo4j_sync import (
+    aget_node_detail,
+    aget_popular_keywords,
+    aget_task_graph_data,
+    asearch_nodes,
+)
+from services.single_flight import get_single_flight_stats
 
 from .schemas import (
-    EdgeSchema,
+    ColumnarGraphResponse,
     ErrorResponse,
     GraphDataResponse,
     GraphStatsSchema,
     KeywordListResponse,
     KeywordSchema,
+    Neo4jMetricsResponse,
     NodeSchema,
     SearchResponse,
     SearchResultSchema,
+    SingleFlightStatsResponse,
 )
 
 logger = logging.getLogger(__name__)
@@ -30,51 +47,43 @@ logger = logging.getLogger(__name__)
 router = Router(tags=["Graph"])
 
 
+def _parse_fields(fields: str | None) -> list[str] | None:
+    """Split a comma-separated fields param; None selects the default fields."""
+    if not fields:
+        return None
+    return [field.strip() for field in fields.split(",") if field.strip()] or None
+
+
+def _render(payload: dict[str, Any]) -> HttpResponse:
+    """
+    Return a payload already shaped like the response schema as JSON.
+
+    Skips building and validating a schema object per node/edge; the
+    route's response schema still documents the payload in OpenAPI.
+    """
+    return HttpResponse(render_json(payload), content_type="application/json")
+
+
 @router.get(
     "/task/{task_id}",
     response={200: GraphDataResponse, 404: ErrorResponse},
     summary="Get graph data for a task",
 )
-def get_task_graph(request, task_id: UUID):
+async def get_task_graph(request, task_id: UUID, fields: str | None = None):
     """
     Get graph visualization data for a specific crawl task.
 
     Returns nodes (Articles, Channels, Tags) and edges (relationships)
-    formatted for frontend graph rendering.
+    formatted for frontend graph rendering. Article nodes carry author and
+    pubTime unless fields (comma-separated article properties) selects
+    others; full node properties come from /node/{node_id}.
     """
     # Verify task exists
-    task = get_object_or_404(CrawlTask, id=task_id)
+    task = await aget_object_or_404(CrawlTask, id=task_id)
 
     try:
-        data = get_task_graph_data(str(task_id))
-
-        # Transform to schema format
-        nodes = [
-            NodeSchema(
-                id=n["id"],
-                type=n["type"],
-                label=n["label"],
-                properties=n.get("properties", {}),
-            )
-            for n in data["nodes"]
-        ]
-
-        edges = [
-            EdgeSchema(
-                source=e["source"],
-                target=e["target"],
-                type=e["type"],
-            )
-            for e in data["edges"]
-        ]
-
-        stats = GraphStatsSchema(
-            totalNodes=data["stats"]["totalNodes"],
-            totalEdges=data["stats"]["totalEdges"],
-            nodesByType=data["stats"]["nodesByType"],
-        )
-
-        return GraphDataResponse(nodes=nodes, edges=edges, stats=stats)
+        data = await aget_task_graph_data(str(task_id), fields=_parse_fields(fields))
+        return _render(data)
 
     except Exception as e:
         logger.error(f"Error fetching graph data: {e}")
@@ -91,14 +100,14 @@ def get_task_graph(request, task_id: UUID):
     response=KeywordListResponse,
     summary="Get popular keywords/tags",
 )
-def get_keywords(request, limit: int = 50, task_id: str | None = None):
+async def get_keywords(request, limit: int = 50, task_id: str | None = None):
     """
     Get popular keywords/tags ordered by article count.
 
     Optionally filter by task_id to get keywords from a specific crawl.
     """
     try:
-        keywords = get_popular_keywords(limit=limit, task_id=task_id)
+        keywords = await aget_popular_keywords(limit=limit, task_id=task_id)
 
         items = [
             KeywordSchema(
@@ -121,35 +130,106 @@ def get_keywords(request, limit: int = 50, task_id: str | None = None):
     response=SearchResponse,
     summary="Search graph nodes",
 )
-def search_graph(request, q: str, limit: int = 20):
+async def search_graph(
+    request,
+    q: str,
+    limit: int = 20,
+    mode: Literal["exact", "prefix", "fuzzy"] = "exact",
+):
     """
     Search graph nodes by text.
 
-    Matches against article titles and tag names.
+    Matches against article titles and tag names through fulltext indexes,
+    most relevant first. mode selects exact, prefix or fuzzy term matching.
     """
     if not q or len(q) < 2:
         return SearchResponse(items=[], total=0)
 
     try:
-        results = search_nodes(query_text=q, limit=limit)
-
-        items = [
-            SearchResultSchema(
-                id=r["id"],
-                type=r["type"],
-                label=r["label"],
-                properties=r.get("properties", {}),
-            )
-            for r in results
-        ]
-
-        return SearchResponse(items=items, total=len(items))
+        results = await asearch_nodes(query_text=q, limit=limit, mode=mode)
+        return _render({"items": results, "total": len(results)})
 
     except Exception as e:
         logger.error(f"Error searching nodes: {e}")
         return SearchResponse(items=[], total=0)
 
 
+@router.get(
+    "/node/{path:node_id}",
+    response={200: NodeSchema, 404: ErrorResponse},
+    summary="Get a graph node with all properties",
+)
+async def get_graph_node(request, node_id: str):
+    """
+    Get the full properties of one node of the task or media graph.
+
+    node_id is the id used in graph responses, e.g. article_<contId> or
+    content_<platform>_<contentId>.
+    """
+    from services.media_neo4j_sync import aget_media_node_detail
+
+    try:
+        node = await aget_node_detail(node_id) or await aget_media_node_detail(node_id)
+    except Exception as e:
+        logger.error(f"Error fetching graph node {node_id}: {e}")
+        node = None
+
+    if node is None:
+        return 404, ErrorResponse(error="Node not found", detail=node_id)
+
+    return NodeSchema(
+        id=node["id"],
+        type=node["type"],
+        label=node["label"],
+        properties=node["properties"],
+    )
+
+
+def _staff_auth(request) -> bool:
+    """Authenticate staff users by their Django session."""
+    user = getattr(request, "user", None)
+    return bool(user and user.is_authenticated and user.is_staff)
+
+
+@router.get(
+    "/single-flight/stats",
+    response=SingleFlightStatsResponse,
+    auth=_staff_auth,
+    summary="Get graph query coalescing counters",
+)
+def get_single_flight_stats_view(request):
+    """
+    Get the single-flight counters of the process serving the request.
+
+    Staff only, like the Neo4j metrics.
+
+    executed counts graph queries actually run (misses); coalesced and
+    remote_hits count requests that shared another request's query in this
+    process or in another process.
+    """
+    return SingleFlightStatsResponse(pid=os.getpid(), **get_single_flight_stats())
+
+
+@router.get(
+    "/metrics/neo4j",
+    response=Neo4jMetricsResponse,
+    auth=_staff_auth,
+    summary="Get Neo4j query latency metrics",
+)
+def get_neo4j_metrics_view(request):
+    """
+    Get the Neo4j query metrics of the process serving the request.
+
+    Staff only: the metrics expose query names, timings and plans.
+
+    Per named query: latency, records returned and the server's
+    result_available_after/result_consumed_after as histograms, plus the
+    most recent slow queries with redacted parameters (and PROFILE plans when
+    NEO4J_SLOW_QUERY_PROFILE is enabled).
+    """
+    return Neo4jMetricsResponse(pid=os.getpid(), **get_query_metrics())
+
+
 # ============================================================================
 # Media Graph Endpoints
 # ============================================================================
@@ -157,65 +237,57 @@ def search_graph(request, q: str, limit: int = 20):
 
 @router.get(
     "/media",
-    response=GraphDataResponse,
+    response=GraphDataResponse | ColumnarGraphResponse,
     summary="Get media graph data",
     tags=["Media Graph"],
 )
-def get_media_graph(
+@cached_graph_response("media")
+async def get_media_graph(
     request,
     platform: str | None = None,
     keyword: str | None = None,
     limit: int = 100,
+    fields: str | None = None,
+    format: Literal["default", "columnar"] = "default",
 ):
     """
     Get graph visualization data for media content.
 
     Returns nodes (Platforms, Content, Keywords) and edges (relationships)
-    formatted for frontend graph rendering.
+    formatted for frontend graph rendering. Responses are cached until the
+    next sync and support ETag revalidation.
 
     Args:
         platform: Filter by platform (bilibili, douyin, kuaishou, weibo, tieba, zhihu)
         keyword: Filter by keyword
         limit: Maximum nodes to return
+        fields: Comma-separated content properties to return (default:
+                platform, contentType, likedCount, commentCount); full node
+                properties come from /node/{node_id}
+        format: "columnar" returns parallel node arrays and edges as integer
+                index pairs into them, a much smaller payload for large graphs
     """
-    from services.media_neo4j_sync import get_media_graph_data
+    from services.media_neo4j_sync import aget_media_graph_data
 
     # Debug logging
     logger.info(f"get_media_graph called with platform={platform!r}, keyword={keyword!r}, limit={limit}")
 
     try:
-        data = get_media_graph_data(platform=platform, keyword=keyword, limit=limit)
-        logger.info(f"get_media_graph returned {len(data.get('nodes', []))} nodes, {len(data.get('edges', []))} edges")
-
-        nodes = [
-            NodeSchema(
-                id=n["id"],
-                type=n["type"],
-                label=n["label"],
-                properties=n.get("properties", {}),
-            )
-            for n in data["nodes"]
-        ]
-
-        edges = [
-            EdgeSchema(
-                source=e["source"],
-                target=e["target"],
-                type=e["type"],
-            )
-            for e in data["edges"]
-        ]
-
-        stats = GraphStatsSchema(
-            totalNodes=data["stats"]["totalNodes"],
-            totalEdges=data["stats"]["totalEdges"],
-            nodesByType=data["stats"]["nodesByType"],
+        data = await aget_media_graph_data(
+            platform=platform, keyword=keyword, limit=limit, fields=_parse_fields(fields)
         )
+        logger.info(f"get_media_graph returned {len(data.get('nodes', []))} nodes, {len(data.get('edges', []))} edges")
 
-        return GraphDataResponse(nodes=nodes, edges=edges, stats=stats)
+        if format == "columnar":
+            return _render(to_columnar(data))
+        return _render(data)
 
     except Exception as e:
         logger.error(f"Error fetching media graph data: {e}")
+        skip_response_cache(request)
+        if format == "columnar":
+            empty = {"nodes": [], "edges": [], "stats": {"totalNodes": 0, "totalEdges": 0, "nodesByType": {}}}
+            return ColumnarGraphResponse(**to_columnar(empty))
         return GraphDataResponse(
             nodes=[],
             edges=[],
@@ -229,16 +301,17 @@ def get_media_graph(
     summary="Get popular media keywords",
     tags=["Media Graph"],
 )
-def get_media_keywords(request, platform: str | None = None, limit: int = 50):
+@cached_graph_response("media_keywords")
+async def get_media_keywords(request, platform: str | None = None, limit: int = 50):
     """
     Get popular keywords from media content.
 
     Optionally filter by platform.
     """
-    from services.media_neo4j_sync import get_media_keywords as fetch_keywords
+    from services.media_neo4j_sync import aget_media_keywords
 
     try:
-        keywords = fetch_keywords(platform=platform, limit=limit)
+        keywords = await aget_media_keywords(platform=platform, limit=limit)
 
         # Use a generic format for media keywords (no tagId)
         items = [
@@ -254,6 +327,7 @@ def get_media_keywords(request, platform: str | None = None, limit: int = 50):
 
     except Exception as e:
         logger.error(f"Error fetching media keywords: {e}")
+        skip_response_cache(request)
         return KeywordListResponse(items=[], total=0)
 
 
@@ -263,19 +337,26 @@ def get_media_keywords(request, platform: str | None = None, limit: int = 50):
     summary="Search media graph keywords",
     tags=["Media Graph"],
 )
-def search_media_graph(request, q: str, limit: int = 20):
+@cached_graph_response("media_search")
+async def search_media_graph(
+    request,
+    q: str,
+    limit: int = 20,
+    mode: Literal["exact", "prefix", "fuzzy"] = "exact",
+):
     """
     Search keywords in media graph by text.
 
-    Returns matching keywords with content counts.
+    Returns matching keywords with content counts, most relevant first.
+    mode selects exact, prefix or fuzzy term matching.
     """
-    from services.media_neo4j_sync import search_media_keywords
+    from services.media_neo4j_sync import asearch_media_keywords
 
     if not q or len(q) < 2:
         return SearchResponse(items=[], total=0)
 
     try:
-        results = search_media_keywords(query_text=q, limit=limit)
+        results = await asearch_media_keywords(query_text=q, limit=limit, mode=mode)
 
         items = [
             SearchResultSchema(
@@ -283,6 +364,7 @@ def search_media_graph(request, q: str, limit: int = 20):
                 type="Keyword",
                 label=r["name"],
                 properties={"count": r["count"]},
+                score=r.get("score"),
             )
             for r in results
         ]
@@ -291,5 +373,46 @@ def search_media_graph(request, q: str, limit: int = 20):
 
     except Exception as e:
         logger.error(f"Error searching media keywords: {e}")
+        skip_response_cache(request)
         return SearchResponse(items=[], total=0)
 
+
+@router.get(
+    "/media/autocomplete",
+    response=KeywordListResponse,
+    summary="Autocomplete media keywords",
+    tags=["Media Graph"],
+)
+async def autocomplete_media_keywords(
+    request,
+    q: str,
+    limit: int = 10,
+    mode: Literal["prefix", "substring"] = "prefix",
+):
+    """
+    Complete a partially typed keyword with the most used media keywords.
+
+    Served from the Redis autocomplete index rebuilt after each media sync;
+    falls back to a prefix fulltext search until the index has been built.
+    """
+    from services.keyword_autocomplete import aautocomplete_keywords
+    from services.media_neo4j_sync import asearch_media_keywords
+
+    if not q.strip():
+        return KeywordListResponse(items=[], total=0)
+
+    try:
+        completions = await aautocomplete_keywords(q, limit=limit, mode=mode)
+        if completions is None:
+            completions = await asearch_media_keywords(query_text=q, limit=limit, mode="prefix")
+
+        items = [
+            KeywordSchema(tagId=0, name=k["name"], count=k["count"])
+            for k in completions
+        ]
+
+        return KeywordListResponse(items=items, total=len(items))
+
+    except Exception as e:
+        logger.error(f"Error autocompleting media keywords: {e}")
+        return KeywordListResponse(items=[], total=0)
@@ -0,0 +1 @@
+# Graph management commands
@@ -0,0 +1,39 @@
+"""
+Set normalized lookup keys on MediaKeyword nodes synced before keys existed.
+
+Usage:
+    python manage.py backfill_media_keyword_keys
+    python manage.py backfill_media_keyword_keys --profile 美食
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from services.media_neo4j_sync import backfill_keyword_keys, profile_keyword_lookup
+
+
+class Command(BaseCommand):
+    help = "Backfill MediaKeyword.key and optionally PROFILE an indexed keyword lookup"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=None,
+            help="Keywords updated per transaction",
+        )
+        parser.add_argument(
+            "--profile",
+            metavar="KEYWORD",
+            help="PROFILE a lookup of KEYWORD and fail unless it seeks the key index",
+        )
+
+    def handle(self, *args, **options):
+        updated = backfill_keyword_keys(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Backfilled {updated} keyword keys"))
+
+        if options["profile"]:
+            operators = profile_keyword_lookup(options["profile"])
+            self.stdout.write(" -> ".join(operators))
+            if not any(op.startswith("NodeIndexSeek") for op in operators):
+                raise CommandError("Keyword lookup does not use the media_keyword_key index")
+            self.stdout.write(self.style.SUCCESS("Keyword lookup uses an index seek"))
@@ -0,0 +1,136 @@
+"""
+Micro-benchmark graph response serialization.
+
+Compares, on synthetic media graphs, the schema path (a NodeSchema/EdgeSchema
+per node and edge, validated by GraphDataResponse and rendered with Ninja's
+JSON encoder) against rendering the service dicts with orjson, in the
+default and columnar formats. No database is needed.
+
+Usage:
+    python manage.py benchmark_graph_serialization
+    python manage.py benchmark_graph_serialization --sizes 1000 10000 50000 --repeat 5
+"""
+
+import json
+import time
+from typing import Any, Callable
+
+from django.core.management.base import BaseCommand
+from ninja.responses import NinjaJSONEncoder
+
+from apps.graph.schemas import EdgeSchema, GraphDataResponse, GraphStatsSchema, NodeSchema
+from core.renderers import render_json
+from services.graph_format import to_columnar
+
+
+def _synthetic_graph(size: int) -> dict[str, Any]:
+    """Build media graph data with about `size` nodes (contents and keywords)."""
+    keyword_count = max(1, size // 10)
+    content_count = max(1, size - keyword_count - 1)
+
+    nodes: list[dict[str, Any]] = [
+        {"id": "platform_douyin", "type": "Platform", "label": "抖音", "properties": {"name": "douyin"}}
+    ]
+    edges: list[dict[str, Any]] = []
+    for i in range(keyword_count):
+        nodes.append({
+            "id": f"keyword_关键词{i}",
+            "type": "Keyword",
+            "label": f"关键词{i}",
+            "properties": {"name": f"关键词{i}", "contentCount": i % 97},
+        })
+    for i in range(content_count):
+        content_id = f"content_douyin_{7300000000000000000 + i}"
+        nodes.append({
+            "id": content_id,
+            "type": "Content",
+            "label": f"视频标题 {i} " * 3,
+            "properties": {
+                "platform": "douyin",
+                "contentType": "video",
+                "likedCount": i * 7,
+                "commentCount": i % 500,
+            },
+        })
+        edges.append({"source": "platform_douyin", "target": content_id, "type": "HAS_CONTENT"})
+        for k in (i % keyword_count, (i * 7) % keyword_count):
+            edges.append({"source": content_id, "target": f"keyword_关键词{k}", "type": "HAS_KEYWORD"})
+
+    return {
+        "nodes": nodes,
+        "edges": edges,
+        "stats": {
+            "totalNodes": len(nodes),
+            "totalEdges": len(edges),
+            "nodesByType": {"Platform": 1, "Keyword": keyword_count, "Content": content_count},
+        },
+    }
+
+
+def _schema_path(data: dict[str, Any]) -> bytes:
+    """Serialize the way the views did before: schema objects, then Ninja's encoder."""
+    response = GraphDataResponse(
+        nodes=[
+            NodeSchema(id=n["id"], type=n["type"], label=n["label"], properties=n["properties"])
+            for n in data["nodes"]
+        ],
+        edges=[
+            EdgeSchema(source=e["source"], target=e["target"], type=e["type"])
+            for e in data["edges"]
+        ],
+        stats=GraphStatsSchema(**data["stats"]),
+    )
+    # Ninja validates the returned object against the response schema again
+    payload = GraphDataResponse.model_validate(response.model_dump()).model_dump()
+    return json.dumps(payload, cls=NinjaJSONEncoder).encode("utf-8")
+
+
+def _fast_path(data: dict[str, Any]) -> bytes:
+    return render_json(data)
+
+
+def _columnar_path(data: dict[str, Any]) -> bytes:
+    return render_json(to_columnar(data))
+
+
+class Command(BaseCommand):
+    help = "Benchmark graph response serialization paths on synthetic graphs"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            type=int,
+            nargs="+",
+            default=[1000, 10000, 50000],
+            help="Graph sizes (nodes) to benchmark",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=3,
+            help="Runs per path; the best time is reported",
+        )
+
+    def handle(self, *args, **options):
+        paths: list[tuple[str, Callable[[dict[str, Any]], bytes]]] = [
+            ("schema", _schema_path),
+            ("orjson", _fast_path),
+            ("columnar", _columnar_path),
+        ]
+
+        self.stdout.write(f"{'nodes':>8} {'path':<10} {'best ms':>10} {'KiB':>10} {'speedup':>8}")
+        for size in options["sizes"]:
+            data = _synthetic_graph(size)
+            baseline = None
+            for name, render in paths:
+                best = float("inf")
+                body = b""
+                for _ in range(max(1, options["repeat"])):
+                    started = time.perf_counter()
+                    body = render(data)
+                    best = min(best, time.perf_counter() - started)
+                baseline = baseline or best
+                self.stdout.write(
+                    f"{len(data['nodes']):>8} {name:<10} {best * 1000:>10.1f} "
+                    f"{len(body) / 1024:>10.1f} {baseline / best:>7.1f}x"
+                )
@@ -0,0 +1,75 @@
+"""
+Create Neo4j constraints and indexes used by the sync and graph services.
+
+Usage:
+    python manage.py bootstrap_neo4j_schema
+    python manage.py bootstrap_neo4j_schema --show
+    python manage.py bootstrap_neo4j_schema --profile-graph xhs
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from services.media_neo4j_sync import profile_media_graph
+from services.neo4j_schema import bootstrap_schema, get_schema_status
+
+
+class Command(BaseCommand):
+    help = "Idempotently create Neo4j constraints, range indexes and fulltext indexes"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--show",
+            action="store_true",
+            help="List existing indexes and constraints after bootstrapping",
+        )
+        parser.add_argument(
+            "--profile-graph",
+            metavar="PLATFORM",
+            help="PROFILE the media graph query for PLATFORM and fail unless it reads an index",
+        )
+        parser.add_argument(
+            "--profile-keyword",
+            metavar="KEYWORD",
+            help="Also filter the profiled media graph query by KEYWORD",
+        )
+
+    def handle(self, *args, **options):
+        report = bootstrap_schema()
+
+        for name in report["added"]:
+            self.stdout.write(self.style.SUCCESS(f"added     {name}"))
+        for name in report["existing"]:
+            self.stdout.write(f"existing  {name}")
+        for name in report["failed"]:
+            self.stdout.write(self.style.ERROR(f"failed    {name}"))
+
+        if options["show"]:
+            self.stdout.write("")
+            for index in get_schema_status():
+                labels = ",".join(index["labelsOrTypes"] or [])
+                properties = ",".join(index["properties"] or [])
+                self.stdout.write(
+                    f"{index['name']:<32} {index['type']:<9} {labels}({properties}) "
+                    f"{index['state']}"
+                )
+
+        if options["profile_graph"]:
+            operators = profile_media_graph(
+                platform=options["profile_graph"], keyword=options["profile_keyword"]
+            )
+            self.stdout.write(" -> ".join(operators))
+            if any(op.startswith(("NodeByLabelScan", "AllNodesScan")) for op in operators):
+                raise CommandError("Media graph query scans MediaContent instead of an index")
+            self.stdout.write(self.style.SUCCESS("Media graph query reads contents from an index"))
+
+        if report["failed"]:
+            raise CommandError(
+                f"{len(report['failed'])} schema object(s) failed, see log for details"
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Neo4j schema ready: {len(report['added'])} added, "
+                f"{len(report['existing'])} already present"
+            )
+        )
@@ -0,0 +1,39 @@
+"""
+Recompute maintained keyword, tag and comment counters from the graph.
+
+Usage:
+    python manage.py reconcile_keyword_counts
+    python manage.py reconcile_keyword_counts --batch-size 500
+"""
+
+from django.core.management.base import BaseCommand
+
+from services.keyword_popularity import reconcile_keyword_counts
+from services.media_neo4j_sync import SUPPORTED_PLATFORMS, reconcile_comment_counts
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute MediaKeyword/Tag contentCount, MediaContent.syncedCommentCount "
+        "and the Redis popularity sets"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Keywords updated per transaction",
+        )
+
+    def handle(self, *args, **options):
+        result = reconcile_keyword_counts(
+            list(SUPPORTED_PLATFORMS), batch_size=options["batch_size"]
+        )
+        contents = reconcile_comment_counts(list(SUPPORTED_PLATFORMS))
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Reconciled {result['keywords']} keywords, {result['tags']} tags "
+                f"and {contents} content comment counts"
+            )
+        )
@@ -42,6 +42,34 @@ class GraphDataResponse(Schema):
     stats: GraphStatsSchema
 
 
+class ColumnarNodesSchema(Schema):
+    """Parallel node arrays; types index into nodeTypes."""
+
+    ids: list[str]
+    types: list[int]
+    labels: list[str]
+    properties: list[dict[str, Any]]
+
+
+class ColumnarEdgesSchema(Schema):
+    """Parallel edge arrays; source/target index into the node arrays."""
+
+    source: list[int]
+    target: list[int]
+    types: list[int]
+
+
+class ColumnarGraphResponse(Schema):
+    """Response schema for graph data in the columnar format."""
+
+    format: str = "columnar"
+    nodeTypes: list[str]
+    edgeTypes: list[str]
+    nodes: ColumnarNodesSchema
+    edges: ColumnarEdgesSchema
+    stats: GraphStatsSchema
+
+
 class KeywordSchema(Schema):
     """Schema for a keyword/tag."""
 
@@ -64,6 +92,7 @@ class SearchResultSchema(Schema):
     type: str
     label: str
     properties: dict[str, Any] = {}
+    score: float | None = None
 
 
 class SearchResponse(Schema):
@@ -73,6 +102,62 @@ class SearchResponse(Schema):
     total: int
 
 
+class SingleFlightStatsResponse(Schema):
+    """Single-flight query coalescing counters of the serving process."""
+
+    pid: int
+    calls: int
+    executed: int
+    coalesced: int
+    remote_hits: int
+    remote_timeouts: int
+
+
+class HistogramSchema(Schema):
+    """Fixed-bucket histogram; counts has one overflow bucket past the last bound."""
+
+    count: int
+    sum: float
+    max: float
+    p50: float | None = None
+    p95: float | None = None
+    p99: float | None = None
+    bounds: list[float]
+    counts: list[int]
+
+
+class QueryMetricsSchema(Schema):
+    """Latency and result size histograms of one named Neo4j query."""
+
+    count: int
+    errors: int
+    latencyMs: HistogramSchema
+    records: HistogramSchema
+    resultAvailableAfterMs: HistogramSchema
+    resultConsumedAfterMs: HistogramSchema
+
+
+class SlowQuerySchema(Schema):
+    """A query slower than the slow-query threshold."""
+
+    name: str
+    at: float
+    latencyMs: float
+    records: int
+    parameters: dict[str, Any] = {}
+    plan: dict[str, Any] | None = None
+    dbHits: int | None = None
+
+
+class Neo4jMetricsResponse(Schema):
+    """Neo4j query metrics of the serving process."""
+
+    pid: int
+    slowQueryMs: float
+    queries: dict[str, QueryMetricsSchema]
+    slowQueries: list[SlowQuerySchema]
+
+
 class ErrorResponse(Schema):
     """Error response schema."""
 
@@ -38,6 +38,7 @@ class SyncNeo4jRequest(Schema):
 
     platform: Optional[str] = None
     limit: Optional[int] = None
+    full: bool = False  # If True, ignore watermarks and re-sync every row
     sync: bool = False  # If True, run synchronously (for testing)
 
 
@@ -56,6 +57,9 @@ class SyncStatusResponse(Schema):
     progress: int
     lastSyncTime: Optional[str] = None
     lastResult: Optional[dict] = None
+    rowsProcessed: int = 0
+    rowsTotal: int = 0
+    platforms: Optional[dict] = None
 
 
 class ErrorResponse(Schema):
@@ -103,10 +107,12 @@ def trigger_sync_neo4j(request, payload: SyncNeo4jRequest = None):
     Trigger sync of media data to Neo4j.
 
     Optionally specify a platform to sync only that platform's data.
+    Only rows changed since the last sync are written unless full=True.
     Set sync=True to run synchronously (for testing), otherwise runs as async Celery task.
     """
     from django.conf import settings
 
+    from apps.media_crawl.tasks import schedule_autocomplete_rebuild
     from services.media_neo4j_sync import SUPPORTED_PLATFORMS, sync_platform_content
 
     # Check if media crawl is enabled
@@ -119,6 +125,7 @@ def trigger_sync_neo4j(request, payload: SyncNeo4jRequest = None):
     # Validate platform if provided
     platform = payload.platform if payload else None
     limit = payload.limit if payload else None
+    full = payload.full if payload else False
     run_sync = payload.sync if payload else False
 
     if platform and platform not in SUPPORTED_PLATFORMS:
@@ -130,7 +137,8 @@ def trigger_sync_neo4j(request, payload: SyncNeo4jRequest = None):
     if run_sync:
         # Run synchronously (blocking) - useful for testing
         try:
-            result = sync_platform_content(platform=platform, limit=limit)
+            result = sync_platform_content(platform=platform, limit=limit, full=full)
+            schedule_autocomplete_rebuild(result["totals"])
             return 200, SyncNeo4jResponse(
                 task_id=None,
                 message=f"Sync completed for {'all platforms' if not platform else platform}",
@@ -145,7 +153,7 @@ def trigger_sync_neo4j(request, payload: SyncNeo4jRequest = None):
         # Trigger async Celery task
         from apps.media_crawl.tasks import sync_media_to_neo4j
 
-        task = sync_media_to_neo4j.delay(platform=platform, limit=limit)
+        task = sync_media_to_neo4j.delay(platform=platform, limit=limit, full=full)
 
         return 200, SyncNeo4jResponse(
             task_id=task.id,
@@ -164,7 +172,8 @@ def get_sync_status(request):
     """
     Get current status of media Neo4j sync operation.
 
-    Returns sync status, progress percentage, and last sync results.
+    Returns sync status, progress percentage, per-platform row progress,
+    and last sync results.
     """
     from services.media_neo4j_sync import get_sync_status as get_status
 
@@ -174,6 +183,9 @@ def get_sync_status(request):
         progress=status_data.get("progress", 0),
         lastSyncTime=status_data.get("lastSyncTime"),
         lastResult=status_data.get("lastResult"),
+        rowsProcessed=status_data.get("rowsProcessed", 0),
+        rowsTotal=status_data.get("rowsTotal", 0),
+        platforms=status_data.get("platforms"),
     )
 
 
@@ -0,0 +1,69 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('media_crawl', '0002_analysisreport'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='bilibilivideo',
+            index=models.Index(fields=['last_modify_ts'], name='bilibili_video_mts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bilibilivideocomment',
+            index=models.Index(fields=['last_modify_ts'], name='bilibili_video_comment_mts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='douyinaweme',
+            index=models.Index(fields=['last_modify_ts'], name='douyin_aweme_mts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='douyinawemecomment',
+            index=models.Index(fields=['last_modify_ts'], name='douyin_aweme_comment_mts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='kuaishouvideo',
+            index=models.Index(fields=['last_modify_ts'], name='kuaishou_video_mts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='kuaishouvideocomment',
+            index=models.Index(fields=['last_modify_ts'], name='kuaishou_video_comment_mts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tiebacomment',
+            index=models.Index(fields=['last_modify_ts'], name='tieba_comment_mts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tiebanote',
+            index=models.Index(fields=['last_modify_ts'], name='tieba_note_mts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='weibonote',
+            index=models.Index(fields=['last_modify_ts'], name='weibo_note_mts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='weibonotecomment',
+            index=models.Index(fields=['last_modify_ts'], name='weibo_note_comment_mts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='xhsnote',
+            index=models.Index(fields=['last_modify_ts'], name='xhs_note_mts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='xhsnotecomment',
+            index=models.Index(fields=['last_modify_ts'], name='xhs_note_comment_mts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='zhihucomment',
+            index=models.Index(fields=['last_modify_ts'], name='zhihu_comment_mts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='zhihucontent',
+            index=models.Index(fields=['last_modify_ts'], name='zhihu_content_mts_idx'),
+        ),
+    ]
@@ -31,6 +31,8 @@ class BilibiliVideo(TimestampMixin, models.Model):
 
     class Meta:
         db_table = "bilibili_video"
+        # Incremental media sync reads rows by last_modify_ts
+        indexes = [models.Index(fields=["last_modify_ts"], name="bilibili_video_mts_idx")]
         verbose_name = "Bilibili视频"
         verbose_name_plural = "Bilibili视频"
 
@@ -56,6 +58,8 @@ class BilibiliVideoComment(TimestampMixin, models.Model):
 
     class Meta:
         db_table = "bilibili_video_comment"
+        # Incremental media sync reads rows by last_modify_ts
+        indexes = [models.Index(fields=["last_modify_ts"], name="bilibili_video_comment_mts_idx")]
         verbose_name = "Bilibili视频评论"
         verbose_name_plural = "Bilibili视频评论"
 
@@ -35,6 +35,8 @@ class DouyinAweme(TimestampMixin, models.Model):
 
     class Meta:
         db_table = "douyin_aweme"
+        # Incremental media sync reads rows by last_modify_ts
+        indexes = [models.Index(fields=["last_modify_ts"], name="douyin_aweme_mts_idx")]
         verbose_name = "抖音作品"
         verbose_name_plural = "抖音作品"
 
@@ -64,6 +66,8 @@ class DouyinAwemeComment(TimestampMixin, models.Model):
 
     class Meta:
         db_table = "douyin_aweme_comment"
+        # Incremental media sync reads rows by last_modify_ts
+        indexes = [models.Index(fields=["last_modify_ts"], name="douyin_aweme_comment_mts_idx")]
         verbose_name = "抖音作品评论"
         verbose_name_plural = "抖音作品评论"
 
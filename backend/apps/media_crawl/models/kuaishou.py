@@ -26,6 +26,8 @@ class KuaishouVideo(TimestampMixin, models.Model):
 
     class Meta:
         db_table = "kuaishou_video"
+        # Incremental media sync reads rows by last_modify_ts
+        indexes = [models.Index(fields=["last_modify_ts"], name="kuaishou_video_mts_idx")]
         verbose_name = "快手视频"
         verbose_name_plural = "快手视频"
 
@@ -47,6 +49,8 @@ class KuaishouVideoComment(TimestampMixin, models.Model):
 
     class Meta:
         db_table = "kuaishou_video_comment"
+        # Incremental media sync reads rows by last_modify_ts
+        indexes = [models.Index(fields=["last_modify_ts"], name="kuaishou_video_comment_mts_idx")]
         verbose_name = "快手视频评论"
         verbose_name_plural = "快手视频评论"
 
@@ -27,6 +27,8 @@ class TiebaNote(TimestampMixin, models.Model):
 
     class Meta:
         db_table = "tieba_note"
+        # Incremental media sync reads rows by last_modify_ts
+        indexes = [models.Index(fields=["last_modify_ts"], name="tieba_note_mts_idx")]
         verbose_name = "贴吧帖子"
         verbose_name_plural = "贴吧帖子"
 
@@ -54,6 +56,8 @@ class TiebaComment(TimestampMixin, models.Model):
 
     class Meta:
         db_table = "tieba_comment"
+        # Incremental media sync reads rows by last_modify_ts
+        indexes = [models.Index(fields=["last_modify_ts"], name="tieba_comment_mts_idx")]
         verbose_name = "贴吧评论"
         verbose_name_plural = "贴吧评论"
 
@@ -27,6 +27,8 @@ class WeiboNote(TimestampMixin, models.Model):
 
     class Meta:
         db_table = "weibo_note"
+        # Incremental media sync reads rows by last_modify_ts
+        indexes = [models.Index(fields=["last_modify_ts"], name="weibo_note_mts_idx")]
         verbose_name = "微博帖子"
         verbose_name_plural = "微博帖子"
 
@@ -54,6 +56,8 @@ class WeiboNoteComment(TimestampMixin, models.Model):
 
     class Meta:
         db_table = "weibo_note_comment"
+        # Incremental media sync reads rows by last_modify_ts
+        indexes = [models.Index(fields=["last_modify_ts"], name="weibo_note_comment_mts_idx")]
         verbose_name = "微博帖子评论"
         verbose_name_plural = "微博帖子评论"
 
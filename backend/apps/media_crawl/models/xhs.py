@@ -55,6 +55,8 @@ class XhsNote(TimestampMixin, models.Model):
 
     class Meta:
         db_table = "xhs_note"
+        # Incremental media sync reads rows by last_modify_ts
+        indexes = [models.Index(fields=["last_modify_ts"], name="xhs_note_mts_idx")]
         verbose_name = "小红书笔记"
         verbose_name_plural = "小红书笔记"
 
@@ -80,6 +82,8 @@ class XhsNoteComment(TimestampMixin, models.Model):
 
     class Meta:
         db_table = "xhs_note_comment"
+        # Incremental media sync reads rows by last_modify_ts
+        indexes = [models.Index(fields=["last_modify_ts"], name="xhs_note_comment_mts_idx")]
         verbose_name = "小红书笔记评论"
         verbose_name_plural = "小红书笔记评论"
 
@@ -29,6 +29,8 @@ class ZhihuContent(TimestampMixin, models.Model):
 
     class Meta:
         db_table = "zhihu_content"
+        # Incremental media sync reads rows by last_modify_ts
+        indexes = [models.Index(fields=["last_modify_ts"], name="zhihu_content_mts_idx")]
         verbose_name = "知乎内容"
         verbose_name_plural = "知乎内容"
 
@@ -56,6 +58,8 @@ class ZhihuComment(TimestampMixin, models.Model):
 
     class Meta:
         db_table = "zhihu_comment"
+        # Incremental media sync reads rows by last_modify_ts
+        indexes = [models.Index(fields=["last_modify_ts"], name="zhihu_comment_mts_idx")]
         verbose_name = "知乎评论"
         verbose_name_plural = "知乎评论"
 
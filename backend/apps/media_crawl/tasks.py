@@ -7,23 +7,94 @@ Provides async task execution for syncing media data to Neo4j.
 import logging
 from typing import Any
 
-from celery import shared_task
+from celery import chord, group, shared_task
+from django.conf import settings
+from django.core.cache import cache
 
+from core.exceptions import SyncError
+from services.keyword_autocomplete import autocomplete_needs_rebuild, rebuild_autocomplete_index
 from services.media_neo4j_sync import (
     SUPPORTED_PLATFORMS,
+    SYNC_COUNTER_KEYS,
+    clear_sync_run,
+    get_sync_concurrency,
+    get_sync_run,
     get_sync_status,
+    reset_sync_progress,
+    set_sync_run,
     sync_platform_content,
     update_sync_status,
 )
 
 logger = logging.getLogger(__name__)
 
+# Cache key set while a keyword autocomplete rebuild is scheduled but not started
+AUTOCOMPLETE_REBUILD_PENDING_KEY = "media_keyword_autocomplete_rebuild_pending"
+
+
+def _sync_platforms(
+    task_id: str,
+    platforms: list[str],
+    limit: int | None,
+    full: bool,
+) -> dict[str, Any]:
+    """
+    Sync platforms one after another, remembering finished ones per task.
+
+    Platforms already completed by an earlier attempt of the same task are
+    skipped, so a retry only re-runs the platforms that failed.
+
+    Args:
+        task_id: Id of the Celery task running the sync
+        platforms: Platforms to sync
+        limit: Maximum content items per platform
+        full: Re-sync every row instead of only changed rows
+
+    Returns:
+        Platform results keyed by platform name
+
+    Raises:
+        SyncError: If any platform failed
+    """
+    completed = get_sync_run(task_id)
+
+    for i, p in enumerate(platforms):
+        if p in completed:
+            logger.info(f"Skipping platform {p}: already synced by this task")
+            continue
+
+        logger.info(f"Syncing platform {i + 1}/{len(platforms)}: {p}")
+        platform_result = sync_platform_content(platform=p, limit=limit, full=full)
+        p_result = platform_result["platforms"].get(p, {})
+        if "error" not in p_result:
+            completed[p] = p_result
+            set_sync_run(task_id, completed)
+
+    failed = [p for p in platforms if p not in completed]
+    if failed:
+        raise SyncError(f"Sync failed for platforms: {', '.join(failed)}")
+    return completed
+
+
+def _merge_results(task_id: str, platform_results: dict[str, Any]) -> dict[str, Any]:
+    """Build the task result with totals summed across platforms."""
+    results: dict[str, Any] = {
+        "task_id": task_id,
+        "platforms": platform_results,
+        "totals": {key: 0 for key in SYNC_COUNTER_KEYS},
+    }
+    for p_result in platform_results.values():
+        for key in SYNC_COUNTER_KEYS:
+            results["totals"][key] += p_result.get(key, 0)
+    return results
+
 
 @shared_task(bind=True, max_retries=3, default_retry_delay=60)
 def sync_media_to_neo4j(
     self,
     platform: str | None = None,
     limit: int | None = None,
+    full: bool = False,
 ) -> dict[str, Any]:
     """
     Sync media data from MySQL to Neo4j.
@@ -31,13 +102,19 @@ def sync_media_to_neo4j(
     This Celery task syncs media content (videos, notes, posts) and comments
     to Neo4j as graph nodes and relationships.
 
+    A single platform is synced inline. An all-platform sync fans out into a
+    chord of platform subtasks (MEDIA_NEO4J_SYNC_CONCURRENCY of them, one per
+    platform by default) whose results are merged by merge_media_sync_results.
+
     Args:
         platform: Platform to sync (bilibili, douyin, kuaishou, weibo, tieba, zhihu)
                   If None, syncs all platforms.
         limit: Maximum content items per platform
+        full: Re-sync every row instead of only rows changed since the last sync
 
     Returns:
-        Dictionary with sync results
+        Dictionary with sync results, or the dispatched subtasks for an
+        all-platform sync
     """
     task_id = self.request.id or "unknown"
     logger.info(f"Starting media Neo4j sync task: {task_id}")
@@ -48,44 +125,29 @@ def sync_media_to_neo4j(
         logger.error(error_msg)
         return {"error": error_msg, "task_id": task_id}
 
+    platforms_to_sync = [platform] if platform else list(SUPPORTED_PLATFORMS)
+    if not self.request.retries:
+        reset_sync_progress(platforms_to_sync)
+
     # Update status to running
     update_sync_status("running", progress=0)
 
+    if not platform:
+        concurrency = get_sync_concurrency(len(platforms_to_sync))
+        lanes = [platforms_to_sync[i::concurrency] for i in range(concurrency)]
+        chord(
+            group(sync_media_platforms.s(lane, limit=limit, full=full) for lane in lanes)
+        )(merge_media_sync_results.s(task_id=task_id))
+
+        logger.info(f"Dispatched media Neo4j sync in {concurrency} subtasks: {lanes}")
+        return {"task_id": task_id, "status": "dispatched", "subtasks": lanes}
+
     try:
-        # Calculate total platforms for progress
-        platforms_to_sync = [platform] if platform else SUPPORTED_PLATFORMS
-        total_platforms = len(platforms_to_sync)
-
-        results: dict[str, Any] = {
-            "task_id": task_id,
-            "platforms": {},
-            "totals": {
-                "content_synced": 0,
-                "keywords_synced": 0,
-                "comments_synced": 0,
-            },
-        }
-
-        for i, p in enumerate(platforms_to_sync):
-            logger.info(f"Syncing platform {i + 1}/{total_platforms}: {p}")
-
-            # Update progress
-            progress = int((i / total_platforms) * 100)
-            update_sync_status("running", progress=progress)
-
-            # Sync this platform
-            platform_result = sync_platform_content(platform=p, limit=limit)
-
-            # Aggregate results
-            if "platforms" in platform_result:
-                results["platforms"].update(platform_result["platforms"])
-                for key in ["content_synced", "keywords_synced", "comments_synced"]:
-                    results["totals"][key] += platform_result["totals"].get(key, 0)
-            else:
-                # Single platform result
-                results["platforms"][p] = platform_result.get("platforms", {}).get(p, {})
+        results = _merge_results(task_id, _sync_platforms(task_id, platforms_to_sync, limit, full))
 
         # Update status to idle with results
+        clear_sync_run(task_id)
+        schedule_autocomplete_rebuild(results["totals"])
         update_sync_status("idle", progress=100, last_result=results)
 
         logger.info(f"Media Neo4j sync completed: {results['totals']}")
@@ -99,9 +161,127 @@ def sync_media_to_neo4j(
         if self.request.retries < self.max_retries:
             raise self.retry(exc=e)
 
+        clear_sync_run(task_id)
         return {"error": str(e), "task_id": task_id}
 
 
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def sync_media_platforms(
+    self,
+    platforms: list[str],
+    limit: int | None = None,
+    full: bool = False,
+) -> dict[str, Any]:
+    """
+    Sync a subset of platforms as one subtask of an all-platform sync.
+
+    Platforms touch disjoint MediaContent nodes, so subtasks only contend on
+    shared MediaKeyword nodes, which the batch writer locks in a stable order.
+    Once retries are exhausted the failure is returned instead of raised, so
+    the chord callback still runs for the other platforms.
+
+    Args:
+        platforms: Platforms to sync, in order
+        limit: Maximum content items per platform
+        full: Re-sync every row instead of only changed rows
+
+    Returns:
+        Platform results keyed by platform name
+    """
+    task_id = self.request.id or "unknown"
+
+    try:
+        completed = _sync_platforms(task_id, platforms, limit, full)
+    except Exception as e:
+        logger.exception(f"Media Neo4j sync subtask {platforms} failed: {e}")
+
+        # Retry on transient errors
+        if self.request.retries < self.max_retries:
+            raise self.retry(exc=e)
+
+        completed = get_sync_run(task_id)
+        completed.update({p: {"error": str(e)} for p in platforms if p not in completed})
+
+    clear_sync_run(task_id)
+    return completed
+
+
+@shared_task
+def merge_media_sync_results(
+    lane_results: list[dict[str, Any]],
+    task_id: str,
+) -> dict[str, Any]:
+    """
+    Chord callback merging the platform subtask results of a sync.
+
+    Args:
+        lane_results: Platform results returned by each subtask
+        task_id: Id of the dispatching sync task
+
+    Returns:
+        Dictionary with sync results and totals across all platforms
+    """
+    platform_results: dict[str, Any] = {}
+    for lane in lane_results:
+        platform_results.update(lane)
+
+    results = _merge_results(task_id, platform_results)
+    failed = [p for p, r in platform_results.items() if "error" in r]
+    if failed:
+        results["error"] = f"Sync failed for platforms: {', '.join(failed)}"
+
+    schedule_autocomplete_rebuild(results["totals"])
+    update_sync_status("idle", progress=100, last_result=results)
+
+    logger.info(f"Media Neo4j sync completed: {results['totals']}")
+    return results
+
+
+def schedule_autocomplete_rebuild(totals: dict[str, int]) -> None:
+    """
+    Schedule a keyword autocomplete rebuild if a sync left the index behind.
+
+    The rebuild runs as its own task KEYWORD_AUTOCOMPLETE_REBUILD_DELAY
+    seconds later, and syncs finishing before it starts share it, so a burst
+    of syncs costs one rebuild and no sync or request waits for it. Failures
+    are logged but never fail the sync itself.
+
+    Args:
+        totals: Sync totals of the finished run
+    """
+    if not autocomplete_needs_rebuild(totals):
+        return
+
+    delay = int(getattr(settings, "KEYWORD_AUTOCOMPLETE_REBUILD_DELAY", 60))
+    try:
+        # Expires on its own if the scheduled task is lost
+        if not cache.add(AUTOCOMPLETE_REBUILD_PENDING_KEY, True, timeout=delay + 600):
+            return
+        rebuild_keyword_autocomplete.apply_async(countdown=delay)
+    except Exception as e:
+        logger.error(f"Failed to schedule keyword autocomplete rebuild: {e}")
+        cache.delete(AUTOCOMPLETE_REBUILD_PENDING_KEY)
+
+
+@shared_task
+def rebuild_keyword_autocomplete() -> dict[str, Any]:
+    """
+    Rebuild the keyword autocomplete index.
+
+    The pending flag is cleared first, so a sync finishing during the
+    rebuild schedules another one that includes its keywords.
+
+    Returns:
+        Rebuild summary, or the error
+    """
+    cache.delete(AUTOCOMPLETE_REBUILD_PENDING_KEY)
+    try:
+        return rebuild_autocomplete_index()
+    except Exception as e:
+        logger.exception(f"Keyword autocomplete rebuild failed: {e}")
+        return {"error": str(e)}
+
+
 @shared_task
 def get_media_sync_status() -> dict[str, Any]:
     """
@@ -15,3 +15,8 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.development")
 
 application = get_asgi_application()
 
+# Async graph views may hold a native async Neo4j driver on the server's loop
+from services.neo4j_client import enable_async_driver  # noqa: E402
+
+enable_async_driver()
+
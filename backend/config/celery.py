@@ -1,6 +1,7 @@
 import os
 
 from celery import Celery
+from celery.signals import worker_process_init
 
 # Set the default Django settings module for the 'celery' program.
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.development")
@@ -15,6 +16,14 @@ app.config_from_object("django.conf:settings", namespace="CELERY")
 app.autodiscover_tasks()
 
 
+@worker_process_init.connect
+def reset_neo4j_after_fork(**kwargs):
+    """Give each prefork pool process its own Neo4j connections."""
+    from services.neo4j_client import reset_neo4j_clients_after_fork
+
+    reset_neo4j_clients_after_fork()
+
+
 @app.task(bind=True, ignore_result=True)
 def debug_task(self):
     print(f"Request: {self.request!r}")
@@ -0,0 +1,13 @@
+"""
+Gunicorn configuration.
+
+Usage:
+    gunicorn --config config/gunicorn.conf.py config.asgi:application
+"""
+
+
+def post_fork(server, worker):
+    """Give each worker its own Neo4j connections, even with preload_app."""
+    from services.neo4j_client import reset_neo4j_clients_after_fork
+
+    reset_neo4j_clients_after_fork()
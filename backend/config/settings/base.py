@@ -125,6 +125,16 @@ STATIC_ROOT = BASE_DIR / "staticfiles"
 # https://docs.djangoproject.com/en/5.0/ref/settings/#default-auto-field
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
+
+# Cache (shared by web and Celery workers for sync status and watermarks)
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": REDIS_URL,
+    }
+}
+
 # Celery Configuration
 CELERY_BROKER_URL = os.environ.get("CELERY_BROKER_URL", "redis://localhost:6379/0")
 CELERY_RESULT_BACKEND = os.environ.get(
@@ -139,6 +149,68 @@ CELERY_TIMEZONE = TIME_ZONE
 NEO4J_URI = os.environ.get("NEO4J_URI", "bolt://localhost:7687")
 NEO4J_USER = os.environ.get("NEO4J_USER", "neo4j")
 NEO4J_PASSWORD = os.environ.get("NEO4J_PASSWORD", "password123")
+# Seconds a managed transaction keeps retrying transient errors (e.g. deadlocks)
+NEO4J_MAX_TRANSACTION_RETRY_TIME = float(
+    os.environ.get("NEO4J_MAX_TRANSACTION_RETRY_TIME", "30")
+)
+# Connection pool per process and driver
+NEO4J_MAX_CONNECTION_POOL_SIZE = int(os.environ.get("NEO4J_MAX_CONNECTION_POOL_SIZE", "50"))
+# Seconds to wait for a free pooled connection before failing
+NEO4J_CONNECTION_ACQUISITION_TIMEOUT = float(
+    os.environ.get("NEO4J_CONNECTION_ACQUISITION_TIMEOUT", "60")
+)
+# Seconds after which pooled connections are replaced
+NEO4J_MAX_CONNECTION_LIFETIME = float(os.environ.get("NEO4J_MAX_CONNECTION_LIFETIME", "3600"))
+# Records pulled from the server per batch when streaming graph query results
+NEO4J_FETCH_SIZE = int(os.environ.get("NEO4J_FETCH_SIZE", "1000"))
+# Seconds published write bookmarks stay in the cache, and seconds each
+# process reuses the bookmarks it read before reading them again
+NEO4J_BOOKMARKS_TIMEOUT = int(os.environ.get("NEO4J_BOOKMARKS_TIMEOUT", "3600"))
+NEO4J_BOOKMARKS_LOCAL_TTL = float(os.environ.get("NEO4J_BOOKMARKS_LOCAL_TTL", "1"))
+# Per-query latency histograms, and the latency above which a query is logged
+# as slow (with parameters, and a PROFILE plan of read queries if enabled,
+# at most once per query per interval in seconds)
+NEO4J_QUERY_METRICS = os.environ.get(
+    "NEO4J_QUERY_METRICS", "True"
+).lower() in ("true", "1", "yes")
+NEO4J_SLOW_QUERY_MS = float(os.environ.get("NEO4J_SLOW_QUERY_MS", "500"))
+NEO4J_SLOW_QUERY_PROFILE = os.environ.get(
+    "NEO4J_SLOW_QUERY_PROFILE", "False"
+).lower() in ("true", "1", "yes")
+NEO4J_SLOW_QUERY_PROFILE_INTERVAL = float(
+    os.environ.get("NEO4J_SLOW_QUERY_PROFILE_INTERVAL", "300")
+)
+# CrawlItems written per transaction by the ThePaper article sync
+NEO4J_SYNC_BATCH_SIZE = int(os.environ.get("NEO4J_SYNC_BATCH_SIZE", "500"))
+
+# Media Neo4j Sync Configuration
+MEDIA_NEO4J_SYNC_BATCH_SIZE = int(os.environ.get("MEDIA_NEO4J_SYNC_BATCH_SIZE", "500"))
+MEDIA_NEO4J_SYNC_COMMENTS_PER_CONTENT = int(
+    os.environ.get("MEDIA_NEO4J_SYNC_COMMENTS_PER_CONTENT", "50")
+)
+# Comment ranking within each content: "likes" or "time"
+MEDIA_NEO4J_SYNC_COMMENT_ORDER = os.environ.get("MEDIA_NEO4J_SYNC_COMMENT_ORDER", "likes")
+# Platform subtasks run in parallel by an all-platform sync (0 = one per platform)
+MEDIA_NEO4J_SYNC_CONCURRENCY = int(os.environ.get("MEDIA_NEO4J_SYNC_CONCURRENCY", "0"))
+# Seconds a platform sync lock outlives its last committed chunk (a crashed run's lock expires)
+MEDIA_NEO4J_SYNC_LOCK_TIMEOUT = int(os.environ.get("MEDIA_NEO4J_SYNC_LOCK_TIMEOUT", "1800"))
+# Seconds a cached graph API response lives; syncs invalidate them earlier
+GRAPH_RESPONSE_CACHE_TIMEOUT = int(os.environ.get("GRAPH_RESPONSE_CACHE_TIMEOUT", "86400"))
+# Completions kept per fragment and longest fragment in the keyword autocomplete index
+KEYWORD_AUTOCOMPLETE_SIZE = int(os.environ.get("KEYWORD_AUTOCOMPLETE_SIZE", "50"))
+KEYWORD_AUTOCOMPLETE_MAX_FRAGMENT = int(
+    os.environ.get("KEYWORD_AUTOCOMPLETE_MAX_FRAGMENT", "12")
+)
+# Seconds after a sync before the autocomplete rebuild it scheduled runs (syncs in between share it)
+KEYWORD_AUTOCOMPLETE_REBUILD_DELAY = int(
+    os.environ.get("KEYWORD_AUTOCOMPLETE_REBUILD_DELAY", "60")
+)
+# Coalesce identical in-flight graph queries across processes via Redis, and
+# how long a follower waits for another process's result before querying itself
+GRAPH_SINGLE_FLIGHT_DISTRIBUTED = os.environ.get(
+    "GRAPH_SINGLE_FLIGHT_DISTRIBUTED", "False"
+).lower() in ("true", "1", "yes")
+GRAPH_SINGLE_FLIGHT_TIMEOUT = float(os.environ.get("GRAPH_SINGLE_FLIGHT_TIMEOUT", "30"))
 
 # Crawler Configuration
 CRAWL_REQUEST_DELAY = float(os.environ.get("CRAWL_REQUEST_DELAY", "1.0"))
@@ -20,3 +20,8 @@ class Neo4jConnectionError(ThePaperGraphError):
 
     pass
 
+
+class SyncError(ThePaperGraphError):
+    """Exception raised when a Neo4j sync run does not complete."""
+
+    pass
@@ -0,0 +1,32 @@
+"""
+JSON rendering for graph responses.
+
+Graph payloads are rendered with orjson, which serializes the nested dicts
+and lists in native code. Dates and times, and types orjson does not know
+(Decimal, pydantic URLs, enums, ...), go through Ninja's JSON encoder, and
+non-string keys are stringified, so output matches the default renderer.
+"""
+
+from typing import Any
+
+import orjson
+from ninja.responses import NinjaJSONEncoder
+
+_fallback_encoder = NinjaJSONEncoder()
+
+# Dates and times are left to the fallback encoder, which formats them like
+# DjangoJSONEncoder (milliseconds, "Z" for UTC)
+_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+def _default(value: Any) -> Any:
+    """Serialize values orjson does not support natively."""
+    if hasattr(value, "iso_format"):
+        # neo4j.time types
+        return value.iso_format()
+    return _fallback_encoder.default(value)
+
+
+def render_json(payload: Any) -> bytes:
+    """Render a payload to JSON bytes."""
+    return orjson.dumps(payload, default=_default, option=_OPTIONS)
@@ -0,0 +1,282 @@
+"""
+Graph response cache service.
+
+Caches rendered graph API responses in Redis, keyed on endpoint and query
+params plus a graph "generation" counter. Every sync that writes to the
+media graph bumps the generation, so cached responses of older generations
+are never served again and simply expire. Responses carry an ETag derived
+from the same key, so clients revalidating with If-None-Match get a 304
+without the response being rebuilt or even read from the cache. Clients
+accepting gzip get a gzip-encoded body, compressed once and cached too; it
+is a different representation, so its ETag carries a "-gz" suffix.
+
+The generation counter starts at a random epoch rather than 1, so when it
+is flushed or evicted and starts over, it does not repeat the generations
+(and ETags) handed out before.
+"""
+
+import gzip
+import hashlib
+import inspect
+import json
+import logging
+import re
+import secrets
+from functools import wraps
+from typing import Any, Callable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+
+from core.renderers import render_json
+
+logger = logging.getLogger(__name__)
+
+# Cache key of the media graph generation counter
+GRAPH_GENERATION_CACHE_KEY = "media_graph_generation"
+
+# Cache key prefix of rendered responses
+GRAPH_RESPONSE_CACHE_KEY = "graph_response:{endpoint}:{generation}:{digest}"
+
+# Request attribute set by views that must not cache the current response
+_SKIP_CACHE_ATTR = "_graph_cache_skip"
+
+# Bodies smaller than this are not worth compressing
+GZIP_MIN_SIZE = 1024
+
+_ACCEPTS_GZIP = re.compile(r"\bgzip\b")
+
+
+def _new_epoch() -> int:
+    """Pick a random first generation for a counter that is (re)started."""
+    return secrets.randbits(48)
+
+
+def get_graph_generation() -> int:
+    """Get the current media graph generation."""
+    generation = cache.get(GRAPH_GENERATION_CACHE_KEY)
+    if generation is None:
+        # Only the first process to add its epoch wins; everyone reads that one
+        epoch = _new_epoch()
+        cache.add(GRAPH_GENERATION_CACHE_KEY, epoch, timeout=None)
+        generation = cache.get(GRAPH_GENERATION_CACHE_KEY, epoch)
+    return generation
+
+
+async def aget_graph_generation() -> int:
+    """Async variant of get_graph_generation."""
+    generation = await cache.aget(GRAPH_GENERATION_CACHE_KEY)
+    if generation is None:
+        epoch = _new_epoch()
+        await cache.aadd(GRAPH_GENERATION_CACHE_KEY, epoch, timeout=None)
+        generation = await cache.aget(GRAPH_GENERATION_CACHE_KEY, epoch)
+    return generation
+
+
+def bump_graph_generation() -> int:
+    """
+    Invalidate all cached graph responses by starting a new generation.
+
+    Returns:
+        The new generation
+    """
+    try:
+        generation = cache.incr(GRAPH_GENERATION_CACHE_KEY)
+    except ValueError:
+        # Counter missing (first sync, flushed or evicted): start a new epoch
+        cache.add(GRAPH_GENERATION_CACHE_KEY, _new_epoch(), timeout=None)
+        generation = cache.incr(GRAPH_GENERATION_CACHE_KEY)
+
+    logger.info(f"Media graph generation bumped to {generation}")
+    return generation
+
+
+def skip_response_cache(request) -> None:
+    """Mark the current response as uncacheable (e.g. an error fallback)."""
+    setattr(request, _SKIP_CACHE_ATTR, True)
+
+
+def _get_response_timeout() -> int:
+    """Get how long cached responses live (bounds memory of old generations)."""
+    return int(getattr(settings, "GRAPH_RESPONSE_CACHE_TIMEOUT", 86400))
+
+
+def _gzip_etag(etag: str) -> str:
+    """Get the ETag of the gzip-encoded representation."""
+    return f'{etag[:-1]}-gz"'
+
+
+def _matching_etag(request, etag: str) -> str | None:
+    """
+    Find the ETag in the request's If-None-Match header, if any.
+
+    The gzip ETag only matches while the client still accepts gzip, so a
+    client that stopped accepting it gets the identity body instead of a 304.
+
+    Returns:
+        The matched ETag (identity or gzip), or None
+    """
+    header = request.headers.get("If-None-Match", "")
+    if not header:
+        return None
+    if header.strip() == "*":
+        return etag
+
+    # If-None-Match uses weak comparison (proxies may weaken the ETag)
+    tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    if etag in tags:
+        return etag
+    gzip_etag = _gzip_etag(etag)
+    if gzip_etag in tags and _accepts_gzip(request):
+        return gzip_etag
+    return None
+
+
+def _serialize(result: Any) -> bytes:
+    """Render a view result to JSON bytes."""
+    if isinstance(result, HttpResponse):
+        # Views may render their own body (e.g. the columnar format)
+        return result.content
+    if hasattr(result, "model_dump"):
+        result = result.model_dump()
+    return render_json(result)
+
+
+def _accepts_gzip(request) -> bool:
+    """Check whether the client accepts a gzip-encoded response."""
+    return bool(_ACCEPTS_GZIP.search(request.headers.get("Accept-Encoding", "")))
+
+
+def _json_response(body: bytes, etag: str, encoding: str | None = None) -> HttpResponse:
+    """Build a JSON response for a rendered (optionally encoded) body."""
+    response = HttpResponse(body, content_type="application/json")
+    response["ETag"] = etag
+    if encoding:
+        response["Content-Encoding"] = encoding
+    patch_vary_headers(response, ("Accept-Encoding",))
+    return response
+
+
+def _gzip_wanted(request, body: bytes) -> bool:
+    """Check whether a body should be sent gzip-encoded."""
+    return len(body) >= GZIP_MIN_SIZE and _accepts_gzip(request)
+
+
+def _compress(body: bytes) -> bytes:
+    """Gzip a body deterministically (no timestamp), so it caches cleanly."""
+    return gzip.compress(body, compresslevel=6, mtime=0)
+
+
+def _encoded_response(request, key: str, body: bytes, etag: str) -> HttpResponse:
+    """Build the response, gzip-encoded if the client accepts it."""
+    if not _gzip_wanted(request, body):
+        return _json_response(body, etag)
+
+    gzip_key = f"{key}:gzip"
+    compressed = cache.get(gzip_key)
+    if compressed is None:
+        compressed = _compress(body)
+        cache.set(gzip_key, compressed, timeout=_get_response_timeout())
+    return _json_response(compressed, _gzip_etag(etag), encoding="gzip")
+
+
+async def _aencoded_response(request, key: str, body: bytes, etag: str) -> HttpResponse:
+    """Async variant of _encoded_response."""
+    if not _gzip_wanted(request, body):
+        return _json_response(body, etag)
+
+    gzip_key = f"{key}:gzip"
+    compressed = await cache.aget(gzip_key)
+    if compressed is None:
+        compressed = _compress(body)
+        await cache.aset(gzip_key, compressed, timeout=_get_response_timeout())
+    return _json_response(compressed, _gzip_etag(etag), encoding="gzip")
+
+
+def _response_key(endpoint: str, generation: int, kwargs: dict[str, Any]) -> tuple[str, str]:
+    """Get the cache key and ETag of a response."""
+    params = json.dumps(kwargs, sort_keys=True, default=str)
+    digest = hashlib.blake2b(params.encode("utf-8"), digest_size=12).hexdigest()
+    key = GRAPH_RESPONSE_CACHE_KEY.format(endpoint=endpoint, generation=generation, digest=digest)
+    return key, f'"{endpoint}-{generation}-{digest}"'
+
+
+def _not_modified(etag: str) -> HttpResponseNotModified:
+    """Build a 304 response for a matching ETag."""
+    response = HttpResponseNotModified()
+    response["ETag"] = etag
+    patch_vary_headers(response, ("Accept-Encoding",))
+    return response
+
+
+def cached_graph_response(endpoint: str) -> Callable:
+    """
+    Serve a graph view through the generation-versioned response cache.
+
+    The decorated view is only called on a cache miss. Its result (a
+    schema, or an HttpResponse with a pre-rendered JSON body) is rendered
+    once, stored and returned as JSON with an ETag. Views that
+    fall back to an empty result on errors call skip_response_cache so the
+    fallback is returned but not cached. Both sync and async views are
+    supported; async views use the cache's async API.
+
+    Args:
+        endpoint: Name of the endpoint used in cache keys
+
+    Usage:
+        @router.get("/media", response=GraphDataResponse)
+        @cached_graph_response("media")
+        async def get_media_graph(request, platform: str | None = None):
+            ...
+    """
+
+    def decorator(view_func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(view_func):
+
+            @wraps(view_func)
+            async def async_wrapper(request, *args, **kwargs):
+                generation = await aget_graph_generation()
+                key, etag = _response_key(endpoint, generation, kwargs)
+                matched = _matching_etag(request, etag)
+                if matched:
+                    return _not_modified(matched)
+
+                body = await cache.aget(key)
+                if body is not None:
+                    return await _aencoded_response(request, key, body, etag)
+
+                result = await view_func(request, *args, **kwargs)
+                if getattr(request, _SKIP_CACHE_ATTR, False):
+                    return result
+
+                body = _serialize(result)
+                await cache.aset(key, body, timeout=_get_response_timeout())
+                return await _aencoded_response(request, key, body, etag)
+
+            return async_wrapper
+
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            generation = get_graph_generation()
+            key, etag = _response_key(endpoint, generation, kwargs)
+            matched = _matching_etag(request, etag)
+            if matched:
+                return _not_modified(matched)
+
+            body = cache.get(key)
+            if body is not None:
+                return _encoded_response(request, key, body, etag)
+
+            result = view_func(request, *args, **kwargs)
+            if getattr(request, _SKIP_CACHE_ATTR, False):
+                return result
+
+            body = _serialize(result)
+            cache.set(key, body, timeout=_get_response_timeout())
+            return _encoded_response(request, key, body, etag)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,72 @@
+"""
+Graph response formats.
+
+The columnar format encodes a graph as parallel arrays instead of a list of
+node and edge objects: node ids, type indexes, labels and properties, and
+edges as integer index pairs into the node arrays. Node ids are sent once
+instead of being repeated in every edge, and type names are listed once.
+"""
+
+from typing import Any
+
+# Supported graph response formats
+GRAPH_FORMATS = ("default", "columnar")
+
+
+def to_columnar(data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Convert graph data (nodes, edges, stats) to the columnar format.
+
+    Edges whose endpoints are not in the node list are dropped.
+
+    Args:
+        data: Graph data as returned by the graph services
+
+    Returns:
+        Columnar graph: nodeTypes/edgeTypes name tables, node arrays, edge
+        index arrays and the original stats
+    """
+    node_types: dict[str, int] = {}
+    edge_types: dict[str, int] = {}
+    node_index: dict[str, int] = {}
+
+    ids: list[str] = []
+    types: list[int] = []
+    labels: list[str] = []
+    properties: list[dict[str, Any]] = []
+    for node in data["nodes"]:
+        node_index[node["id"]] = len(ids)
+        ids.append(node["id"])
+        types.append(node_types.setdefault(node["type"], len(node_types)))
+        labels.append(node["label"])
+        properties.append(node.get("properties", {}))
+
+    sources: list[int] = []
+    targets: list[int] = []
+    edge_type_ids: list[int] = []
+    for edge in data["edges"]:
+        source = node_index.get(edge["source"])
+        target = node_index.get(edge["target"])
+        if source is None or target is None:
+            continue
+        sources.append(source)
+        targets.append(target)
+        edge_type_ids.append(edge_types.setdefault(edge["type"], len(edge_types)))
+
+    return {
+        "format": "columnar",
+        "nodeTypes": list(node_types),
+        "edgeTypes": list(edge_types),
+        "nodes": {
+            "ids": ids,
+            "types": types,
+            "labels": labels,
+            "properties": properties,
+        },
+        "edges": {
+            "source": sources,
+            "target": targets,
+            "types": edge_type_ids,
+        },
+        "stats": data["stats"],
+    }
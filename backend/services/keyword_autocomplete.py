@@ -0,0 +1,303 @@
+"""
+Media keyword autocomplete service.
+
+Keeps a Redis index of MediaKeyword names for type-ahead completion. Every
+prefix and every substring of a normalized keyword (up to
+KEYWORD_AUTOCOMPLETE_MAX_FRAGMENT characters) maps to a sorted set of the
+keywords containing it, scored by content count and trimmed to the top
+KEYWORD_AUTOCOMPLETE_SIZE entries. A completion is a single ZREVRANGE on
+one small sorted set, independent of the number of keywords.
+
+Each rebuild writes a new version of the index and then switches the
+current-version pointer in one SET, so readers always see either the old or
+the new index in full. Every version records its keys in a set; the keys of
+the previous version are expired after a grace period rather than deleted,
+so readers that resolved the old pointer just before the swap still get
+their results.
+
+Between rebuilds the sync keeps the current version up to date: the counts
+ZINCRBY returns for each committed chunk are written to just the fragment
+sets of those keywords (update_autocomplete_counts). A full rebuild is only
+needed while no index exists or the counters are not reconciled yet; it
+runs as a debounced Celery task, never inside a sync or a request.
+"""
+
+import heapq
+import logging
+import time
+from typing import Any
+
+import redis
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from services.keyword_popularity import keyword_counts_reconciled
+from services.media_neo4j_sync import normalize_keyword
+from services.neo4j_client import get_neo4j_client
+from services.neo4j_metrics import register_queries
+from services.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# Redis key holding the version of the index readers should use
+AUTOCOMPLETE_VERSION_KEY = "media_keyword_autocomplete:current"
+
+# Redis key of one fragment set; kind is "p" (prefix) or "s" (substring)
+AUTOCOMPLETE_FRAGMENT_KEY = "media_keyword_autocomplete:{version}:{kind}:{fragment}"
+
+# Redis set of the fragment keys written for a version
+AUTOCOMPLETE_VERSION_KEYS_KEY = "media_keyword_autocomplete:{version}:keys"
+
+# Seconds a replaced version stays readable after the pointer swap
+RETIRED_VERSION_TTL = 60
+
+# Completion modes
+AUTOCOMPLETE_MODES = ("prefix", "substring")
+
+# Counts come from the contentCount maintained by the sync, once reconciled
+FETCH_KEYWORD_COUNTS_QUERY = """
+MATCH (k:MediaKeyword)
+RETURN k.name AS name, coalesce(k.contentCount, 0) AS count
+"""
+
+# Until then contentCount may be partial, so relationships are counted
+COUNT_KEYWORD_LINKS_QUERY = """
+MATCH (k:MediaKeyword)
+RETURN k.name AS name, COUNT { (k)<-[:HAS_KEYWORD]-() } AS count
+"""
+
+register_queries(globals())
+
+
+def _get_index_size() -> int:
+    """Get how many completions are kept per fragment."""
+    return max(1, int(getattr(settings, "KEYWORD_AUTOCOMPLETE_SIZE", 50)))
+
+
+def _get_max_fragment() -> int:
+    """Get the longest fragment indexed."""
+    return max(1, int(getattr(settings, "KEYWORD_AUTOCOMPLETE_MAX_FRAGMENT", 12)))
+
+
+def _fragments(key: str, max_length: int) -> tuple[set[str], set[str]]:
+    """Get the prefixes and substrings of a normalized keyword."""
+    prefixes = {key[:end] for end in range(1, min(len(key), max_length) + 1)}
+    substrings = {
+        key[start:end]
+        for start in range(len(key))
+        for end in range(start + 1, min(len(key), start + max_length) + 1)
+    }
+    return prefixes, substrings
+
+
+def rebuild_autocomplete_index() -> dict[str, Any]:
+    """
+    Rebuild the autocomplete index from MediaKeyword nodes and swap it in.
+
+    Keywords are scored by their contentCount once the counters have been
+    reconciled, and by counting their HAS_KEYWORD relationships before.
+
+    Returns:
+        Summary with the new version, keyword count and fragment set count
+    """
+    started = time.perf_counter()
+    size = _get_index_size()
+    max_length = _get_max_fragment()
+
+    # Top-N (count, name) per fragment, kept as min-heaps
+    top: dict[tuple[str, str], list[tuple[int, str]]] = {}
+    keywords = 0
+
+    client = get_neo4j_client()
+    query = FETCH_KEYWORD_COUNTS_QUERY if keyword_counts_reconciled() else COUNT_KEYWORD_LINKS_QUERY
+    for record in client.run_query(query):
+        key = normalize_keyword(record["name"])
+        if not key:
+            continue
+        keywords += 1
+        entry = (record["count"], record["name"])
+        prefixes, substrings = _fragments(key, max_length)
+        for kind, fragments in (("p", prefixes), ("s", substrings)):
+            for fragment in fragments:
+                heap = top.setdefault((kind, fragment), [])
+                if len(heap) < size:
+                    heapq.heappush(heap, entry)
+                elif entry > heap[0]:
+                    heapq.heapreplace(heap, entry)
+
+    r = get_redis_client()
+    previous = r.get(AUTOCOMPLETE_VERSION_KEY)
+    version = str(r.incr(f"{AUTOCOMPLETE_VERSION_KEY}:seq"))
+    keys_key = AUTOCOMPLETE_VERSION_KEYS_KEY.format(version=version)
+
+    pipe = r.pipeline(transaction=False)
+    for i, ((kind, fragment), heap) in enumerate(top.items(), start=1):
+        fragment_key = AUTOCOMPLETE_FRAGMENT_KEY.format(
+            version=version, kind=kind, fragment=fragment
+        )
+        pipe.zadd(fragment_key, {name: count for count, name in heap})
+        pipe.sadd(keys_key, fragment_key)
+        if i % 1000 == 0:
+            pipe.execute()
+    pipe.execute()
+
+    # Atomic swap: readers move to the complete new version at once
+    r.set(AUTOCOMPLETE_VERSION_KEY, version)
+    if previous:
+        _retire_version(r, previous)
+
+    elapsed = time.perf_counter() - started
+    logger.info(
+        f"Rebuilt keyword autocomplete v{version}: {keywords} keywords, "
+        f"{len(top)} fragments in {elapsed:.2f}s"
+    )
+    return {"version": version, "keywords": keywords, "fragments": len(top)}
+
+
+def update_autocomplete_counts(counts: dict[str, int]) -> None:
+    """
+    Write new keyword counts into the current index version in place.
+
+    Only the fragment sets of the given keywords are touched: each gets the
+    keyword at its new count and is trimmed back to KEYWORD_AUTOCOMPLETE_SIZE.
+    Counts only grow during a sync, so a trimmed set still holds its top
+    keywords. Nothing is written while no index exists or the counters are
+    not reconciled, since the counts would not match the index; the rebuild
+    scheduled after the sync covers that. Failures are logged and repaired
+    by the next rebuild.
+
+    Args:
+        counts: New all-platform content count per keyword name
+    """
+    if not counts:
+        return
+
+    try:
+        r = get_redis_client()
+        version = r.get(AUTOCOMPLETE_VERSION_KEY)
+        if version is None or not keyword_counts_reconciled():
+            return
+
+        size = _get_index_size()
+        max_length = _get_max_fragment()
+        keys_key = AUTOCOMPLETE_VERSION_KEYS_KEY.format(version=version)
+        touched: list[str] = []
+        pipe = r.pipeline(transaction=False)
+        for name, count in counts.items():
+            prefixes, substrings = _fragments(normalize_keyword(name), max_length)
+            for kind, fragments in (("p", prefixes), ("s", substrings)):
+                for fragment in fragments:
+                    fragment_key = AUTOCOMPLETE_FRAGMENT_KEY.format(
+                        version=version, kind=kind, fragment=fragment
+                    )
+                    pipe.zadd(fragment_key, {name: count})
+                    pipe.zremrangebyrank(fragment_key, 0, -size - 1)
+                    pipe.sadd(keys_key, fragment_key)
+                    touched.append(fragment_key)
+                    if len(touched) % 1000 == 0:
+                        pipe.execute()
+        pipe.execute()
+
+        # A rebuild swapped versions meanwhile: sets created in the retired
+        # version must expire with it
+        if r.get(AUTOCOMPLETE_VERSION_KEY) != version:
+            for key in touched:
+                pipe.expire(key, RETIRED_VERSION_TTL)
+            pipe.execute()
+    except Exception as e:
+        logger.error(f"Failed to update keyword autocomplete counts: {e}")
+
+
+def autocomplete_needs_rebuild(totals: dict[str, int]) -> bool:
+    """
+    Check whether a finished sync left the autocomplete index behind.
+
+    A sync that wrote content or keywords has already applied its counts
+    through update_autocomplete_counts, unless no index exists yet or the
+    counters are not reconciled.
+
+    Args:
+        totals: Sync totals of the finished run
+    """
+    if not totals.get("keywords_synced") and not totals.get("content_synced"):
+        return False
+    try:
+        has_index = bool(get_redis_client().exists(AUTOCOMPLETE_VERSION_KEY))
+    except Exception as e:
+        logger.error(f"Failed to read keyword autocomplete version: {e}")
+        return True
+    return not has_index or not keyword_counts_reconciled()
+
+
+def _retire_version(r: redis.Redis, version: str) -> None:
+    """Expire every fragment set of a replaced index version after a grace period."""
+    keys_key = AUTOCOMPLETE_VERSION_KEYS_KEY.format(version=version)
+    pipe = r.pipeline(transaction=False)
+    for i, key in enumerate(r.sscan_iter(keys_key, count=1000), start=1):
+        pipe.expire(key, RETIRED_VERSION_TTL)
+        if i % 1000 == 0:
+            pipe.execute()
+    pipe.expire(keys_key, RETIRED_VERSION_TTL)
+    pipe.execute()
+
+
+def autocomplete_keywords(
+    query_text: str,
+    limit: int = 10,
+    mode: str = "prefix",
+) -> list[dict[str, Any]] | None:
+    """
+    Get the most used keywords completing the query text.
+
+    Args:
+        query_text: Text typed so far
+        limit: Maximum completions (at most KEYWORD_AUTOCOMPLETE_SIZE)
+        mode: "prefix" or "substring" matching
+
+    Returns:
+        Completions with content counts, or None if no index has been built
+    """
+    if mode not in AUTOCOMPLETE_MODES:
+        raise ValueError(f"Unknown autocomplete mode: {mode}. Supported: {AUTOCOMPLETE_MODES}")
+
+    key = normalize_keyword(query_text)
+    fragment = key[: _get_max_fragment()]
+    if not fragment:
+        return []
+
+    r = get_redis_client()
+    version = r.get(AUTOCOMPLETE_VERSION_KEY)
+    if version is None:
+        return None
+
+    kind = "p" if mode == "prefix" else "s"
+    truncated = len(key) > len(fragment)
+    entries = r.zrevrange(
+        AUTOCOMPLETE_FRAGMENT_KEY.format(version=version, kind=kind, fragment=fragment),
+        0,
+        -1 if truncated else limit - 1,
+        withscores=True,
+    )
+    if truncated:
+        # Queries longer than the indexed fragments are checked in full
+        entries = [
+            (name, score)
+            for name, score in entries
+            if (
+                normalize_keyword(name).startswith(key)
+                if mode == "prefix"
+                else key in normalize_keyword(name)
+            )
+        ][:limit]
+    return [{"name": name, "count": int(score)} for name, score in entries]
+
+
+async def aautocomplete_keywords(
+    query_text: str,
+    limit: int = 10,
+    mode: str = "prefix",
+) -> list[dict[str, Any]] | None:
+    """Async variant of autocomplete_keywords for async views."""
+    return await sync_to_async(autocomplete_keywords, thread_sensitive=False)(
+        query_text, limit=limit, mode=mode
+    )
@@ -0,0 +1,205 @@
+"""
+Keyword popularity counter service.
+
+MediaKeyword nodes carry a contentCount property (contents linked through
+HAS_KEYWORD) plus one <platform>Count property per platform, and Tag nodes
+carry a contentCount of their articles. The sync increments them whenever it
+creates a new relationship, so popularity lookups read a property instead of
+aggregating every relationship on each request.
+
+Media keyword counts are mirrored in Redis sorted sets (one over all
+platforms and one per platform) updated with ZINCRBY, so top-N is a single
+ZREVRANGE. reconcile_keyword_counts recomputes every counter exactly from
+the graph and swaps the sorted sets in atomically.
+
+Counters only start at the first sync that maintains them, so on a graph
+synced before that they are partial. Neither the properties nor the sorted
+sets are read until reconcile_keyword_counts has run and set the reconciled
+marker; until then callers count relationships instead.
+"""
+
+import logging
+import re
+from collections import Counter, defaultdict
+from typing import Any
+
+from services.neo4j_client import get_neo4j_client
+from services.neo4j_metrics import register_queries
+from services.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# Redis sorted set of media keyword content counts; scope is "all" or a platform
+KEYWORD_POPULARITY_KEY = "media_keyword_popularity:{scope}"
+
+# Set once reconcile_keyword_counts has made the counters exact
+KEYWORD_COUNTS_RECONCILED_KEY = "media_keyword_popularity:reconciled"
+
+FETCH_KEYWORD_PLATFORM_COUNTS_QUERY = """
+MATCH (k:MediaKeyword)
+OPTIONAL MATCH (k)<-[:HAS_KEYWORD]-(c:MediaContent)
+RETURN k.name AS name, c.platform AS platform, count(c) AS count
+"""
+
+SET_KEYWORD_COUNTS_QUERY = """
+UNWIND $rows AS row
+MATCH (k:MediaKeyword {name: row.name})
+SET k += row.counts
+"""
+
+RECONCILE_TAG_COUNTS_QUERY = """
+MATCH (t:Tag)
+SET t.contentCount = COUNT { (t)<-[:HAS_TAG]-(:Article) }
+"""
+
+register_queries(globals())
+
+
+def platform_count_property(platform: str) -> str:
+    """
+    Get the MediaKeyword property counting a platform's contents.
+
+    Platform names come from the sync spec registry; they are validated
+    because the property name is interpolated into Cypher.
+    """
+    if not re.fullmatch(r"[a-z][a-z0-9_]*", platform):
+        raise ValueError(f"Invalid platform name for a count property: {platform!r}")
+    return f"{platform}Count"
+
+
+def record_keyword_links(platform: str, names: list[str]) -> dict[str, int]:
+    """
+    Mirror newly created HAS_KEYWORD relationships into the sorted sets.
+
+    Called after the Neo4j transaction that created them has committed.
+    Failures are logged; reconcile_keyword_counts repairs any drift.
+
+    Args:
+        platform: Platform of the linked contents
+        names: Keyword name of each new relationship
+
+    Returns:
+        New all-platform count of each linked keyword, as returned by
+        ZINCRBY (empty if Redis failed)
+    """
+    if not names:
+        return {}
+
+    links = Counter(names)
+    try:
+        pipe = get_redis_client().pipeline(transaction=False)
+        for name, count in links.items():
+            pipe.zincrby(KEYWORD_POPULARITY_KEY.format(scope="all"), count, name)
+            pipe.zincrby(KEYWORD_POPULARITY_KEY.format(scope=platform), count, name)
+        scores = pipe.execute()
+    except Exception as e:
+        logger.error(f"Failed to update keyword popularity for {platform}: {e}")
+        return {}
+    # Replies alternate between the all-platform and the platform set
+    return {name: int(score) for name, score in zip(links, scores[::2])}
+
+
+def keyword_counts_reconciled() -> bool:
+    """
+    Check whether the keyword and tag counters have been reconciled.
+
+    Returns False if Redis is unavailable, so callers fall back to counting
+    relationships, which is slower but always exact.
+    """
+    try:
+        return bool(get_redis_client().exists(KEYWORD_COUNTS_RECONCILED_KEY))
+    except Exception as e:
+        logger.error(f"Failed to read keyword counts reconciled marker: {e}")
+        return False
+
+
+def get_top_keywords(platform: str | None = None, limit: int = 50) -> list[dict[str, Any]] | None:
+    """
+    Read the most used media keywords from the sorted sets.
+
+    Sync increments create a sorted set on its first ZINCRBY, so a set
+    existing does not mean it is complete; only the reconciled marker does.
+
+    Args:
+        platform: Platform name, or None for all platforms
+        limit: Maximum keywords to return
+
+    Returns:
+        Keywords with counts, or None if the counters have not been reconciled
+    """
+    r = get_redis_client()
+    if not r.exists(KEYWORD_COUNTS_RECONCILED_KEY):
+        return None
+    key = KEYWORD_POPULARITY_KEY.format(scope=platform or "all")
+    entries = r.zrevrange(key, 0, limit - 1, withscores=True)
+    return [{"name": name, "count": int(score)} for name, score in entries]
+
+
+def reconcile_keyword_counts(platforms: list[str], batch_size: int = 1000) -> dict[str, int]:
+    """
+    Recompute all keyword and tag counters exactly from the graph.
+
+    MediaKeyword counters are rewritten from their HAS_KEYWORD relationships
+    and the sorted sets are rebuilt under temporary keys, then renamed over
+    the live ones so readers never see a partial set. Tag contentCount is
+    recomputed from HAS_TAG relationships. The reconciled marker is set last
+    so readers only switch to the counters once they are all exact.
+
+    Args:
+        platforms: Platforms whose per-platform counters are maintained
+        batch_size: Keywords updated per transaction
+
+    Returns:
+        Number of keywords and tags reconciled
+    """
+    client = get_neo4j_client()
+
+    counts: dict[str, dict[str, int]] = defaultdict(dict)
+    for record in client.run_query(FETCH_KEYWORD_PLATFORM_COUNTS_QUERY):
+        # Keywords without contents still get an entry so their counters reset
+        by_platform = counts[record["name"]]
+        if record["platform"] is not None:
+            by_platform[record["platform"]] = record["count"]
+
+    rows = []
+    for name, by_platform in counts.items():
+        properties = {platform_count_property(p): by_platform.get(p, 0) for p in platforms}
+        properties["contentCount"] = sum(by_platform.values())
+        rows.append({"name": name, "counts": properties})
+
+    for start in range(0, len(rows), batch_size):
+        client.run_write_query(SET_KEYWORD_COUNTS_QUERY, {"rows": rows[start : start + batch_size]})
+
+    r = get_redis_client()
+    scopes: dict[str, dict[str, int]] = {"all": {}}
+    for name, by_platform in counts.items():
+        total = sum(by_platform.values())
+        if total:
+            scopes["all"][name] = total
+        for platform, count in by_platform.items():
+            if count:
+                scopes.setdefault(platform, {})[name] = count
+
+    for platform in platforms:
+        scopes.setdefault(platform, {})
+    for scope, members in scopes.items():
+        key = KEYWORD_POPULARITY_KEY.format(scope=scope)
+        tmp_key = f"{key}:rebuild"
+        pipe = r.pipeline(transaction=False)
+        pipe.delete(tmp_key)
+        names = list(members.items())
+        for start in range(0, len(names), batch_size):
+            pipe.zadd(tmp_key, dict(names[start : start + batch_size]))
+        if names:
+            pipe.rename(tmp_key, key)
+        else:
+            pipe.delete(key)
+        pipe.execute()
+
+    summary = client.run_write_query(RECONCILE_TAG_COUNTS_QUERY)
+    r.set(KEYWORD_COUNTS_RECONCILED_KEY, "1")
+    logger.info(
+        f"Reconciled {len(rows)} keyword counters and "
+        f"{summary['properties_set']} tag counters"
+    )
+    return {"keywords": len(rows), "tags": summary["properties_set"]}
@@ -10,14 +10,38 @@ Graph Model:
     (:Content) -[:HAS_COMMENT]-> (:Comment {commentId, ...})
 """
 
+import hashlib
+import json
 import logging
 import re
+import time
+import unicodedata
+import uuid
+from contextlib import ExitStack, aclosing, closing
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from functools import partial
+from typing import Any, Callable, Iterator
 
+from asgiref.sync import sync_to_async
+from django.apps import apps
+from django.conf import settings
 from django.core.cache import cache
-
-from services.neo4j_client import get_neo4j_client
+from django.db.models import BigIntegerField, F, Max, Q, Window
+from django.db.models.functions import Cast, RowNumber
+
+from core.exceptions import SyncError
+from services.graph_cache import bump_graph_generation
+from services.keyword_popularity import (
+    get_top_keywords,
+    keyword_counts_reconciled,
+    platform_count_property,
+    record_keyword_links,
+)
+from services.neo4j_client import get_async_neo4j_client, get_neo4j_client
+from services.neo4j_metrics import get_query_name, register_queries, register_query
+from services.neo4j_schema import build_fulltext_query, ensure_schema
+from services.single_flight import single_flight
 
 # Import neo4j time types for serialization
 try:
@@ -34,6 +58,30 @@ SUPPORTED_PLATFORMS = ["bilibili", "douyin", "kuaishou", "weibo", "xhs", "tieba"
 # Cache key for sync status
 SYNC_STATUS_CACHE_KEY = "media_neo4j_sync_status"
 
+# Cache key prefix for per-platform incremental sync high-water marks
+SYNC_WATERMARK_CACHE_KEY = "media_neo4j_sync_watermark:{platform}"
+
+# Cache key prefix for per-platform resumable sync checkpoints
+SYNC_CHECKPOINT_CACHE_KEY = "media_neo4j_sync_checkpoint:{platform}"
+
+# Cache key prefix for the per-platform lock held by a running sync
+SYNC_LOCK_CACHE_KEY = "media_neo4j_sync_lock:{platform}"
+
+# Cache key prefix for per-platform row progress of the current sync
+SYNC_PROGRESS_CACHE_KEY = "media_neo4j_sync_progress:{platform}"
+
+# Cache key prefix for platform results already completed by a sync task run
+SYNC_RUN_CACHE_KEY = "media_neo4j_sync_run:{task_id}"
+
+# Counters reported per platform and summed into sync totals
+SYNC_COUNTER_KEYS = [
+    "content_synced",
+    "content_skipped",
+    "keywords_synced",
+    "comments_synced",
+    "comments_skipped",
+]
+
 # ============================================================================
 # Cypher Queries
 # ============================================================================
@@ -46,86 +94,212 @@ RETURN p
 """
 
 MERGE_CONTENT_QUERY = """
-MERGE (c:MediaContent {contentId: $contentId, platform: $platform})
-SET c.contentType = $contentType,
-    c.title = $title,
-    c.author = $author,
-    c.authorId = $authorId,
-    c.url = $url,
-    c.createTime = $createTime,
-    c.likedCount = $likedCount,
-    c.commentCount = $commentCount,
+UNWIND $rows AS row
+MERGE (c:MediaContent {contentId: row.contentId, platform: row.platform})
+SET c.contentType = row.contentType,
+    c.title = row.title,
+    c.author = row.author,
+    c.authorId = row.authorId,
+    c.url = row.url,
+    c.createTime = row.createTime,
+    c.likedCount = row.likedCount,
+    c.commentCount = row.commentCount,
+    c.syncHash = row.syncHash,
     c.syncedAt = datetime()
-WITH c
-MATCH (p:MediaPlatform {name: $platform})
+WITH c, row
+MATCH (p:MediaPlatform {name: row.platform})
 MERGE (p)-[:HAS_CONTENT]->(c)
-RETURN c
 """
 
+# New HAS_KEYWORD relationships bump the keyword's maintained counters;
+# `platformCount` is replaced with the platform's count property
 MERGE_KEYWORD_QUERY = """
-MERGE (k:MediaKeyword {name: $name})
-WITH k
-MATCH (c:MediaContent {contentId: $contentId, platform: $platform})
-MERGE (c)-[:HAS_KEYWORD]->(k)
-RETURN k
+UNWIND $rows AS row
+MERGE (k:MediaKeyword {name: row.name})
+SET k.key = row.key
+WITH k, row
+MATCH (c:MediaContent {contentId: row.contentId, platform: row.platform})
+WHERE NOT EXISTS { (c)-[:HAS_KEYWORD]->(k) }
+CREATE (c)-[:HAS_KEYWORD]->(k)
+SET k.contentCount = coalesce(k.contentCount, 0) + 1,
+    k.`platformCount` = coalesce(k.`platformCount`, 0) + 1
+RETURN k.name AS name
 """
 
 MERGE_COMMENT_QUERY = """
-MERGE (cm:MediaComment {commentId: $commentId, platform: $platform})
-SET cm.content = $content,
-    cm.author = $author,
-    cm.authorId = $authorId,
-    cm.createTime = $createTime,
-    cm.likedCount = $likedCount
-WITH cm
-MATCH (c:MediaContent {contentId: $contentId, platform: $platform})
-MERGE (c)-[:HAS_COMMENT]->(cm)
-RETURN cm
+UNWIND $rows AS row
+MERGE (cm:MediaComment {commentId: row.commentId, platform: row.platform})
+SET cm.content = row.content,
+    cm.author = row.author,
+    cm.authorId = row.authorId,
+    cm.createTime = row.createTime,
+    cm.likedCount = row.likedCount,
+    cm.syncHash = row.syncHash
+WITH cm, row
+MATCH (c:MediaContent {contentId: row.contentId, platform: row.platform})
+WHERE NOT EXISTS { (c)-[:HAS_COMMENT]->(cm) }
+CREATE (c)-[:HAS_COMMENT]->(cm)
+SET c.syncedCommentCount = coalesce(c.syncedCommentCount, 0) + 1
+"""
+
+FETCH_SYNC_HASHES_QUERY = """
+UNWIND $contentIds AS contentId
+MATCH (c:MediaContent {contentId: contentId, platform: $platform})
+RETURN 'content' AS kind, c.contentId AS id, c.syncHash AS hash
+UNION ALL
+UNWIND $commentIds AS commentId
+MATCH (cm:MediaComment {commentId: commentId, platform: $platform})
+RETURN 'comment' AS kind, cm.commentId AS id, cm.syncHash AS hash
 """
 
 # Graph data retrieval queries
+# Graph queries pick the $limit most liked contents first, then expand only
+# those to their platform and keywords. The likedCount IS NOT NULL filters let
+# the planner read contents in likedCount order from the range indexes instead
+# of sorting every match; comment counts come from the
+# syncedCommentCount maintained at sync time instead of expanding comments.
+# Several keyword names can share a normalized key, so keyword lookups return
+# DISTINCT contents to keep duplicates from taking up $limit.
+# Nodes are returned as map projections of the properties needed to render
+# them plus the requested $fields; full properties come from the node queries.
 GET_MEDIA_GRAPH_BY_PLATFORM_QUERY = """
-MATCH (p:MediaPlatform {name: $platform})-[:HAS_CONTENT]->(c:MediaContent)
-OPTIONAL MATCH (c)-[:HAS_KEYWORD]->(k:MediaKeyword)
-OPTIONAL MATCH (c)-[:HAS_COMMENT]->(cm:MediaComment)
-RETURN p, c, collect(DISTINCT k) as keywords, count(DISTINCT cm) as commentCount
-LIMIT $limit
+CALL {
+    MATCH (c:MediaContent {platform: $platform})
+    WHERE c.likedCount IS NOT NULL
+    RETURN c
+    ORDER BY c.likedCount DESC
+    LIMIT $limit
+}
+MATCH (p:MediaPlatform)-[:HAS_CONTENT]->(c)
+CALL {
+    WITH c
+    OPTIONAL MATCH (c)-[:HAS_KEYWORD]->(k:MediaKeyword)
+    RETURN collect(k {.name, .contentCount}) as keywords
+}
+WITH p, c, keywords
+ORDER BY c.likedCount DESC
+RETURN p {.name, .displayName} as p,
+       c {.contentId, .platform, .title} as c,
+       [field IN $fields | c[field]] as fieldValues,
+       keywords,
+       coalesce(c.syncedCommentCount, 0) as commentCount
 """
 
 GET_MEDIA_GRAPH_ALL_PLATFORMS_QUERY = """
-MATCH (p:MediaPlatform)-[:HAS_CONTENT]->(c:MediaContent)
-OPTIONAL MATCH (c)-[:HAS_KEYWORD]->(k:MediaKeyword)
-OPTIONAL MATCH (c)-[:HAS_COMMENT]->(cm:MediaComment)
-RETURN p, c, collect(DISTINCT k) as keywords, count(DISTINCT cm) as commentCount
-LIMIT $limit
+CALL {
+    MATCH (c:MediaContent)
+    WHERE c.likedCount IS NOT NULL
+    RETURN c
+    ORDER BY c.likedCount DESC
+    LIMIT $limit
+}
+MATCH (p:MediaPlatform)-[:HAS_CONTENT]->(c)
+CALL {
+    WITH c
+    OPTIONAL MATCH (c)-[:HAS_KEYWORD]->(k:MediaKeyword)
+    RETURN collect(k {.name, .contentCount}) as keywords
+}
+WITH p, c, keywords
+ORDER BY c.likedCount DESC
+RETURN p {.name, .displayName} as p,
+       c {.contentId, .platform, .title} as c,
+       [field IN $fields | c[field]] as fieldValues,
+       keywords,
+       coalesce(c.syncedCommentCount, 0) as commentCount
 """
 
 GET_MEDIA_GRAPH_BY_KEYWORD_QUERY = """
-MATCH (k:MediaKeyword)<-[:HAS_KEYWORD]-(c:MediaContent)<-[:HAS_CONTENT]-(p:MediaPlatform)
-WHERE toLower(k.name) = toLower($keyword)
-OPTIONAL MATCH (c)-[:HAS_KEYWORD]->(k2:MediaKeyword)
-OPTIONAL MATCH (c)-[:HAS_COMMENT]->(cm:MediaComment)
-RETURN p, c, collect(DISTINCT k2) as keywords, count(DISTINCT cm) as commentCount
-LIMIT $limit
+CALL {
+    MATCH (:MediaKeyword {key: $key})<-[:HAS_KEYWORD]-(c:MediaContent)
+    WHERE c.likedCount IS NOT NULL
+    RETURN DISTINCT c
+    ORDER BY c.likedCount DESC
+    LIMIT $limit
+}
+MATCH (p:MediaPlatform)-[:HAS_CONTENT]->(c)
+CALL {
+    WITH c
+    OPTIONAL MATCH (c)-[:HAS_KEYWORD]->(k:MediaKeyword)
+    RETURN collect(k {.name, .contentCount}) as keywords
+}
+WITH p, c, keywords
+ORDER BY c.likedCount DESC
+RETURN p {.name, .displayName} as p,
+       c {.contentId, .platform, .title} as c,
+       [field IN $fields | c[field]] as fieldValues,
+       keywords,
+       coalesce(c.syncedCommentCount, 0) as commentCount
 """
 
 GET_MEDIA_GRAPH_BY_PLATFORM_AND_KEYWORD_QUERY = """
-MATCH (k:MediaKeyword)<-[:HAS_KEYWORD]-(c:MediaContent {platform: $platform})<-[:HAS_CONTENT]-(p:MediaPlatform)
-WHERE toLower(k.name) = toLower($keyword)
-OPTIONAL MATCH (c)-[:HAS_KEYWORD]->(k2:MediaKeyword)
-OPTIONAL MATCH (c)-[:HAS_COMMENT]->(cm:MediaComment)
-RETURN p, c, collect(DISTINCT k2) as keywords, count(DISTINCT cm) as commentCount
-LIMIT $limit
+CALL {
+    MATCH (:MediaKeyword {key: $key})<-[:HAS_KEYWORD]-(c:MediaContent {platform: $platform})
+    WHERE c.likedCount IS NOT NULL
+    RETURN DISTINCT c
+    ORDER BY c.likedCount DESC
+    LIMIT $limit
+}
+MATCH (p:MediaPlatform)-[:HAS_CONTENT]->(c)
+CALL {
+    WITH c
+    OPTIONAL MATCH (c)-[:HAS_KEYWORD]->(k:MediaKeyword)
+    RETURN collect(k {.name, .contentCount}) as keywords
+}
+WITH p, c, keywords
+ORDER BY c.likedCount DESC
+RETURN p {.name, .displayName} as p,
+       c {.contentId, .platform, .title} as c,
+       [field IN $fields | c[field]] as fieldValues,
+       keywords,
+       coalesce(c.syncedCommentCount, 0) as commentCount
+"""
+
+GET_MEDIA_PLATFORM_NODE_QUERY = """
+MATCH (n:MediaPlatform {name: $name})
+RETURN n
+"""
+
+GET_MEDIA_CONTENT_NODE_QUERY = """
+MATCH (n:MediaContent {contentId: $contentId, platform: $platform})
+RETURN n
+"""
+
+GET_MEDIA_KEYWORD_NODE_QUERY = """
+MATCH (n:MediaKeyword {name: $name})
+RETURN n
+"""
+
+RECONCILE_COMMENT_COUNTS_QUERY = """
+MATCH (c:MediaContent {platform: $platform})
+SET c.syncedCommentCount = COUNT { (c)-[:HAS_COMMENT]->(:MediaComment) }
 """
 
 GET_POPULAR_KEYWORDS_ALL_QUERY = """
+MATCH (k:MediaKeyword)
+WHERE k.contentCount > 0
+RETURN k.name as name, k.contentCount as count
+ORDER BY k.contentCount DESC
+LIMIT $limit
+"""
+
+# `platformCount` is replaced with the platform's count property
+GET_POPULAR_KEYWORDS_BY_PLATFORM_QUERY = """
+MATCH (k:MediaKeyword)
+WHERE k.`platformCount` > 0
+RETURN k.name as name, k.`platformCount` as count
+ORDER BY count DESC
+LIMIT $limit
+"""
+
+# Relationship aggregation, used until the counters have been reconciled
+COUNT_POPULAR_KEYWORDS_ALL_QUERY = """
 MATCH (c:MediaContent)-[:HAS_KEYWORD]->(k:MediaKeyword)
 RETURN k.name as name, count(c) as count
 ORDER BY count DESC
 LIMIT $limit
 """
 
-GET_POPULAR_KEYWORDS_BY_PLATFORM_QUERY = """
+COUNT_POPULAR_KEYWORDS_BY_PLATFORM_QUERY = """
 MATCH (c:MediaContent {platform: $platform})-[:HAS_KEYWORD]->(k:MediaKeyword)
 RETURN k.name as name, count(c) as count
 ORDER BY count DESC
@@ -133,19 +307,53 @@ LIMIT $limit
 """
 
 SEARCH_KEYWORDS_QUERY = """
+CALL db.index.fulltext.queryNodes('media_keyword_name_fulltext', $query, {limit: $limit})
+YIELD node AS k, score
+RETURN k.name as name, COUNT { (k)<-[:HAS_KEYWORD]-(:MediaContent) } as count, score
+ORDER BY score DESC, count DESC
+"""
+
+FETCH_UNKEYED_KEYWORDS_QUERY = """
 MATCH (k:MediaKeyword)
-WHERE toLower(k.name) CONTAINS toLower($query)
-OPTIONAL MATCH (c:MediaContent)-[:HAS_KEYWORD]->(k)
-RETURN k.name as name, count(c) as count
-ORDER BY count DESC
+WHERE k.key IS NULL AND k.name IS NOT NULL
+RETURN k.name AS name
 LIMIT $limit
 """
 
+SET_KEYWORD_KEYS_QUERY = """
+UNWIND $rows AS row
+MATCH (k:MediaKeyword {name: row.name})
+SET k.key = row.key
+"""
+
+PROFILE_KEYWORD_LOOKUP_QUERY = """
+PROFILE MATCH (k:MediaKeyword {key: $key})
+RETURN count(k) AS matches
+"""
+
+register_queries(globals())
+
 
 # ============================================================================
 # Keyword Extraction
 # ============================================================================
 
+def normalize_keyword(text: str | None) -> str:
+    """
+    Normalize a keyword to its lookup key.
+
+    NFKC folds full-width letters, digits and punctuation to their
+    half-width forms, casefold lowercases (including non-ASCII), and runs of
+    whitespace collapse to a single space. Keys are stored on MediaKeyword
+    nodes and query params are normalized the same way, so lookups are an
+    indexed equality match.
+    """
+    if not text:
+        return ""
+    text = unicodedata.normalize("NFKC", text).casefold()
+    return " ".join(text.split())
+
+
 def extract_keywords(
     source_keyword: str | None,
     title: str | None,
@@ -216,27 +424,310 @@ def _ensure_platform_node(client, platform: str, display_name: str) -> None:
     )
 
 
-def _sync_content_node(session, content_data: dict[str, Any]) -> None:
-    """Sync a content node to Neo4j."""
-    session.run(MERGE_CONTENT_QUERY, content_data)
+def get_sync_concurrency(platform_count: int) -> int:
+    """Get how many platform subtasks an all-platform sync runs in parallel."""
+    concurrency = int(getattr(settings, "MEDIA_NEO4J_SYNC_CONCURRENCY", 0))
+    if concurrency <= 0:
+        return max(1, platform_count)
+    return max(1, min(concurrency, platform_count))
+
+
+def get_sync_batch_size() -> int:
+    """Get the configured number of content rows per write chunk."""
+    return max(1, int(getattr(settings, "MEDIA_NEO4J_SYNC_BATCH_SIZE", 500)))
+
+
+def _sync_hash(data: dict[str, Any]) -> str:
+    """Hash mapped node properties so unchanged rows can be detected."""
+    payload = json.dumps(data, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
 
+# Queries rewritten for a platform's counter, keyed by (query, platform)
+_platform_count_queries: dict[tuple[str, str], str] = {}
 
-def _sync_keyword_nodes(session, content_id: str, platform: str, keywords: list[str]) -> int:
-    """Sync keyword nodes and relationships."""
-    synced = 0
-    for keyword in keywords:
-        if keyword:
-            session.run(
-                MERGE_KEYWORD_QUERY,
-                {"name": keyword, "contentId": content_id, "platform": platform},
+
+def _with_platform_count(query: str, platform: str) -> str:
+    """
+    Point a query's `platformCount` property at the platform's counter.
+
+    Each (query, platform) pair is rewritten and registered once; later
+    calls, such as one per write chunk, return the same string.
+    """
+    key = (query, platform)
+    rewritten = _platform_count_queries.get(key)
+    if rewritten is None:
+        rewritten = query.replace("`platformCount`", f"`{platform_count_property(platform)}`")
+        # Record its metrics under the original query's name
+        register_query(get_query_name(query), rewritten)
+        _platform_count_queries[key] = rewritten
+    return rewritten
+
+
+def _write_chunk_tx(
+    tx,
+    platform: str,
+    contents: list[dict[str, Any]],
+    keywords: list[dict[str, Any]],
+    comments: list[dict[str, Any]],
+) -> tuple[list, list, list, list[str]]:
+    """
+    Write the changed rows of one chunk in a single transaction.
+
+    Stored sync hashes of the chunk's contents and comments are fetched in
+    one query first; rows whose hash is unchanged are not written. Keyword
+    rows are part of their content's hash, so they are only written along
+    with a changed content.
+
+    Returns:
+        The content, keyword and comment rows that were written, and the
+        keyword names of newly created HAS_KEYWORD relationships
+    """
+    stored = {"content": {}, "comment": {}}
+    hashes = tx.run(
+        FETCH_SYNC_HASHES_QUERY,
+        {
+            "platform": platform,
+            "contentIds": [row["contentId"] for row in contents],
+            "commentIds": [row["commentId"] for row in comments],
+        },
+    )
+    for record in hashes:
+        stored[record["kind"]][record["id"]] = record["hash"]
+
+    contents = [
+        row for row in contents if stored["content"].get(row["contentId"]) != row["syncHash"]
+    ]
+    changed_ids = {row["contentId"] for row in contents}
+    keywords = [row for row in keywords if row["contentId"] in changed_ids]
+    comments = [
+        row for row in comments if stored["comment"].get(row["commentId"]) != row["syncHash"]
+    ]
+
+    if contents:
+        tx.run(MERGE_CONTENT_QUERY, {"rows": contents}).consume()
+    linked: list[str] = []
+    if keywords:
+        result = tx.run(_with_platform_count(MERGE_KEYWORD_QUERY, platform), {"rows": keywords})
+        linked = [record["name"] for record in result]
+    if comments:
+        tx.run(MERGE_COMMENT_QUERY, {"rows": comments}).consume()
+    return contents, keywords, comments, linked
+
+
+def _load_top_comments(
+    comment_model,
+    join_field: str,
+    content_ids: list,
+    columns: list[str],
+    like_field: str | None = None,
+    time_field: str = "create_time",
+) -> dict[Any, list[dict[str, Any]]]:
+    """
+    Load the top comments for a chunk of contents in one query.
+
+    Comments are ranked per content with ROW_NUMBER() in SQL, so only the
+    top MEDIA_NEO4J_SYNC_COMMENTS_PER_CONTENT rows per content are fetched.
+    Ranking follows MEDIA_NEO4J_SYNC_COMMENT_ORDER: "likes" (most liked first,
+    newest as tie-breaker) or "time" (newest first). Platforms without a like
+    column always rank by time.
+
+    Args:
+        comment_model: Comment model of the platform
+        join_field: Field on the comment model referencing the content id
+        content_ids: Source content ids of the chunk
+        columns: Comment columns to fetch
+        like_field: Like count column, if the platform has one
+        time_field: Creation time column
+
+    Returns:
+        Comments grouped by content id
+    """
+    if not content_ids:
+        return {}
+
+    per_content = int(getattr(settings, "MEDIA_NEO4J_SYNC_COMMENTS_PER_CONTENT", 50))
+    order = getattr(settings, "MEDIA_NEO4J_SYNC_COMMENT_ORDER", "likes")
+
+    order_by = [F(time_field).desc()]
+    if order == "likes" and like_field:
+        order_by.insert(0, Cast(like_field, BigIntegerField()).desc())
+
+    comments = (
+        comment_model.objects.using("mysql")
+        .filter(**{f"{join_field}__in": content_ids})
+        .values(*columns)
+        .annotate(
+            comment_rank=Window(
+                expression=RowNumber(),
+                partition_by=[F(join_field)],
+                order_by=order_by,
             )
-            synced += 1
-    return synced
+        )
+        .filter(comment_rank__lte=per_content)
+    )
+
+    grouped: dict[Any, list[dict[str, Any]]] = {}
+    for comment in comments:
+        grouped.setdefault(comment[join_field], []).append(comment)
+    return grouped
 
 
-def _sync_comment_node(session, comment_data: dict[str, Any]) -> None:
-    """Sync a comment node to Neo4j."""
-    session.run(MERGE_COMMENT_QUERY, comment_data)
+class MediaBatchWriter:
+    """
+    Buffers mapped rows for one platform and writes them to Neo4j in chunks.
+
+    Each chunk is written with one UNWIND statement per node type inside a
+    single managed write transaction, replacing one round trip per row.
+    Comments for the whole chunk are fetched with a single call to
+    load_comments, which receives the source content ids of the chunk.
+    Every row carries a hash of its mapped properties, and rows whose hash
+    matches the one stored in Neo4j are skipped instead of rewritten.
+    After a chunk commits, on_commit is called with the chunk's counters;
+    a chunk that fails to write raises so callers can resume from the last
+    committed chunk.
+
+    Usage:
+        with MediaBatchWriter(client, "bilibili", load_comments) as writer:
+            writer.add(content_data, keywords, source_id)
+        result = writer.result()
+    """
+
+    def __init__(
+        self,
+        client,
+        platform: str,
+        load_comments: Callable[[list], list[dict[str, Any]]],
+        batch_size: int | None = None,
+        on_commit: Callable[[dict[str, int]], None] | None = None,
+    ):
+        self.client = client
+        self.platform = platform
+        self.load_comments = load_comments
+        self.batch_size = batch_size or get_sync_batch_size()
+        self.on_commit = on_commit
+        self._session = None
+        self._contents: list[dict[str, Any]] = []
+        self._keywords: list[dict[str, Any]] = []
+        self._source_ids: list = []
+        self.content_synced = 0
+        self.content_skipped = 0
+        self.keywords_synced = 0
+        self.comments_synced = 0
+        self.comments_skipped = 0
+        self.chunks_written = 0
+        self.elapsed = 0.0
+        self.chunk_rates: list[float] = []
+
+    def __enter__(self) -> "MediaBatchWriter":
+        self._session_stack = ExitStack()
+        self._session = self._session_stack.enter_context(self.client.session())
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        try:
+            if exc_type is None:
+                self.flush()
+        finally:
+            self._session_stack.close()
+            self._session = None
+
+    def add(self, content_data: dict[str, Any], keywords: list[str], source_id: Any) -> None:
+        """Buffer one content row with its keywords; comments are loaded on flush."""
+        content_data = {
+            **content_data,
+            "syncHash": _sync_hash({**content_data, "keywords": sorted(set(keywords))}),
+        }
+        self._contents.append(content_data)
+        self._keywords.extend(
+            {
+                "name": keyword,
+                "key": normalize_keyword(keyword),
+                "contentId": content_data["contentId"],
+                "platform": self.platform,
+            }
+            for keyword in keywords
+            if keyword
+        )
+        self._source_ids.append(source_id)
+        if len(self._contents) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all buffered rows as one chunk."""
+        if not self._contents:
+            return
+
+        contents, keywords, source_ids = self._contents, self._keywords, self._source_ids
+        self._contents, self._keywords, self._source_ids = [], [], []
+        # Platforms sync in parallel and share MediaKeyword nodes. Locking
+        # keywords in name order keeps concurrent chunks from deadlocking;
+        # any remaining transient conflict is retried by execute_write.
+        keywords.sort(key=lambda row: row["name"])
+
+        started = time.perf_counter()
+        try:
+            comments = [
+                {**row, "syncHash": _sync_hash(row)}
+                for row in self.load_comments(source_ids)
+            ]
+            written_contents, written_keywords, written_comments, linked = (
+                self._session.execute_write(
+                    _write_chunk_tx, self.platform, contents, keywords, comments
+                )
+            )
+        except Exception as e:
+            logger.error(
+                f"Error writing {self.platform} chunk of {len(contents)} rows: {e}"
+            )
+            raise
+        elapsed = time.perf_counter() - started
+        # Imported here: keyword_autocomplete imports normalize_keyword from this module
+        from services.keyword_autocomplete import update_autocomplete_counts
+
+        update_autocomplete_counts(record_keyword_links(self.platform, linked))
+
+        counts = {
+            "content_synced": len(written_contents),
+            "content_skipped": len(contents) - len(written_contents),
+            "keywords_synced": len(written_keywords),
+            "comments_synced": len(written_comments),
+            "comments_skipped": len(comments) - len(written_comments),
+        }
+        for key, value in counts.items():
+            setattr(self, key, getattr(self, key) + value)
+        self.chunks_written += 1
+        self.elapsed += elapsed
+
+        rate = len(contents) / elapsed if elapsed > 0 else float(len(contents))
+        self.chunk_rates.append(rate)
+        logger.info(
+            f"[{self.platform}] chunk {self.chunks_written}: "
+            f"{counts['content_synced']}/{len(contents)} contents, "
+            f"{counts['keywords_synced']} keywords, "
+            f"{counts['comments_synced']}/{len(comments)} comments written "
+            f"in {elapsed:.2f}s ({rate:.0f} rows/s)"
+        )
+
+        if self.on_commit:
+            self.on_commit(counts)
+
+    def result(self) -> dict[str, Any]:
+        """Summarize what was written, including per-chunk throughput."""
+        return {
+            **{key: getattr(self, key) for key in SYNC_COUNTER_KEYS},
+            "chunks": self.chunks_written,
+            "batch_size": self.batch_size,
+            "rows_per_second": {
+                "avg": (
+                    round((self.content_synced + self.content_skipped) / self.elapsed, 1)
+                    if self.elapsed
+                    else 0.0
+                ),
+                "min": round(min(self.chunk_rates), 1) if self.chunk_rates else 0.0,
+                "max": round(max(self.chunk_rates), 1) if self.chunk_rates else 0.0,
+            },
+        }
 
 
 def _safe_int(value: Any, default: int = 0) -> int:
@@ -289,520 +780,740 @@ def _serialize_node_properties(node) -> dict[str, Any]:
 
 
 # ============================================================================
-# Platform-Specific Sync Implementations
+# Incremental Sync State
 # ============================================================================
 
-def sync_bilibili_content(limit: int | None = None) -> dict[str, int]:
-    """Sync Bilibili videos and comments to Neo4j."""
-    from apps.media_crawl.models import BilibiliVideo, BilibiliVideoComment
+def get_sync_watermark(platform: str) -> dict[str, int] | None:
+    """
+    Get the stored high-water mark for a platform.
 
-    client = get_neo4j_client()
-    _ensure_platform_node(client, "bilibili", "Bilibili")
+    Returns:
+        Dict with "content" and "comment" last_modify_ts values, or None
+        if the platform has never completed a full sync.
+    """
+    return cache.get(SYNC_WATERMARK_CACHE_KEY.format(platform=platform))
 
-    videos = BilibiliVideo.objects.using("mysql").all()
-    if limit:
-        videos = videos[:limit]
 
-    content_synced = 0
-    keywords_synced = 0
-    comments_synced = 0
+def set_sync_watermark(platform: str, watermark: dict[str, int]) -> None:
+    """Store the high-water mark for a platform (never expires)."""
+    cache.set(SYNC_WATERMARK_CACHE_KEY.format(platform=platform), watermark, timeout=None)
 
-    with client.session() as session:
-        for video in videos:
-            try:
-                content_id = str(video.video_id)
-                content_data = {
-                    "contentId": content_id,
-                    "platform": "bilibili",
-                    "contentType": "video",
-                    "title": _safe_str(video.title),
-                    "author": _safe_str(video.nickname),
-                    "authorId": _safe_str(video.user_id),
-                    "url": _safe_str(video.video_url),
-                    "createTime": _timestamp_to_iso(video.create_time),
-                    "likedCount": _safe_int(video.liked_count),
-                    "commentCount": _safe_int(video.video_comment),
-                }
-                _sync_content_node(session, content_data)
-                content_synced += 1
-
-                # Extract and sync keywords
-                keywords = extract_keywords(
-                    video.source_keyword,
-                    video.title,
-                    video.desc,
-                )
-                keywords_synced += _sync_keyword_nodes(session, content_id, "bilibili", keywords)
-
-                # Sync comments for this video
-                comments = BilibiliVideoComment.objects.using("mysql").filter(video_id=video.video_id)[:50]
-                for comment in comments:
-                    comment_data = {
-                        "commentId": str(comment.comment_id),
-                        "platform": "bilibili",
-                        "contentId": content_id,
-                        "content": _safe_str(comment.content)[:500],
-                        "author": _safe_str(comment.nickname),
-                        "authorId": _safe_str(comment.user_id),
-                        "createTime": _timestamp_to_iso(comment.create_time),
-                        "likedCount": _safe_int(comment.like_count),
-                    }
-                    _sync_comment_node(session, comment_data)
-                    comments_synced += 1
 
-            except Exception as e:
-                logger.error(f"Error syncing Bilibili video {video.video_id}: {e}")
-                continue
+def get_sync_checkpoint(platform: str) -> dict[str, Any] | None:
+    """
+    Get the checkpoint of an unfinished platform sync.
 
-    return {
-        "content_synced": content_synced,
-        "keywords_synced": keywords_synced,
-        "comments_synced": comments_synced,
-    }
+    The checkpoint holds the watermark range being synced, the last primary
+    key committed to Neo4j, row progress and the counters written so far.
+    """
+    return cache.get(SYNC_CHECKPOINT_CACHE_KEY.format(platform=platform))
 
 
-def sync_douyin_content(limit: int | None = None) -> dict[str, int]:
-    """Sync Douyin awemes and comments to Neo4j."""
-    from apps.media_crawl.models import DouyinAweme, DouyinAwemeComment
+def set_sync_checkpoint(platform: str, checkpoint: dict[str, Any]) -> None:
+    """Store the checkpoint of an unfinished platform sync (never expires)."""
+    cache.set(SYNC_CHECKPOINT_CACHE_KEY.format(platform=platform), checkpoint, timeout=None)
 
-    client = get_neo4j_client()
-    _ensure_platform_node(client, "douyin", "抖音")
 
-    awemes = DouyinAweme.objects.using("mysql").all()
-    if limit:
-        awemes = awemes[:limit]
+def clear_sync_checkpoint(platform: str) -> None:
+    """Remove a platform checkpoint once its sync has finished."""
+    cache.delete(SYNC_CHECKPOINT_CACHE_KEY.format(platform=platform))
 
-    content_synced = 0
-    keywords_synced = 0
-    comments_synced = 0
 
-    with client.session() as session:
-        for aweme in awemes:
-            try:
-                content_id = str(aweme.aweme_id)
-                content_data = {
-                    "contentId": content_id,
-                    "platform": "douyin",
-                    "contentType": _safe_str(aweme.aweme_type) or "video",
-                    "title": _safe_str(aweme.title),
-                    "author": _safe_str(aweme.nickname),
-                    "authorId": _safe_str(aweme.user_id),
-                    "url": _safe_str(aweme.aweme_url),
-                    "createTime": _timestamp_to_iso(aweme.create_time),
-                    "likedCount": _safe_int(aweme.liked_count),
-                    "commentCount": _safe_int(aweme.comment_count),
-                }
-                _sync_content_node(session, content_data)
-                content_synced += 1
-
-                # Extract and sync keywords
-                keywords = extract_keywords(
-                    aweme.source_keyword,
-                    aweme.title,
-                    aweme.desc,
-                )
-                keywords_synced += _sync_keyword_nodes(session, content_id, "douyin", keywords)
-
-                # Sync comments
-                comments = DouyinAwemeComment.objects.using("mysql").filter(aweme_id=aweme.aweme_id)[:50]
-                for comment in comments:
-                    comment_data = {
-                        "commentId": str(comment.comment_id),
-                        "platform": "douyin",
-                        "contentId": content_id,
-                        "content": _safe_str(comment.content)[:500],
-                        "author": _safe_str(comment.nickname),
-                        "authorId": _safe_str(comment.user_id),
-                        "createTime": _timestamp_to_iso(comment.create_time),
-                        "likedCount": _safe_int(comment.like_count),
-                    }
-                    _sync_comment_node(session, comment_data)
-                    comments_synced += 1
+def get_sync_lock_timeout() -> int:
+    """Get how long a platform sync lock outlives its last renewal, in seconds."""
+    return max(60, int(getattr(settings, "MEDIA_NEO4J_SYNC_LOCK_TIMEOUT", 1800)))
 
-            except Exception as e:
-                logger.error(f"Error syncing Douyin aweme {aweme.aweme_id}: {e}")
-                continue
 
-    return {
-        "content_synced": content_synced,
-        "keywords_synced": keywords_synced,
-        "comments_synced": comments_synced,
-    }
+def acquire_sync_lock(platform: str) -> str | None:
+    """
+    Take the sync lock of a platform.
 
+    Returns:
+        Token identifying the run holding the lock, or None if another run
+        holds it
+    """
+    token = uuid.uuid4().hex
+    key = SYNC_LOCK_CACHE_KEY.format(platform=platform)
+    if cache.add(key, token, timeout=get_sync_lock_timeout()):
+        return token
+    return None
 
-def sync_kuaishou_content(limit: int | None = None) -> dict[str, int]:
-    """Sync Kuaishou videos and comments to Neo4j."""
-    from apps.media_crawl.models import KuaishouVideo, KuaishouVideoComment
 
-    client = get_neo4j_client()
-    _ensure_platform_node(client, "kuaishou", "快手")
+def renew_sync_lock(platform: str, token: str) -> bool:
+    """
+    Extend a platform sync lock held by the run with token.
 
-    videos = KuaishouVideo.objects.using("mysql").all()
-    if limit:
-        videos = videos[:limit]
+    Returns:
+        False if the lock expired or another run has taken it since
+    """
+    key = SYNC_LOCK_CACHE_KEY.format(platform=platform)
+    if cache.get(key) != token:
+        return False
+    cache.touch(key, timeout=get_sync_lock_timeout())
+    return True
 
-    content_synced = 0
-    keywords_synced = 0
-    comments_synced = 0
 
-    with client.session() as session:
-        for video in videos:
-            try:
-                content_id = str(video.video_id)
-                content_data = {
-                    "contentId": content_id,
-                    "platform": "kuaishou",
-                    "contentType": "video",
-                    "title": _safe_str(video.title),
-                    "author": _safe_str(video.nickname),
-                    "authorId": _safe_str(video.user_id),
-                    "url": _safe_str(video.video_url),
-                    "createTime": _timestamp_to_iso(video.create_time),
-                    "likedCount": _safe_int(video.liked_count),
-                    "commentCount": 0,
-                }
-                _sync_content_node(session, content_data)
-                content_synced += 1
-
-                # Extract and sync keywords
-                keywords = extract_keywords(
-                    video.source_keyword,
-                    video.title,
-                    video.desc,
-                )
-                keywords_synced += _sync_keyword_nodes(session, content_id, "kuaishou", keywords)
-
-                # Sync comments
-                comments = KuaishouVideoComment.objects.using("mysql").filter(video_id=video.video_id)[:50]
-                for comment in comments:
-                    comment_data = {
-                        "commentId": str(comment.comment_id),
-                        "platform": "kuaishou",
-                        "contentId": content_id,
-                        "content": _safe_str(comment.content)[:500],
-                        "author": _safe_str(comment.nickname),
-                        "authorId": _safe_str(comment.user_id),
-                        "createTime": _timestamp_to_iso(comment.create_time),
-                        "likedCount": 0,
-                    }
-                    _sync_comment_node(session, comment_data)
-                    comments_synced += 1
+def release_sync_lock(platform: str, token: str) -> None:
+    """Release a platform sync lock if the run with token still holds it."""
+    key = SYNC_LOCK_CACHE_KEY.format(platform=platform)
+    if cache.get(key) == token:
+        cache.delete(key)
 
-            except Exception as e:
-                logger.error(f"Error syncing Kuaishou video {video.video_id}: {e}")
-                continue
 
-    return {
-        "content_synced": content_synced,
-        "keywords_synced": keywords_synced,
-        "comments_synced": comments_synced,
-    }
+def set_sync_progress(platform: str, processed: int, total: int, state: str) -> None:
+    """Record row progress of a platform in the current sync."""
+    cache.set(
+        SYNC_PROGRESS_CACHE_KEY.format(platform=platform),
+        {"processed": processed, "total": total, "state": state},
+        timeout=3600,  # 1 hour
+    )
 
 
-def sync_weibo_content(limit: int | None = None) -> dict[str, int]:
-    """Sync Weibo notes and comments to Neo4j."""
-    from apps.media_crawl.models import WeiboNote, WeiboNoteComment
+def reset_sync_progress(platforms: list[str]) -> None:
+    """Mark platforms as pending at the start of a new sync run."""
+    cache.set_many(
+        {
+            SYNC_PROGRESS_CACHE_KEY.format(platform=p): {
+                "processed": 0,
+                "total": 0,
+                "state": "pending",
+            }
+            for p in platforms
+        },
+        timeout=3600,  # 1 hour
+    )
 
-    client = get_neo4j_client()
-    _ensure_platform_node(client, "weibo", "微博")
 
-    notes = WeiboNote.objects.using("mysql").all()
-    if limit:
-        notes = notes[:limit]
+def get_sync_run(task_id: str) -> dict[str, Any]:
+    """Get the platform results already completed by a sync task run."""
+    return cache.get(SYNC_RUN_CACHE_KEY.format(task_id=task_id)) or {}
 
-    content_synced = 0
-    keywords_synced = 0
-    comments_synced = 0
 
-    with client.session() as session:
-        for note in notes:
-            try:
-                content_id = str(note.note_id)
-                content_data = {
-                    "contentId": content_id,
-                    "platform": "weibo",
-                    "contentType": "note",
-                    "title": _safe_str(note.content)[:100],  # Use content start as title
-                    "author": _safe_str(note.nickname),
-                    "authorId": _safe_str(note.user_id),
-                    "url": _safe_str(note.note_url),
-                    "createTime": _timestamp_to_iso(note.create_time),
-                    "likedCount": _safe_int(note.liked_count),
-                    "commentCount": _safe_int(note.comments_count),
-                }
-                _sync_content_node(session, content_data)
-                content_synced += 1
-
-                # Extract keywords (Weibo uses content as main text)
-                keywords = extract_keywords(
-                    note.source_keyword,
-                    note.content,
-                    None,
-                )
-                keywords_synced += _sync_keyword_nodes(session, content_id, "weibo", keywords)
-
-                # Sync comments
-                comments = WeiboNoteComment.objects.using("mysql").filter(note_id=note.note_id)[:50]
-                for comment in comments:
-                    comment_data = {
-                        "commentId": str(comment.comment_id),
-                        "platform": "weibo",
-                        "contentId": content_id,
-                        "content": _safe_str(comment.content)[:500],
-                        "author": _safe_str(comment.nickname),
-                        "authorId": _safe_str(comment.user_id),
-                        "createTime": _timestamp_to_iso(comment.create_time),
-                        "likedCount": _safe_int(comment.comment_like_count),
-                    }
-                    _sync_comment_node(session, comment_data)
-                    comments_synced += 1
+def set_sync_run(task_id: str, completed: dict[str, Any]) -> None:
+    """Store the platform results completed by a sync task run."""
+    cache.set(SYNC_RUN_CACHE_KEY.format(task_id=task_id), completed, timeout=86400)
 
-            except Exception as e:
-                logger.error(f"Error syncing Weibo note {note.note_id}: {e}")
-                continue
 
+def clear_sync_run(task_id: str) -> None:
+    """Remove the run state once a sync task has finished."""
+    cache.delete(SYNC_RUN_CACHE_KEY.format(task_id=task_id))
+
+
+def _current_watermark(content_model, comment_model) -> dict[str, int]:
+    """Capture the current max last_modify_ts of a platform's content and comment tables."""
     return {
-        "content_synced": content_synced,
-        "keywords_synced": keywords_synced,
-        "comments_synced": comments_synced,
+        "content": content_model.objects.using("mysql").aggregate(
+            ts=Max("last_modify_ts")
+        )["ts"] or 0,
+        "comment": comment_model.objects.using("mysql").aggregate(
+            ts=Max("last_modify_ts")
+        )["ts"] or 0,
     }
 
 
-def sync_tieba_content(limit: int | None = None) -> dict[str, int]:
-    """Sync Tieba notes and comments to Neo4j."""
-    from apps.media_crawl.models import TiebaNote, TiebaComment
+def _changed_since(
+    queryset,
+    comment_model,
+    id_field: str,
+    join_field: str,
+    since: dict[str, int] | None,
+):
+    """
+    Restrict a content queryset to rows changed after a watermark.
 
-    client = get_neo4j_client()
-    _ensure_platform_node(client, "tieba", "贴吧")
+    A content row is included when it was modified itself, or when any of its
+    comments was modified, so changed comments are re-synced with their parent.
 
-    notes = TiebaNote.objects.using("mysql").all()
-    if limit:
-        notes = notes[:limit]
+    Args:
+        queryset: Content queryset to filter
+        comment_model: Comment model of the platform
+        id_field: Content id field on the content model
+        join_field: Field on the comment model referencing id_field
+        since: Watermark from get_sync_watermark(), or None for all rows
+    """
+    if not since:
+        return queryset
+
+    changed_comments = comment_model.objects.using("mysql").filter(
+        last_modify_ts__gt=since.get("comment", 0),
+    ).values(join_field)
+    return queryset.filter(
+        Q(last_modify_ts__gt=since.get("content", 0))
+        | Q(**{f"{id_field}__in": changed_comments})
+    )
 
-    content_synced = 0
-    keywords_synced = 0
-    comments_synced = 0
 
-    with client.session() as session:
-        for note in notes:
-            try:
-                content_id = str(note.note_id)
-                content_data = {
-                    "contentId": content_id,
-                    "platform": "tieba",
-                    "contentType": "post",
-                    "title": _safe_str(note.title),
-                    "author": _safe_str(note.user_nickname),
-                    "authorId": "",  # Tieba uses user_link instead
-                    "url": _safe_str(note.note_url),
-                    "createTime": _safe_str(note.publish_time),
-                    "likedCount": 0,
-                    "commentCount": _safe_int(note.total_replay_num),
-                }
-                _sync_content_node(session, content_data)
-                content_synced += 1
-
-                # Extract keywords (include tieba_name as keyword)
-                keywords = extract_keywords(
-                    note.source_keyword,
-                    note.title,
-                    note.desc,
-                )
-                if note.tieba_name:
-                    keywords.append(note.tieba_name.lower())
-                keywords_synced += _sync_keyword_nodes(session, content_id, "tieba", keywords)
-
-                # Sync comments
-                comments = TiebaComment.objects.using("mysql").filter(note_id=note.note_id)[:50]
-                for comment in comments:
-                    comment_data = {
-                        "commentId": str(comment.comment_id),
-                        "platform": "tieba",
-                        "contentId": content_id,
-                        "content": _safe_str(comment.content)[:500],
-                        "author": _safe_str(comment.user_nickname),
-                        "authorId": "",
-                        "createTime": _safe_str(comment.publish_time),
-                        "likedCount": 0,
-                    }
-                    _sync_comment_node(session, comment_data)
-                    comments_synced += 1
+# ============================================================================
+# Platform Sync Specs
+# ============================================================================
 
-            except Exception as e:
-                logger.error(f"Error syncing Tieba note {note.note_id}: {e}")
-                continue
+# Property defaults for fields a platform does not provide
+CONTENT_FIELD_DEFAULTS: dict[str, Any] = {
+    "title": "",
+    "author": "",
+    "authorId": "",
+    "url": "",
+    "createTime": "",
+    "likedCount": 0,
+    "commentCount": 0,
+}
 
-    return {
-        "content_synced": content_synced,
-        "keywords_synced": keywords_synced,
-        "comments_synced": comments_synced,
-    }
+COMMENT_FIELD_DEFAULTS: dict[str, Any] = {
+    "author": "",
+    "authorId": "",
+    "createTime": "",
+    "likedCount": 0,
+}
 
 
-def sync_zhihu_content(limit: int | None = None) -> dict[str, int]:
-    """Sync Zhihu content and comments to Neo4j."""
-    from apps.media_crawl.models import ZhihuContent, ZhihuComment
+def _excerpt(value: Any) -> str:
+    """Use the start of a long text as a title."""
+    return _safe_str(value)[:100]
 
-    client = get_neo4j_client()
-    _ensure_platform_node(client, "zhihu", "知乎")
 
-    contents = ZhihuContent.objects.using("mysql").all()
-    if limit:
-        contents = contents[:limit]
+@dataclass(frozen=True)
+class PlatformSyncSpec:
+    """
+    Declarative mapping from a platform's MySQL tables to the media graph.
+
+    Field maps go from graph property name to (source column, converter).
+    Properties missing from a map fall back to CONTENT_FIELD_DEFAULTS or
+    COMMENT_FIELD_DEFAULTS. Only the columns named here are read from MySQL.
+
+    Attributes:
+        platform: Platform name used in the graph (MediaContent.platform)
+        display_name: Display name for the MediaPlatform node
+        content_model: media_crawl model name of the content table
+        comment_model: media_crawl model name of the comment table
+        id_field: Content id column on the content table
+        comment_join_field: Column on the comment table referencing id_field
+        content_type: Default contentType
+        content_fields: Content property map
+        comment_fields: Comment property map (commentId and content are implicit)
+        content_type_field: Column overriding content_type when non-empty
+        keyword_sources: extract_keywords() argument name -> source column
+        extra_keyword_fields: Columns whose value is added as a keyword as-is
+    """
 
-    content_synced = 0
-    keywords_synced = 0
-    comments_synced = 0
+    platform: str
+    display_name: str
+    content_model: str
+    comment_model: str
+    id_field: str
+    comment_join_field: str
+    content_type: str
+    content_fields: dict[str, tuple[str, Callable[[Any], Any]]]
+    comment_fields: dict[str, tuple[str, Callable[[Any], Any]]]
+    content_type_field: str | None = None
+    keyword_sources: dict[str, str] = field(
+        default_factory=lambda: {
+            "source_keyword": "source_keyword",
+            "title": "title",
+            "desc": "desc",
+        }
+    )
+    extra_keyword_fields: tuple[str, ...] = ()
+
+    def get_models(self):
+        """Resolve the content and comment model classes."""
+        return (
+            apps.get_model("media_crawl", self.content_model),
+            apps.get_model("media_crawl", self.comment_model),
+        )
+
+    @property
+    def content_columns(self) -> list[str]:
+        """Columns projected from the content table."""
+        columns = [self.id_field]
+        columns += [column for column, _ in self.content_fields.values()]
+        columns += list(self.keyword_sources.values())
+        columns += list(self.extra_keyword_fields)
+        if self.content_type_field:
+            columns.append(self.content_type_field)
+        return list(dict.fromkeys(columns))
+
+    @property
+    def comment_columns(self) -> list[str]:
+        """Columns projected from the comment table."""
+        columns = ["comment_id", "content", self.comment_join_field]
+        columns += [column for column, _ in self.comment_fields.values()]
+        return list(dict.fromkeys(columns))
+
+    @property
+    def comment_like_field(self) -> str | None:
+        """Like count column used to rank comments, if any."""
+        return self.comment_fields.get("likedCount", (None,))[0]
+
+    @property
+    def comment_time_field(self) -> str:
+        """Creation time column used to rank comments."""
+        return self.comment_fields.get("createTime", ("create_time",))[0]
+
+    def map_content(self, row: dict[str, Any]) -> dict[str, Any]:
+        """Map a projected content row to MediaContent properties."""
+        content_type = self.content_type
+        if self.content_type_field:
+            content_type = _safe_str(row[self.content_type_field]) or content_type
+
+        data = {
+            "contentId": str(row[self.id_field]),
+            "platform": self.platform,
+            "contentType": content_type,
+            **CONTENT_FIELD_DEFAULTS,
+        }
+        for prop, (column, convert) in self.content_fields.items():
+            data[prop] = convert(row[column])
+        return data
+
+    def map_comment(self, row: dict[str, Any]) -> dict[str, Any]:
+        """Map a projected comment row to MediaComment properties."""
+        data = {
+            "commentId": str(row["comment_id"]),
+            "platform": self.platform,
+            "contentId": str(row[self.comment_join_field]),
+            "content": _safe_str(row["content"])[:500],
+            **COMMENT_FIELD_DEFAULTS,
+        }
+        for prop, (column, convert) in self.comment_fields.items():
+            data[prop] = convert(row[column])
+        return data
+
+    def extract_keywords(self, row: dict[str, Any]) -> list[str]:
+        """Extract keywords from a projected content row."""
+        sources = {"source_keyword": None, "title": None, "desc": None}
+        sources.update({arg: row[column] for arg, column in self.keyword_sources.items()})
+        keywords = extract_keywords(**sources)
+        for column in self.extra_keyword_fields:
+            keyword = _safe_str(row[column]).strip().lower()
+            if keyword and keyword not in keywords:
+                keywords.append(keyword)
+        return keywords
+
+
+PLATFORM_SYNC_SPECS: list[PlatformSyncSpec] = [
+    PlatformSyncSpec(
+        platform="bilibili",
+        display_name="Bilibili",
+        content_model="BilibiliVideo",
+        comment_model="BilibiliVideoComment",
+        id_field="video_id",
+        comment_join_field="video_id",
+        content_type="video",
+        content_fields={
+            "title": ("title", _safe_str),
+            "author": ("nickname", _safe_str),
+            "authorId": ("user_id", _safe_str),
+            "url": ("video_url", _safe_str),
+            "createTime": ("create_time", _timestamp_to_iso),
+            "likedCount": ("liked_count", _safe_int),
+            "commentCount": ("video_comment", _safe_int),
+        },
+        comment_fields={
+            "author": ("nickname", _safe_str),
+            "authorId": ("user_id", _safe_str),
+            "createTime": ("create_time", _timestamp_to_iso),
+            "likedCount": ("like_count", _safe_int),
+        },
+    ),
+    PlatformSyncSpec(
+        platform="douyin",
+        display_name="抖音",
+        content_model="DouyinAweme",
+        comment_model="DouyinAwemeComment",
+        id_field="aweme_id",
+        comment_join_field="aweme_id",
+        content_type="video",
+        content_type_field="aweme_type",
+        content_fields={
+            "title": ("title", _safe_str),
+            "author": ("nickname", _safe_str),
+            "authorId": ("user_id", _safe_str),
+            "url": ("aweme_url", _safe_str),
+            "createTime": ("create_time", _timestamp_to_iso),
+            "likedCount": ("liked_count", _safe_int),
+            "commentCount": ("comment_count", _safe_int),
+        },
+        comment_fields={
+            "author": ("nickname", _safe_str),
+            "authorId": ("user_id", _safe_str),
+            "createTime": ("create_time", _timestamp_to_iso),
+            "likedCount": ("like_count", _safe_int),
+        },
+    ),
+    PlatformSyncSpec(
+        platform="kuaishou",
+        display_name="快手",
+        content_model="KuaishouVideo",
+        comment_model="KuaishouVideoComment",
+        id_field="video_id",
+        comment_join_field="video_id",
+        content_type="video",
+        content_fields={
+            "title": ("title", _safe_str),
+            "author": ("nickname", _safe_str),
+            "authorId": ("user_id", _safe_str),
+            "url": ("video_url", _safe_str),
+            "createTime": ("create_time", _timestamp_to_iso),
+            "likedCount": ("liked_count", _safe_int),
+        },
+        comment_fields={
+            "author": ("nickname", _safe_str),
+            "authorId": ("user_id", _safe_str),
+            "createTime": ("create_time", _timestamp_to_iso),
+        },
+    ),
+    PlatformSyncSpec(
+        platform="weibo",
+        display_name="微博",
+        content_model="WeiboNote",
+        comment_model="WeiboNoteComment",
+        id_field="note_id",
+        comment_join_field="note_id",
+        content_type="note",
+        content_fields={
+            "title": ("content", _excerpt),  # Use content start as title
+            "author": ("nickname", _safe_str),
+            "authorId": ("user_id", _safe_str),
+            "url": ("note_url", _safe_str),
+            "createTime": ("create_time", _timestamp_to_iso),
+            "likedCount": ("liked_count", _safe_int),
+            "commentCount": ("comments_count", _safe_int),
+        },
+        comment_fields={
+            "author": ("nickname", _safe_str),
+            "authorId": ("user_id", _safe_str),
+            "createTime": ("create_time", _timestamp_to_iso),
+            "likedCount": ("comment_like_count", _safe_int),
+        },
+        # Weibo uses content as main text
+        keyword_sources={"source_keyword": "source_keyword", "title": "content"},
+    ),
+    PlatformSyncSpec(
+        platform="xhs",
+        display_name="小红书",
+        content_model="XhsNote",
+        comment_model="XhsNoteComment",
+        id_field="note_id",
+        comment_join_field="note_id",
+        content_type="note",
+        content_type_field="type",
+        content_fields={
+            "title": ("title", _safe_str),
+            "author": ("nickname", _safe_str),
+            "authorId": ("user_id", _safe_str),
+            "url": ("note_url", _safe_str),
+            "createTime": ("time", _timestamp_to_iso),
+            "likedCount": ("liked_count", _safe_int),
+            "commentCount": ("comment_count", _safe_int),
+        },
+        comment_fields={
+            "author": ("nickname", _safe_str),
+            "authorId": ("user_id", _safe_str),
+            "createTime": ("create_time", _timestamp_to_iso),
+            "likedCount": ("like_count", _safe_int),
+        },
+        keyword_sources={
+            "source_keyword": "source_keyword",
+            "title": "title",
+            "desc": "desc",
+            "tag_list": "tag_list",
+        },
+    ),
+    PlatformSyncSpec(
+        platform="tieba",
+        display_name="贴吧",
+        content_model="TiebaNote",
+        comment_model="TiebaComment",
+        id_field="note_id",
+        comment_join_field="note_id",
+        content_type="post",
+        content_fields={
+            "title": ("title", _safe_str),
+            "author": ("user_nickname", _safe_str),
+            "url": ("note_url", _safe_str),
+            "createTime": ("publish_time", _safe_str),
+            "commentCount": ("total_replay_num", _safe_int),
+        },
+        comment_fields={
+            "author": ("user_nickname", _safe_str),
+            "createTime": ("publish_time", _safe_str),
+        },
+        extra_keyword_fields=("tieba_name",),
+    ),
+    PlatformSyncSpec(
+        platform="zhihu",
+        display_name="知乎",
+        content_model="ZhihuContent",
+        comment_model="ZhihuComment",
+        id_field="content_id",
+        comment_join_field="content_id",
+        content_type="answer",
+        content_type_field="content_type",
+        content_fields={
+            "title": ("title", _safe_str),
+            "author": ("user_nickname", _safe_str),
+            "authorId": ("user_id", _safe_str),
+            "url": ("content_url", _safe_str),
+            "createTime": ("created_time", _safe_str),
+            "likedCount": ("voteup_count", _safe_int),
+            "commentCount": ("comment_count", _safe_int),
+        },
+        comment_fields={
+            "author": ("user_nickname", _safe_str),
+            "authorId": ("user_id", _safe_str),
+            "createTime": ("publish_time", _safe_str),
+            "likedCount": ("like_count", _safe_int),
+        },
+    ),
+]
 
-    with client.session() as session:
-        for content in contents:
-            try:
-                content_id = str(content.content_id)
-                content_data = {
-                    "contentId": content_id,
-                    "platform": "zhihu",
-                    "contentType": _safe_str(content.content_type) or "answer",
-                    "title": _safe_str(content.title),
-                    "author": _safe_str(content.user_nickname),
-                    "authorId": _safe_str(content.user_id),
-                    "url": _safe_str(content.content_url),
-                    "createTime": _safe_str(content.created_time),
-                    "likedCount": _safe_int(content.voteup_count),
-                    "commentCount": _safe_int(content.comment_count),
-                }
-                _sync_content_node(session, content_data)
-                content_synced += 1
-
-                # Extract keywords
-                keywords = extract_keywords(
-                    content.source_keyword,
-                    content.title,
-                    content.desc,
-                )
-                keywords_synced += _sync_keyword_nodes(session, content_id, "zhihu", keywords)
-
-                # Sync comments
-                comments = ZhihuComment.objects.using("mysql").filter(content_id=content.content_id)[:50]
-                for comment in comments:
-                    comment_data = {
-                        "commentId": str(comment.comment_id),
-                        "platform": "zhihu",
-                        "contentId": content_id,
-                        "content": _safe_str(comment.content)[:500],
-                        "author": _safe_str(comment.user_nickname),
-                        "authorId": _safe_str(comment.user_id),
-                        "createTime": _safe_str(comment.publish_time),
-                        "likedCount": _safe_int(comment.like_count),
-                    }
-                    _sync_comment_node(session, comment_data)
-                    comments_synced += 1
 
-            except Exception as e:
-                logger.error(f"Error syncing Zhihu content {content.content_id}: {e}")
-                continue
+# ============================================================================
+# Generic Platform Sync
+# ============================================================================
 
-    return {
-        "content_synced": content_synced,
-        "keywords_synced": keywords_synced,
-        "comments_synced": comments_synced,
-    }
+def _iter_rows_by_pk(
+    queryset,
+    columns: list[str],
+    page_size: int,
+    limit: int | None = None,
+    after_pk: Any = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Stream projected rows in primary key order with keyset pagination.
 
+    Each page is a separate "WHERE pk > last ORDER BY pk LIMIT n" query, so
+    neither Django nor the MySQL client holds more than one page in memory.
 
-# ============================================================================
-# Main Sync Functions
-# ============================================================================
+    Args:
+        queryset: Source queryset (filters are kept, ordering is replaced)
+        columns: Columns to project; "pk" is always included
+        page_size: Rows per page
+        limit: Stop after this many rows
+        after_pk: Resume after this primary key
+    """
+    queryset = queryset.order_by("pk").values("pk", *columns)
+    last_pk = after_pk
+    remaining = limit
 
-def sync_xhs_content(limit: int | None = None) -> dict[str, int]:
-    """Sync Xiaohongshu (XHS) notes and comments to Neo4j."""
-    from apps.media_crawl.models import XhsNote, XhsNoteComment
+    while remaining is None or remaining > 0:
+        size = page_size if remaining is None else min(page_size, remaining)
+        page = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        rows = list(page[:size])
+        if not rows:
+            return
 
-    client = get_neo4j_client()
-    _ensure_platform_node(client, "xhs", "小红书")
+        yield from rows
 
-    notes = XhsNote.objects.using("mysql").all()
-    if limit:
-        notes = notes[:limit]
+        last_pk = rows[-1]["pk"]
+        if remaining is not None:
+            remaining -= len(rows)
+        if len(rows) < size:
+            return
 
-    content_synced = 0
-    keywords_synced = 0
-    comments_synced = 0
 
-    with client.session() as session:
-        for note in notes:
-            try:
-                content_id = str(note.note_id)
-                content_data = {
-                    "contentId": content_id,
-                    "platform": "xhs",
-                    "contentType": _safe_str(note.type) or "note",
-                    "title": _safe_str(note.title),
-                    "author": _safe_str(note.nickname),
-                    "authorId": _safe_str(note.user_id),
-                    "url": _safe_str(note.note_url),
-                    "createTime": _timestamp_to_iso(note.time),
-                    "likedCount": _safe_int(note.liked_count),
-                    "commentCount": _safe_int(note.comment_count),
-                }
-                _sync_content_node(session, content_data)
-                content_synced += 1
-
-                # Extract keywords (XHS has tag_list)
-                keywords = extract_keywords(
-                    note.source_keyword,
-                    note.title,
-                    note.desc,
-                    note.tag_list,
-                )
-                keywords_synced += _sync_keyword_nodes(session, content_id, "xhs", keywords)
-
-                # Sync comments
-                comments = XhsNoteComment.objects.using("mysql").filter(note_id=note.note_id)[:50]
-                for comment in comments:
-                    comment_data = {
-                        "commentId": str(comment.comment_id),
-                        "platform": "xhs",
-                        "contentId": content_id,
-                        "content": _safe_str(comment.content)[:500],
-                        "author": _safe_str(comment.nickname),
-                        "authorId": _safe_str(comment.user_id),
-                        "createTime": _timestamp_to_iso(comment.create_time),
-                        "likedCount": _safe_int(comment.like_count),
-                    }
-                    _sync_comment_node(session, comment_data)
-                    comments_synced += 1
+def sync_platform_spec(
+    spec: PlatformSyncSpec,
+    limit: int | None = None,
+    batch_size: int | None = None,
+    full: bool = False,
+    on_chunk_commit: Callable[[dict[str, int]], None] | None = None,
+) -> dict[str, Any]:
+    """
+    Sync one platform's contents, keywords and comments to Neo4j.
+
+    Source rows are streamed in primary key order, one keyset page per
+    write chunk, so memory stays flat regardless of table size.
+
+    Only rows changed since the platform's high-water mark are synced unless
+    full is set. Unlimited runs checkpoint the last committed primary key
+    after every chunk; if a run fails, the next run for the platform resumes
+    from that checkpoint with the same watermark range. The high-water mark
+    is advanced only once the run has finished.
+
+    A run holds the platform's sync lock from start to finish and renews it
+    with every chunk, so two runs never write the same checkpoint. A run
+    that finds the lock taken, or loses it, fails with SyncError and leaves
+    the checkpoint to the holder.
+
+    Args:
+        spec: Platform sync spec
+        limit: Maximum content items (the first N by primary key)
+        batch_size: Content rows per write chunk
+        full: Ignore the high-water mark (and any incremental checkpoint)
+        on_chunk_commit: Called with each committed chunk's counters, also
+                         for chunks committed before the run fails
+
+    Returns:
+        Sync summary for the platform
+
+    Raises:
+        SyncError: If another run holds the platform's sync lock
+    """
+    token = acquire_sync_lock(spec.platform)
+    if token is None:
+        raise SyncError(f"A {spec.platform} sync is already running")
+    try:
+        return _sync_platform_spec(spec, token, limit, batch_size, full, on_chunk_commit)
+    finally:
+        release_sync_lock(spec.platform, token)
+
+
+def _sync_platform_spec(
+    spec: PlatformSyncSpec,
+    token: str,
+    limit: int | None,
+    batch_size: int | None,
+    full: bool,
+    on_chunk_commit: Callable[[dict[str, int]], None] | None,
+) -> dict[str, Any]:
+    """Run sync_platform_spec while holding the platform's sync lock (token)."""
+    platform = spec.platform
+    content_model, comment_model = spec.get_models()
+
+    client = get_neo4j_client()
+    _ensure_platform_node(client, platform, spec.display_name)
+    batch_size = batch_size or get_sync_batch_size()
+
+    checkpoint = None if limit else get_sync_checkpoint(platform)
+    if checkpoint and full and checkpoint["since"] is not None:
+        checkpoint = None
+    resumed = checkpoint is not None
+
+    if checkpoint:
+        since = checkpoint["since"]
+        logger.info(
+            f"Resuming {platform} sync after pk {checkpoint['last_pk']} "
+            f"({checkpoint['processed']}/{checkpoint['total']} rows done)"
+        )
+    else:
+        since = None if full else get_sync_watermark(platform)
+
+    queryset = _changed_since(
+        content_model.objects.using("mysql").all(),
+        comment_model,
+        spec.id_field,
+        spec.comment_join_field,
+        since,
+    )
 
+    if not checkpoint:
+        total = queryset.count()
+        checkpoint = {
+            "since": since,
+            "watermark": _current_watermark(content_model, comment_model),
+            "last_pk": None,
+            "processed": 0,
+            "total": min(total, limit) if limit else total,
+            "synced": {key: 0 for key in SYNC_COUNTER_KEYS},
+        }
+    set_sync_progress(platform, checkpoint["processed"], checkpoint["total"], "running")
+
+    rows = _iter_rows_by_pk(
+        queryset,
+        spec.content_columns,
+        batch_size,
+        limit,
+        after_pk=checkpoint["last_pk"],
+    )
+    last_pk = checkpoint["last_pk"]
+    processed = checkpoint["processed"]
+
+    def load_comments(content_ids: list) -> list[dict[str, Any]]:
+        comments = _load_top_comments(
+            comment_model,
+            spec.comment_join_field,
+            content_ids,
+            spec.comment_columns,
+            like_field=spec.comment_like_field,
+            time_field=spec.comment_time_field,
+        )
+        return [spec.map_comment(row) for group in comments.values() for row in group]
+
+    def on_commit(counts: dict[str, int]) -> None:
+        if not renew_sync_lock(platform, token):
+            raise SyncError(f"Lost the {platform} sync lock to another run")
+        # Chunks are flushed right after the row that filled them was read,
+        # so every row read so far is now committed.
+        checkpoint["last_pk"] = last_pk
+        checkpoint["processed"] = processed
+        for key, value in counts.items():
+            checkpoint["synced"][key] = checkpoint["synced"].get(key, 0) + value
+        if not limit:
+            set_sync_checkpoint(platform, checkpoint)
+        set_sync_progress(platform, processed, checkpoint["total"], "running")
+        if on_chunk_commit:
+            on_chunk_commit(counts)
+
+    with MediaBatchWriter(
+        client, platform, load_comments, batch_size, on_commit=on_commit
+    ) as writer:
+        for row in rows:
+            last_pk = row["pk"]
+            processed += 1
+            try:
+                content_data = spec.map_content(row)
+                keywords = spec.extract_keywords(row)
             except Exception as e:
-                logger.error(f"Error syncing XHS note {note.note_id}: {e}")
+                logger.error(
+                    f"Error syncing {spec.display_name} content {row.get(spec.id_field)}: {e}"
+                )
                 continue
+            writer.add(content_data, keywords, row[spec.id_field])
+
+    # Rows skipped at the end of the table never trigger a chunk commit
+    checkpoint["last_pk"] = last_pk
+    checkpoint["processed"] = processed
+
+    if not renew_sync_lock(platform, token):
+        raise SyncError(f"Lost the {platform} sync lock to another run")
+    if not limit:
+        set_sync_watermark(platform, checkpoint["watermark"])
+        clear_sync_checkpoint(platform)
+    set_sync_progress(platform, processed, checkpoint["total"], "done")
 
     return {
-        "content_synced": content_synced,
-        "keywords_synced": keywords_synced,
-        "comments_synced": comments_synced,
+        **writer.result(),
+        **checkpoint["synced"],
+        "rows_processed": processed,
+        "rows_total": checkpoint["total"],
+        "mode": "incremental" if since else "full",
+        "resumed": resumed,
     }
 
 
-PLATFORM_SYNC_FUNCTIONS = {
-    "bilibili": sync_bilibili_content,
-    "douyin": sync_douyin_content,
-    "kuaishou": sync_kuaishou_content,
-    "weibo": sync_weibo_content,
-    "xhs": sync_xhs_content,
-    "tieba": sync_tieba_content,
-    "zhihu": sync_zhihu_content,
-}
+PLATFORM_SYNC_FUNCTIONS: dict[str, Callable[..., dict[str, Any]]] = {}
+
+
+def register_platform_spec(spec: PlatformSyncSpec) -> None:
+    """Register a platform so sync_platform_content can sync it."""
+    PLATFORM_SYNC_FUNCTIONS[spec.platform] = partial(sync_platform_spec, spec)
+    if spec.platform not in SUPPORTED_PLATFORMS:
+        SUPPORTED_PLATFORMS.append(spec.platform)
+
+
+for _spec in PLATFORM_SYNC_SPECS:
+    register_platform_spec(_spec)
 
 
 def sync_platform_content(
     platform: str | None = None,
     limit: int | None = None,
+    batch_size: int | None = None,
+    full: bool = False,
 ) -> dict[str, Any]:
     """
     Sync media content to Neo4j.
 
+    By default only rows whose last_modify_ts (or whose comments' last_modify_ts)
+    is newer than the platform's stored high-water mark are synced. A platform
+    whose previous sync failed resumes from its last committed chunk.
+
     Args:
         platform: Platform name (bilibili, douyin, etc.) or None for all platforms
-        limit: Maximum content items per platform
+        limit: Maximum content items per platform (the first N by primary key)
+        batch_size: Content rows per write chunk (defaults to MEDIA_NEO4J_SYNC_BATCH_SIZE)
+        full: Ignore stored high-water marks and re-sync every row
 
     Returns:
         Summary of sync operation
@@ -811,14 +1522,20 @@ def sync_platform_content(
     """
     results: dict[str, Any] = {
         "platforms": {},
-        "totals": {
-            "content_synced": 0,
-            "keywords_synced": 0,
-            "comments_synced": 0,
-        },
+        "totals": {key: 0 for key in SYNC_COUNTER_KEYS},
     }
 
     platforms_to_sync = [platform] if platform else SUPPORTED_PLATFORMS
+    ensure_schema()
+
+    # Set by any committed chunk that wrote, including chunks of a platform
+    # that fails later and so never reports totals
+    wrote_any = False
+
+    def on_chunk_commit(counts: dict[str, int]) -> None:
+        nonlocal wrote_any
+        if counts["content_synced"] or counts["keywords_synced"] or counts["comments_synced"]:
+            wrote_any = True
 
     for p in platforms_to_sync:
         if p not in PLATFORM_SYNC_FUNCTIONS:
@@ -828,16 +1545,27 @@ def sync_platform_content(
         logger.info(f"Starting Neo4j sync for platform: {p}")
         try:
             sync_func = PLATFORM_SYNC_FUNCTIONS[p]
-            platform_result = sync_func(limit=limit)
+            platform_result = sync_func(
+                limit=limit, batch_size=batch_size, full=full, on_chunk_commit=on_chunk_commit
+            )
             results["platforms"][p] = platform_result
 
-            for key in ["content_synced", "keywords_synced", "comments_synced"]:
+            for key in SYNC_COUNTER_KEYS:
                 results["totals"][key] += platform_result.get(key, 0)
 
             logger.info(f"Completed Neo4j sync for {p}: {platform_result}")
         except Exception as e:
             logger.error(f"Error syncing platform {p}: {e}")
             results["platforms"][p] = {"error": str(e)}
+            checkpoint = get_sync_checkpoint(p) or {}
+            set_sync_progress(
+                p, checkpoint.get("processed", 0), checkpoint.get("total", 0), "failed"
+            )
+
+    # Cached graph responses are stale once anything was written
+    if wrote_any:
+        get_neo4j_client().publish_bookmarks()
+        bump_graph_generation()
 
     return results
 
@@ -862,49 +1590,165 @@ def update_sync_status(
 
 
 def get_sync_status() -> dict[str, Any]:
-    """Get current sync status from cache."""
+    """
+    Get current sync status from cache.
+
+    Per-platform row progress is merged in, and while a sync is running the
+    overall progress is computed from rows processed across all platforms.
+    """
     status = cache.get(SYNC_STATUS_CACHE_KEY)
     if status is None:
-        return {
+        status = {
             "status": "idle",
             "progress": 0,
             "lastSyncTime": None,
             "lastResult": None,
         }
+
+    keys = {SYNC_PROGRESS_CACHE_KEY.format(platform=p): p for p in SUPPORTED_PLATFORMS}
+    platforms = {keys[key]: value for key, value in cache.get_many(list(keys)).items()}
+    rows_processed = sum(p["processed"] for p in platforms.values())
+    rows_total = sum(p["total"] for p in platforms.values())
+
+    status = {
+        **status,
+        "rowsProcessed": rows_processed,
+        "rowsTotal": rows_total,
+        "platforms": platforms or None,
+    }
+    if status["status"] == "running" and rows_total:
+        status["progress"] = min(int(rows_processed / rows_total * 100), 99)
     return status
 
 
 # ============================================================================
-# Graph Data Retrieval
+# Keyword Keys
 # ============================================================================
 
-def get_media_graph_data(
-    platform: str | None = None,
-    keyword: str | None = None,
-    limit: int = 100,
-) -> dict[str, Any]:
+def backfill_keyword_keys(batch_size: int | None = None) -> int:
     """
-    Fetch media graph data from Neo4j.
+    Set the normalized lookup key on MediaKeyword nodes synced without one.
 
     Args:
-        platform: Filter by platform name
-        keyword: Filter by keyword
-        limit: Maximum nodes to return
+        batch_size: Keywords updated per transaction
 
     Returns:
-        Graph data with nodes and edges
+        Number of keywords updated
     """
     client = get_neo4j_client()
+    batch_size = batch_size or get_sync_batch_size()
+    updated = 0
+
+    while True:
+        names = [
+            record["name"]
+            for record in client.run_query(FETCH_UNKEYED_KEYWORDS_QUERY, {"limit": batch_size})
+        ]
+        if not names:
+            break
+        rows = [{"name": name, "key": normalize_keyword(name)} for name in names]
+        client.run_write_query(SET_KEYWORD_KEYS_QUERY, {"rows": rows})
+        updated += len(rows)
+        logger.info(f"Backfilled {updated} keyword keys")
+
+    return updated
+
+
+def reconcile_comment_counts(platforms: list[str] | None = None) -> int:
+    """
+    Recompute MediaContent.syncedCommentCount from HAS_COMMENT relationships.
+
+    Args:
+        platforms: Platforms to reconcile (defaults to all supported platforms)
+
+    Returns:
+        Number of contents updated
+    """
+    client = get_neo4j_client()
+    updated = 0
+    for platform in platforms or SUPPORTED_PLATFORMS:
+        summary = client.run_write_query(RECONCILE_COMMENT_COUNTS_QUERY, {"platform": platform})
+        updated += summary["properties_set"]
+        logger.info(f"Reconciled comment counts for {platform}: {summary['properties_set']}")
+    return updated
+
+
+def profile_keyword_lookup(keyword: str) -> list[str]:
+    """
+    PROFILE a keyword lookup and list the operators of its plan.
+
+    A plan using the media_keyword_key index contains a NodeIndexSeek
+    operator instead of a NodeByLabelScan.
+    """
+    def _profile_tx(tx):
+        return tx.run(PROFILE_KEYWORD_LOOKUP_QUERY, {"key": normalize_keyword(keyword)}).consume()
+
+    return _plan_operators(get_neo4j_client().execute_read(_profile_tx))
+
+
+def profile_media_graph(
+    platform: str | None = None,
+    keyword: str | None = None,
+    limit: int = 100,
+) -> list[str]:
+    """
+    PROFILE the media graph query for the given filters and list its operators.
+
+    A plan that reads contents in likedCount order from a range index
+    contains NodeIndexScan or NodeIndexSeek operators and no NodeByLabelScan.
+    """
+    query, params, _ = _media_graph_query(platform, keyword, limit, None)
+
+    def _profile_tx(tx):
+        return tx.run(f"PROFILE {query}", params).consume()
+
+    return _plan_operators(get_neo4j_client().execute_read(_profile_tx))
+
+
+def _plan_operators(summary) -> list[str]:
+    """List the operator types of a profiled plan, breadth first."""
+    operators: list[str] = []
+    plans = [summary.profile] if summary.profile else []
+    while plans:
+        plan = plans.pop(0)
+        operators.append(plan["operatorType"])
+        plans.extend(plan.get("children", []))
+    return operators
+
+
+# ============================================================================
+# Graph Data Retrieval
+# ============================================================================
+
+# Content properties the media graph can return
+MEDIA_GRAPH_CONTENT_FIELDS = ("contentId", "platform", "contentType", *CONTENT_FIELD_DEFAULTS)
+
+# Content properties returned when no fields are requested (enough to render)
+MEDIA_GRAPH_DEFAULT_FIELDS = ("platform", "contentType", "likedCount", "commentCount")
+
+
+def _media_graph_query(
+    platform: str | None,
+    keyword: str | None,
+    limit: int,
+    fields: list[str] | None,
+) -> tuple[str, dict[str, Any], list[str]]:
+    """Select the media graph query, its params and the content fields."""
+    content_fields = [
+        field
+        for field in dict.fromkeys(fields or MEDIA_GRAPH_DEFAULT_FIELDS)
+        if field in MEDIA_GRAPH_CONTENT_FIELDS
+    ]
 
     # Select appropriate query based on filters
     query_name = "ALL_PLATFORMS"
     if platform and keyword:
         query = GET_MEDIA_GRAPH_BY_PLATFORM_AND_KEYWORD_QUERY
-        params = {"platform": platform, "keyword": keyword, "limit": limit}
+        params = {"platform": platform, "key": normalize_keyword(keyword), "limit": limit}
         query_name = "BY_PLATFORM_AND_KEYWORD"
     elif keyword:
         query = GET_MEDIA_GRAPH_BY_KEYWORD_QUERY
-        params = {"keyword": keyword, "limit": limit}
+        params = {"key": normalize_keyword(keyword), "limit": limit}
         query_name = "BY_KEYWORD"
     elif platform:
         query = GET_MEDIA_GRAPH_BY_PLATFORM_QUERY
@@ -913,96 +1757,265 @@ def get_media_graph_data(
     else:
         query = GET_MEDIA_GRAPH_ALL_PLATFORMS_QUERY
         params = {"limit": limit}
+    params["fields"] = content_fields
 
     logger.info(f"get_media_graph_data using query: {query_name}, params: {params}")
+    return query, params, content_fields
 
-    nodes: list[dict[str, Any]] = []
-    edges: list[dict[str, Any]] = []
-    node_ids: set[str] = set()
 
-    with client.session() as session:
-        result = session.run(query, params)
-        records = list(result)  # Consume result to count
-        logger.info(f"get_media_graph_data query returned {len(records)} records")
+class _MediaGraphBuilder:
+    """
+    Build graph nodes, edges and stats from media graph query records.
 
-        for record in records:
-            platform_node = record.get("p")
-            content_node = record.get("c")
-            keywords_list = record.get("keywords", [])
-            comment_count = record.get("commentCount", 0)
-
-            # Add platform node
-            if platform_node:
-                platform_id = f"platform_{platform_node.get('name')}"
-                if platform_id not in node_ids:
-                    nodes.append({
-                        "id": platform_id,
-                        "type": "Platform",
-                        "label": platform_node.get("displayName", platform_node.get("name")),
-                        "properties": _serialize_node_properties(platform_node),
-                    })
-                    node_ids.add(platform_id)
-
-            # Add content node
-            if content_node:
-                content_id = f"content_{content_node.get('platform')}_{content_node.get('contentId')}"
-                if content_id not in node_ids:
-                    content_props = _serialize_node_properties(content_node)
-                    content_props["commentCount"] = comment_count
-                    nodes.append({
-                        "id": content_id,
-                        "type": "Content",
-                        "label": (content_node.get("title") or "")[:50],
-                        "properties": content_props,
+    Records are added one at a time as they stream in from Neo4j, so only
+    the graph being built is held in memory, not the records.
+    """
+
+    def __init__(self, content_fields: list[str]):
+        self.content_fields = content_fields
+        self.nodes: list[dict[str, Any]] = []
+        self.edges: list[dict[str, Any]] = []
+        self.node_ids: set[str] = set()
+        self.nodes_by_type: dict[str, int] = {}
+        self.record_count = 0
+
+    def _add_node(self, node: dict[str, Any]) -> None:
+        self.nodes.append(node)
+        self.node_ids.add(node["id"])
+        self.nodes_by_type[node["type"]] = self.nodes_by_type.get(node["type"], 0) + 1
+
+    def add(self, record) -> None:
+        """Add the nodes and edges of one query record."""
+        self.record_count += 1
+        platform_node = record.get("p")
+        content_node = record.get("c")
+        keywords_list = record.get("keywords", [])
+        comment_count = record.get("commentCount", 0)
+
+        # Add platform node
+        if platform_node:
+            platform_id = f"platform_{platform_node.get('name')}"
+            if platform_id not in self.node_ids:
+                self._add_node({
+                    "id": platform_id,
+                    "type": "Platform",
+                    "label": platform_node.get("displayName") or platform_node.get("name"),
+                    "properties": dict(platform_node),
+                })
+
+        # Add content node; a content already added has its edges too
+        if not content_node:
+            return
+        content_id = f"content_{content_node.get('platform')}_{content_node.get('contentId')}"
+        if content_id in self.node_ids:
+            return
+        content_props = {
+            field: _serialize_neo4j_value(value)
+            for field, value in zip(self.content_fields, record.get("fieldValues", []))
+        }
+        if "commentCount" in content_props:
+            content_props["commentCount"] = comment_count
+        self._add_node({
+            "id": content_id,
+            "type": "Content",
+            "label": (content_node.get("title") or "")[:50],
+            "properties": content_props,
+        })
+
+        # Add HAS_CONTENT edge
+        if platform_node:
+            platform_id = f"platform_{platform_node.get('name')}"
+            self.edges.append({
+                "source": platform_id,
+                "target": content_id,
+                "type": "HAS_CONTENT",
+            })
+
+        # Add keyword nodes and edges
+        for kw in keywords_list:
+            if kw:
+                kw_name = kw.get("name", "")
+                kw_id = f"keyword_{kw_name}"
+                if kw_id not in self.node_ids:
+                    self._add_node({
+                        "id": kw_id,
+                        "type": "Keyword",
+                        "label": kw_name,
+                        "properties": dict(kw),
                     })
-                    node_ids.add(content_id)
-
-                    # Add HAS_CONTENT edge
-                    if platform_node:
-                        platform_id = f"platform_{platform_node.get('name')}"
-                        edges.append({
-                            "source": platform_id,
-                            "target": content_id,
-                            "type": "HAS_CONTENT",
-                        })
-
-                # Add keyword nodes and edges
-                for kw in keywords_list:
-                    if kw:
-                        kw_name = kw.get("name", "")
-                        kw_id = f"keyword_{kw_name}"
-                        if kw_id not in node_ids:
-                            nodes.append({
-                                "id": kw_id,
-                                "type": "Keyword",
-                                "label": kw_name,
-                                "properties": _serialize_node_properties(kw),
-                            })
-                            node_ids.add(kw_id)
-
-                        edges.append({
-                            "source": content_id,
-                            "target": kw_id,
-                            "type": "HAS_KEYWORD",
-                        })
-
-    # Calculate stats
-    stats = {
-        "totalNodes": len(nodes),
-        "totalEdges": len(edges),
-        "nodesByType": {},
-    }
-    for node in nodes:
-        node_type = node["type"]
-        stats["nodesByType"][node_type] = stats["nodesByType"].get(node_type, 0) + 1
+
+                self.edges.append({
+                    "source": content_id,
+                    "target": kw_id,
+                    "type": "HAS_KEYWORD",
+                })
+
+    def build(self) -> dict[str, Any]:
+        """Get the graph data with stats."""
+        logger.info(f"get_media_graph_data query returned {self.record_count} records")
+        return {
+            "nodes": self.nodes,
+            "edges": self.edges,
+            "stats": {
+                "totalNodes": len(self.nodes),
+                "totalEdges": len(self.edges),
+                "nodesByType": self.nodes_by_type,
+            },
+        }
+
+
+@single_flight("media_graph")
+def get_media_graph_data(
+    platform: str | None = None,
+    keyword: str | None = None,
+    limit: int = 100,
+    fields: list[str] | None = None,
+) -> dict[str, Any]:
+    """
+    Fetch media graph data from Neo4j.
+
+    Nodes carry only the properties needed to render them; use
+    get_media_node_detail for the full properties of a node.
+
+    Args:
+        platform: Filter by platform name
+        keyword: Filter by keyword
+        limit: Maximum nodes to return
+        fields: Content properties to return (MEDIA_GRAPH_CONTENT_FIELDS),
+                MEDIA_GRAPH_DEFAULT_FIELDS if None
+
+    Returns:
+        Graph data with nodes and edges
+    """
+    client = get_neo4j_client()
+    query, params, content_fields = _media_graph_query(platform, keyword, limit, fields)
+
+    builder = _MediaGraphBuilder(content_fields)
+    with closing(client.stream_query(query, params)) as records:
+        for record in records:
+            builder.add(record)
+    return builder.build()
+
+
+@single_flight("media_graph")
+async def aget_media_graph_data(
+    platform: str | None = None,
+    keyword: str | None = None,
+    limit: int = 100,
+    fields: list[str] | None = None,
+) -> dict[str, Any]:
+    """Async variant of get_media_graph_data on the async Neo4j driver."""
+    client = get_async_neo4j_client()
+    query, params, content_fields = _media_graph_query(platform, keyword, limit, fields)
+
+    builder = _MediaGraphBuilder(content_fields)
+    async with aclosing(client.astream_query(query, params)) as records:
+        async for record in records:
+            builder.add(record)
+    return builder.build()
+
+
+def _media_node_lookup(node_id: str) -> tuple[str, str, dict[str, Any]] | None:
+    """Resolve a media graph node id to its type, query and params."""
+    kind, _, rest = node_id.partition("_")
+    if not rest:
+        return None
+
+    if kind == "platform":
+        return "Platform", GET_MEDIA_PLATFORM_NODE_QUERY, {"name": rest}
+    if kind == "keyword":
+        return "Keyword", GET_MEDIA_KEYWORD_NODE_QUERY, {"name": rest}
+    if kind == "content":
+        # Platform names may contain underscores, so match against the known ones
+        platform = next(
+            (p for p in SUPPORTED_PLATFORMS if rest.startswith(f"{p}_")),
+            None,
+        )
+        if platform is None:
+            return None
+        params = {"platform": platform, "contentId": rest[len(platform) + 1 :]}
+        return "Content", GET_MEDIA_CONTENT_NODE_QUERY, params
+    return None
+
+
+def _media_node_detail(node_id: str, node_type: str, node) -> dict[str, Any]:
+    """Shape a media graph node with full properties."""
+    properties = _serialize_node_properties(node)
+    if node_type == "Platform":
+        label = properties.get("displayName") or properties.get("name")
+    elif node_type == "Content":
+        label = (properties.get("title") or "")[:50]
+    else:
+        label = properties.get("name", "")
 
     return {
-        "nodes": nodes,
-        "edges": edges,
-        "stats": stats,
+        "id": node_id,
+        "type": node_type,
+        "label": label,
+        "properties": properties,
     }
 
 
+def get_media_node_detail(node_id: str) -> dict[str, Any] | None:
+    """
+    Fetch a single media graph node with all of its properties.
+
+    Args:
+        node_id: Graph node id (platform_<name>, content_<platform>_<id>
+                 or keyword_<name>)
+
+    Returns:
+        Node with full properties, or None if the id is unknown or not found
+    """
+    lookup = _media_node_lookup(node_id)
+    if lookup is None:
+        return None
+
+    node_type, query, params = lookup
+    records = get_neo4j_client().run_query(query, params)
+    if not records:
+        return None
+    return _media_node_detail(node_id, node_type, records[0]["n"])
+
+
+async def aget_media_node_detail(node_id: str) -> dict[str, Any] | None:
+    """Async variant of get_media_node_detail on the async Neo4j driver."""
+    lookup = _media_node_lookup(node_id)
+    if lookup is None:
+        return None
+
+    node_type, query, params = lookup
+    records = await get_async_neo4j_client().run_query(query, params)
+    if not records:
+        return None
+    return _media_node_detail(node_id, node_type, records[0]["n"])
+
+
+def _popular_keywords_query(
+    platform: str | None,
+    limit: int,
+    reconciled: bool,
+) -> tuple[str, dict[str, Any]]:
+    """Select the popular keywords query and params, on counters once reconciled."""
+    if not reconciled:
+        if platform:
+            return COUNT_POPULAR_KEYWORDS_BY_PLATFORM_QUERY, {"platform": platform, "limit": limit}
+        return COUNT_POPULAR_KEYWORDS_ALL_QUERY, {"limit": limit}
+    if platform:
+        return _with_platform_count(GET_POPULAR_KEYWORDS_BY_PLATFORM_QUERY, platform), {"limit": limit}
+    return GET_POPULAR_KEYWORDS_ALL_QUERY, {"limit": limit}
+
+
+def _read_top_keywords(platform: str | None, limit: int) -> list[dict[str, Any]] | None:
+    """Read top keywords from Redis, or None if unavailable."""
+    try:
+        return get_top_keywords(platform=platform, limit=limit)
+    except Exception as e:
+        logger.error(f"Failed to read keyword popularity from Redis: {e}")
+        return None
+
+
+@single_flight("media_keywords")
 def get_media_keywords(
     platform: str | None = None,
     limit: int = 50,
@@ -1010,6 +2023,11 @@ def get_media_keywords(
     """
     Get popular keywords for media content.
 
+    Counts are maintained during sync: top-N is read from the Redis sorted
+    sets, or from the keyword count properties if Redis is unavailable. Until
+    reconcile_keyword_counts has run the counters may be partial, so the
+    relationships are counted instead.
+
     Args:
         platform: Filter by platform name
         limit: Maximum keywords to return
@@ -1017,38 +2035,78 @@ def get_media_keywords(
     Returns:
         List of keywords with counts
     """
-    client = get_neo4j_client()
+    keywords = _read_top_keywords(platform, limit)
+    if keywords is not None:
+        return keywords
 
-    # Use appropriate query based on whether platform filter is provided
-    if platform:
-        query = GET_POPULAR_KEYWORDS_BY_PLATFORM_QUERY
-        params = {"platform": platform, "limit": limit}
-    else:
-        query = GET_POPULAR_KEYWORDS_ALL_QUERY
-        params = {"limit": limit}
+    query, params = _popular_keywords_query(platform, limit, keyword_counts_reconciled())
+    results = get_neo4j_client().run_query(query, params)
+    return [{"name": r["name"], "count": r["count"]} for r in results]
 
-    results = client.run_query(query, params)
+
+@single_flight("media_keywords")
+async def aget_media_keywords(
+    platform: str | None = None,
+    limit: int = 50,
+) -> list[dict[str, Any]]:
+    """Async variant of get_media_keywords on the async Neo4j driver."""
+    keywords = await sync_to_async(_read_top_keywords, thread_sensitive=False)(platform, limit)
+    if keywords is not None:
+        return keywords
+
+    reconciled = await sync_to_async(keyword_counts_reconciled, thread_sensitive=False)()
+    query, params = _popular_keywords_query(platform, limit, reconciled)
+    results = await get_async_neo4j_client().run_query(query, params)
     return [{"name": r["name"], "count": r["count"]} for r in results]
 
 
-def search_media_keywords(query_text: str, limit: int = 20) -> list[dict[str, Any]]:
+def search_media_keywords(
+    query_text: str,
+    limit: int = 20,
+    mode: str = "exact",
+) -> list[dict[str, Any]]:
     """
-    Search keywords by text matching.
+    Search keywords through the media_keyword_name_fulltext index.
 
     Args:
         query_text: Search query
         limit: Maximum results to return
+        mode: "exact", "prefix" or "fuzzy" term matching
 
     Returns:
-        List of matching keywords with counts
+        List of matching keywords with counts, most relevant first
     """
     if not query_text or len(query_text) < 2:
         return []
 
+    lucene_query = build_fulltext_query(query_text, mode)
+    if not lucene_query:
+        return []
+
     client = get_neo4j_client()
     results = client.run_query(
         SEARCH_KEYWORDS_QUERY,
-        {"query": query_text, "limit": limit},
+        {"query": lucene_query, "limit": limit},
     )
-    return [{"name": r["name"], "count": r["count"]} for r in results]
+    return [{"name": r["name"], "count": r["count"], "score": r["score"]} for r in results]
+
 
+async def asearch_media_keywords(
+    query_text: str,
+    limit: int = 20,
+    mode: str = "exact",
+) -> list[dict[str, Any]]:
+    """Async variant of search_media_keywords on the async Neo4j driver."""
+    if not query_text or len(query_text) < 2:
+        return []
+
+    lucene_query = build_fulltext_query(query_text, mode)
+    if not lucene_query:
+        return []
+
+    client = get_async_neo4j_client()
+    results = await client.run_query(
+        SEARCH_KEYWORDS_QUERY,
+        {"query": lucene_query, "limit": limit},
+    )
+    return [{"name": r["name"], "count": r["count"], "score": r["score"]} for r in results]
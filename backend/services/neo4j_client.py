@@ -1,18 +1,183 @@
 """
 Neo4j client service.
 
-Provides connection management and query execution for Neo4j.
+Provides connection management and query execution for Neo4j, with a
+blocking client for sync code (Celery tasks, commands) and an asyncio
+client for async views served under ASGI.
+
+Reads run in READ access mode sessions through managed execute_read
+transactions, so with a neo4j:// routing URI they are served by cluster
+secondaries and transient failures are retried. Writes run through
+execute_write. Causal consistency across processes uses bookmarks: after a
+sync, the writer publishes its bookmarks to the Django cache with
+publish_bookmarks(), and every read session waits for them, so reads on
+any cluster member observe the synced data. Each process reuses the
+published bookmarks it read for NEO4J_BOOKMARKS_LOCAL_TTL seconds, so a
+sync becomes visible to reads in other processes within that delay.
+
+Large reads (graph exports) use stream_query, which yields records as the
+driver pulls them from the server in batches of NEO4J_FETCH_SIZE, instead
+of materializing the whole result first.
+
+Drivers are created lazily, on first use in each process, and connectivity
+is verified in the background instead of blocking the first request. A
+driver inherited across a fork (Celery prefork pool, Gunicorn workers) is
+never reused: the clients check the process id, and the post-fork hooks
+call reset_neo4j_clients_after_fork() so each child opens its own pool.
+
+Sessions are instrumented (services.neo4j_metrics): every query is timed
+and recorded under its registered name.
+
+The async driver is ASGI-only. An async driver is bound to the event loop it
+was created on and must be closed there, which only the ASGI server's loop
+guarantees, so config/asgi.py calls enable_async_driver(). Everywhere else
+(runserver, tests, commands) Django runs async views on a short-lived loop
+per call, and AsyncNeo4jClient runs queries on the sync client in a worker
+thread instead.
 """
 
+import asyncio
 import logging
-from contextlib import contextmanager
-from typing import Any, Generator
+import os
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncGenerator, AsyncIterator, Callable, Generator, Iterator
 
+from asgiref.sync import sync_to_async
 from django.conf import settings
-from neo4j import GraphDatabase, Driver, Session
+from django.core.cache import cache
+from neo4j import (
+    READ_ACCESS,
+    WRITE_ACCESS,
+    AsyncDriver,
+    AsyncGraphDatabase,
+    AsyncManagedTransaction,
+    AsyncSession,
+    Bookmarks,
+    Driver,
+    GraphDatabase,
+    ManagedTransaction,
+    Record,
+    Session,
+)
+
+from services.neo4j_metrics import ainstrument_session, instrument_session
 
 logger = logging.getLogger(__name__)
 
+# Cache key of the bookmarks published by the last writers
+NEO4J_BOOKMARKS_CACHE_KEY = "neo4j_write_bookmarks"
+
+# Published bookmarks kept (newest first) when several writers publish
+MAX_SHARED_BOOKMARKS = 16
+
+# Published bookmarks last read by this process, with their monotonic read time
+_local_bookmarks: tuple[float, list[str]] | None = None
+
+# Drivers inherited across a fork; kept referenced so garbage collection
+# never closes them and disturbs the parent's connections
+_inherited_drivers: list[Driver | AsyncDriver] = []
+
+# Set by the ASGI entry point; elsewhere async queries use the sync client
+_async_driver_enabled = False
+
+
+def enable_async_driver() -> None:
+    """
+    Let AsyncNeo4jClient open a native async driver in this process.
+
+    Only call this from an ASGI entry point: the driver is bound to the
+    first event loop that queries through it, which must be the server's
+    long-lived loop.
+    """
+    global _async_driver_enabled
+    _async_driver_enabled = True
+
+
+def get_pool_config() -> dict[str, Any]:
+    """Get the connection pool options shared by the sync and async drivers."""
+    return {
+        "max_connection_pool_size": int(
+            getattr(settings, "NEO4J_MAX_CONNECTION_POOL_SIZE", 50)
+        ),
+        "connection_acquisition_timeout": float(
+            getattr(settings, "NEO4J_CONNECTION_ACQUISITION_TIMEOUT", 60.0)
+        ),
+        "max_connection_lifetime": float(
+            getattr(settings, "NEO4J_MAX_CONNECTION_LIFETIME", 3600)
+        ),
+    }
+
+
+def _verify_connectivity(driver: Driver, uri: str) -> None:
+    """Verify a new driver can reach Neo4j, logging the outcome."""
+    try:
+        driver.verify_connectivity()
+        logger.info(f"Connected to Neo4j at {uri}")
+    except Exception as e:
+        logger.error(f"Failed to connect to Neo4j at {uri}: {e}")
+
+
+def get_fetch_size() -> int:
+    """Get the number of records pulled from the server per batch when streaming."""
+    return int(getattr(settings, "NEO4J_FETCH_SIZE", 1000))
+
+
+def _get_recent_bookmarks() -> list[str] | None:
+    """Get the published bookmarks read within NEO4J_BOOKMARKS_LOCAL_TTL, if any."""
+    local = _local_bookmarks
+    ttl = float(getattr(settings, "NEO4J_BOOKMARKS_LOCAL_TTL", 1))
+    if local is not None and time.monotonic() - local[0] < ttl:
+        return local[1]
+    return None
+
+
+def _remember_bookmarks(values: list[str]) -> list[str]:
+    """Keep published bookmarks for reuse by this process's next reads."""
+    global _local_bookmarks
+    _local_bookmarks = (time.monotonic(), values)
+    return values
+
+
+def get_shared_bookmarks() -> Bookmarks:
+    """Get the bookmarks published by writers (empty if unavailable)."""
+    values = _get_recent_bookmarks()
+    if values is None:
+        try:
+            values = _remember_bookmarks(cache.get(NEO4J_BOOKMARKS_CACHE_KEY) or [])
+        except Exception as e:
+            logger.error(f"Failed to read shared Neo4j bookmarks: {e}")
+            return Bookmarks()
+    return Bookmarks.from_raw_values(values)
+
+
+async def aget_shared_bookmarks() -> Bookmarks:
+    """Async variant of get_shared_bookmarks."""
+    values = _get_recent_bookmarks()
+    if values is None:
+        try:
+            values = _remember_bookmarks(await cache.aget(NEO4J_BOOKMARKS_CACHE_KEY) or [])
+        except Exception as e:
+            logger.error(f"Failed to read shared Neo4j bookmarks: {e}")
+            return Bookmarks()
+    return Bookmarks.from_raw_values(values)
+
+
+def _fetch_records(tx: ManagedTransaction, query: str, parameters: dict[str, Any]) -> list[Record]:
+    """Transaction function returning all records of a query."""
+    return list(tx.run(query, parameters))
+
+
+async def _afetch_records(
+    tx: AsyncManagedTransaction,
+    query: str,
+    parameters: dict[str, Any],
+) -> list[Record]:
+    """Async transaction function returning all records of a query."""
+    result = await tx.run(query, parameters)
+    return [record async for record in result]
+
 
 class Neo4jClient:
     """
@@ -20,9 +185,9 @@ class Neo4jClient:
 
     Usage:
         client = Neo4jClient()
+        records = client.fetch_records("MATCH (n) RETURN n LIMIT 10")
         with client.session() as session:
-            result = session.run("MATCH (n) RETURN n LIMIT 10")
-            ...
+            session.execute_write(write_tx, rows)
         client.close()
 
     Or as context manager:
@@ -32,7 +197,10 @@ class Neo4jClient:
     """
 
     _instance: "Neo4jClient | None" = None
+    _initialized = False
     _driver: Driver | None = None
+    # Process that created the driver; a forked child creates its own
+    _pid: int | None = None
 
     def __new__(cls) -> "Neo4jClient":
         """Singleton pattern for connection pooling."""
@@ -42,39 +210,67 @@ class Neo4jClient:
 
     def __init__(self):
         """Initialize Neo4j client with settings from Django."""
-        if self._driver is None:
+        if not self._initialized:
             self.uri = getattr(settings, "NEO4J_URI", "bolt://localhost:7687")
             self.user = getattr(settings, "NEO4J_USER", "neo4j")
             self.password = getattr(settings, "NEO4J_PASSWORD", "password123")
-            self._connect()
+            self.max_transaction_retry_time = getattr(
+                settings, "NEO4J_MAX_TRANSACTION_RETRY_TIME", 30.0
+            )
+            self._reset_process_state()
+            self._initialized = True
+
+    def _reset_process_state(self) -> None:
+        """Drop the driver and per-process state, e.g. inherited across a fork."""
+        if self._driver is not None:
+            # Closing would say goodbye on sockets the parent still uses
+            _inherited_drivers.append(self._driver)
+        self._driver = None
+        self._pid = os.getpid()
+        self._driver_lock = threading.Lock()
+        # Writes chain on this process's own bookmarks; reads additionally
+        # wait for the bookmarks other writers published
+        self._write_bookmarks = GraphDatabase.bookmark_manager()
+        self._read_bookmarks = GraphDatabase.bookmark_manager(
+            bookmarks_supplier=self._supply_read_bookmarks
+        )
 
     def _connect(self) -> None:
-        """Establish connection to Neo4j."""
-        try:
-            self._driver = GraphDatabase.driver(
-                self.uri,
-                auth=(self.user, self.password),
-                max_connection_lifetime=3600,
-                max_connection_pool_size=50,
-            )
-            # Verify connectivity
-            self._driver.verify_connectivity()
-            logger.info(f"Connected to Neo4j at {self.uri}")
-        except Exception as e:
-            logger.error(f"Failed to connect to Neo4j: {e}")
-            raise
+        """Create the driver; connectivity is verified in the background."""
+        self._driver = GraphDatabase.driver(
+            self.uri,
+            auth=(self.user, self.password),
+            max_transaction_retry_time=self.max_transaction_retry_time,
+            **get_pool_config(),
+        )
+        logger.info(f"Created Neo4j driver for {self.uri} in process {self._pid}")
+        threading.Thread(
+            target=_verify_connectivity,
+            args=(self._driver, self.uri),
+            name="neo4j-verify-connectivity",
+            daemon=True,
+        ).start()
 
     @property
     def driver(self) -> Driver:
-        """Get the Neo4j driver instance."""
+        """Get the Neo4j driver of this process, creating it on first use."""
+        if self._pid != os.getpid():
+            self._reset_process_state()
         if self._driver is None:
-            self._connect()
+            with self._driver_lock:
+                if self._driver is None:
+                    self._connect()
         return self._driver
 
+    def _supply_read_bookmarks(self) -> Bookmarks:
+        """Bookmarks read sessions wait for: published ones and our own writes."""
+        own = Bookmarks.from_raw_values(self._write_bookmarks.get_bookmarks())
+        return get_shared_bookmarks() + own
+
     @contextmanager
     def session(self, **kwargs) -> Generator[Session, None, None]:
         """
-        Get a Neo4j session as context manager.
+        Get a write-mode Neo4j session as context manager.
 
         Args:
             **kwargs: Additional arguments to pass to driver.session()
@@ -82,32 +278,145 @@ class Neo4jClient:
         Yields:
             Neo4j Session instance
         """
-        session = self.driver.session(**kwargs)
+        kwargs.setdefault("default_access_mode", WRITE_ACCESS)
+        kwargs.setdefault("bookmark_manager", self._write_bookmarks)
+        # Closing the instrumented session also records results left unread
+        session = instrument_session(self.driver.session(**kwargs))
         try:
             yield session
         finally:
             session.close()
 
+    @contextmanager
+    def read_session(self, **kwargs) -> Generator[Session, None, None]:
+        """
+        Get a read-mode Neo4j session, routed to readers in a cluster.
+
+        Args:
+            **kwargs: Additional arguments to pass to driver.session()
+
+        Yields:
+            Neo4j Session instance
+        """
+        kwargs.setdefault("bookmark_manager", self._read_bookmarks)
+        with self.session(default_access_mode=READ_ACCESS, **kwargs) as session:
+            yield session
+
+    def execute_read(self, work: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a transaction function in a managed read transaction.
+
+        The function is retried on transient errors, so it must not have
+        side effects besides the transaction itself.
+
+        Args:
+            work: Transaction function taking the transaction and args
+            *args, **kwargs: Passed to the transaction function
+
+        Returns:
+            The transaction function's result
+        """
+        with self.read_session() as session:
+            return session.execute_read(work, *args, **kwargs)
+
+    def execute_write(self, work: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a transaction function in a managed write transaction.
+
+        Args:
+            work: Transaction function taking the transaction and args
+            *args, **kwargs: Passed to the transaction function
+
+        Returns:
+            The transaction function's result
+        """
+        with self.session() as session:
+            return session.execute_write(work, *args, **kwargs)
+
+    def fetch_records(
+        self,
+        query: str,
+        parameters: dict[str, Any] | None = None,
+    ) -> list[Record]:
+        """
+        Execute a read query and return its records.
+
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+
+        Returns:
+            List of neo4j Records
+        """
+        return self.execute_read(_fetch_records, query, parameters or {})
+
     def run_query(
         self,
         query: str,
         parameters: dict[str, Any] | None = None,
-        **kwargs,
     ) -> list[dict[str, Any]]:
         """
-        Execute a Cypher query and return results as list of dicts.
+        Execute a read query and return results as list of dicts.
 
         Args:
             query: Cypher query string
             parameters: Query parameters
-            **kwargs: Additional session arguments
 
         Returns:
             List of records as dictionaries
         """
-        with self.session(**kwargs) as session:
-            result = session.run(query, parameters or {})
-            return [record.data() for record in result]
+        return [record.data() for record in self.fetch_records(query, parameters)]
+
+    def stream_query(
+        self,
+        query: str,
+        parameters: dict[str, Any] | None = None,
+        fetch_size: int | None = None,
+    ) -> Iterator[Record]:
+        """
+        Execute a read query and yield its records as they arrive.
+
+        The driver pulls fetch_size records at a time, so only one batch is
+        buffered. The session stays open until the iterator is exhausted or
+        closed; wrap it in contextlib.closing when it may be abandoned early.
+        Unlike fetch_records the query is not retried on transient errors,
+        since records may already have been consumed.
+
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            fetch_size: Records per batch, NEO4J_FETCH_SIZE if None
+
+        Yields:
+            neo4j Records
+        """
+        with self.read_session(fetch_size=fetch_size or get_fetch_size()) as session:
+            yield from session.run(query, parameters or {})
+
+    def publish_bookmarks(self) -> None:
+        """
+        Publish this process's write bookmarks for readers in other processes.
+
+        Call after a sync so reads in every process (and on every cluster
+        member) observe what it wrote. Bookmarks already published by other
+        writers are kept, newest first, up to MAX_SHARED_BOOKMARKS, for
+        NEO4J_BOOKMARKS_TIMEOUT seconds; by then every cluster member has
+        long applied them.
+        """
+        own = list(self._write_bookmarks.get_bookmarks())
+        if not own:
+            return
+        try:
+            shared = cache.get(NEO4J_BOOKMARKS_CACHE_KEY) or []
+            merged = list(dict.fromkeys(own + shared))[:MAX_SHARED_BOOKMARKS]
+            cache.set(
+                NEO4J_BOOKMARKS_CACHE_KEY,
+                merged,
+                timeout=int(getattr(settings, "NEO4J_BOOKMARKS_TIMEOUT", 3600)),
+            )
+            _remember_bookmarks(merged)
+        except Exception as e:
+            logger.error(f"Failed to publish Neo4j bookmarks: {e}")
 
     def run_write_query(
         self,
@@ -124,24 +433,25 @@ class Neo4jClient:
         Returns:
             Query summary as dictionary
         """
-        with self.session() as session:
 
-            def _write_tx(tx):
-                result = tx.run(query, parameters or {})
-                return result.consume()
+        def _write_tx(tx):
+            result = tx.run(query, parameters or {})
+            return result.consume()
 
-            summary = session.execute_write(_write_tx)
-            return {
-                "nodes_created": summary.counters.nodes_created,
-                "nodes_deleted": summary.counters.nodes_deleted,
-                "relationships_created": summary.counters.relationships_created,
-                "relationships_deleted": summary.counters.relationships_deleted,
-                "properties_set": summary.counters.properties_set,
-            }
+        summary = self.execute_write(_write_tx)
+        return {
+            "nodes_created": summary.counters.nodes_created,
+            "nodes_deleted": summary.counters.nodes_deleted,
+            "relationships_created": summary.counters.relationships_created,
+            "relationships_deleted": summary.counters.relationships_deleted,
+            "properties_set": summary.counters.properties_set,
+            "constraints_added": summary.counters.constraints_added,
+            "indexes_added": summary.counters.indexes_added,
+        }
 
     def close(self) -> None:
         """Close the Neo4j driver connection."""
-        if self._driver:
+        if self._driver and self._pid == os.getpid():
             self._driver.close()
             self._driver = None
             Neo4jClient._instance = None
@@ -170,7 +480,236 @@ class Neo4jClient:
             return False
 
 
-# Global client instance for convenience
+class AsyncNeo4jClient:
+    """
+    Asyncio Neo4j client for async views.
+
+    Queries await network I/O instead of blocking a worker, so one process
+    can keep many graph queries in flight. Once enable_async_driver() has
+    been called (ASGI only), one async driver is opened on the first event
+    loop that queries, the server's. Queries on any other loop, or in a
+    process without ASGI, run on the sync client in a worker thread, so no
+    driver is ever left open on a loop that has gone away.
+
+    The client is read-only: async views only read the graph.
+
+    Usage:
+        client = get_async_neo4j_client()
+        records = await client.run_query("MATCH (n) RETURN n LIMIT 10")
+    """
+
+    def __init__(self):
+        """Initialize the client with settings from Django."""
+        self.uri = getattr(settings, "NEO4J_URI", "bolt://localhost:7687")
+        self.user = getattr(settings, "NEO4J_USER", "neo4j")
+        self.password = getattr(settings, "NEO4J_PASSWORD", "password123")
+        self.max_transaction_retry_time = getattr(
+            settings, "NEO4J_MAX_TRANSACTION_RETRY_TIME", 30.0
+        )
+        self._driver: AsyncDriver | None = None
+        # Event loop the driver is bound to
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # Process the client belongs to; get_async_neo4j_client replaces it in a fork
+        self.pid = os.getpid()
+        # Reads wait for the bookmarks published by writers
+        self._read_bookmarks = AsyncGraphDatabase.bookmark_manager(
+            bookmarks_supplier=aget_shared_bookmarks
+        )
+
+    def _uses_driver(self) -> bool:
+        """Check whether queries on the running loop go through the async driver."""
+        if not _async_driver_enabled:
+            return False
+        loop = asyncio.get_running_loop()
+        if self._loop is None:
+            self._loop = loop
+        return self._loop is loop
+
+    @property
+    def driver(self) -> AsyncDriver:
+        """
+        Get the async driver, bound to the ASGI server's event loop.
+
+        Raises:
+            RuntimeError: If the async driver is not enabled or this is another loop
+        """
+        if not self._uses_driver():
+            raise RuntimeError(
+                "The async Neo4j driver is only available on the ASGI server's event loop"
+            )
+        if self._driver is None:
+            self._driver = AsyncGraphDatabase.driver(
+                self.uri,
+                auth=(self.user, self.password),
+                max_transaction_retry_time=self.max_transaction_retry_time,
+                **get_pool_config(),
+            )
+            logger.info(f"Created async Neo4j driver for {self.uri}")
+        return self._driver
+
+    @asynccontextmanager
+    async def read_session(self, **kwargs) -> AsyncGenerator[AsyncSession, None]:
+        """
+        Get an async read-mode Neo4j session, routed to readers in a cluster.
+
+        Args:
+            **kwargs: Additional arguments to pass to driver.session()
+
+        Yields:
+            Neo4j AsyncSession instance
+        """
+        kwargs.setdefault("default_access_mode", READ_ACCESS)
+        kwargs.setdefault("bookmark_manager", self._read_bookmarks)
+        # Closing the instrumented session also records results left unread
+        session = ainstrument_session(self.driver.session(**kwargs))
+        try:
+            yield session
+        finally:
+            await session.close()
+
+    async def execute_read(self, work: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run an async transaction function in a managed read transaction.
+
+        Needs the async driver (see driver); fetch_records also works without.
+
+        Args:
+            work: Async transaction function taking the transaction and args
+            *args, **kwargs: Passed to the transaction function
+
+        Returns:
+            The transaction function's result
+        """
+        async with self.read_session() as session:
+            return await session.execute_read(work, *args, **kwargs)
+
+    async def fetch_records(
+        self,
+        query: str,
+        parameters: dict[str, Any] | None = None,
+    ) -> list[Record]:
+        """
+        Execute a read query and return its records.
+
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+
+        Returns:
+            List of neo4j Records
+        """
+        if not self._uses_driver():
+            return await sync_to_async(get_neo4j_client().fetch_records, thread_sensitive=False)(
+                query, parameters
+            )
+        return await self.execute_read(_afetch_records, query, parameters or {})
+
+    async def run_query(
+        self,
+        query: str,
+        parameters: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Execute a read query and return results as list of dicts.
+
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+
+        Returns:
+            List of records as dictionaries
+        """
+        return [record.data() for record in await self.fetch_records(query, parameters)]
+
+    async def astream_query(
+        self,
+        query: str,
+        parameters: dict[str, Any] | None = None,
+        fetch_size: int | None = None,
+    ) -> AsyncIterator[Record]:
+        """
+        Execute a read query and yield its records as they arrive.
+
+        Async variant of Neo4jClient.stream_query; wrap it in
+        contextlib.aclosing when it may be abandoned early. Without the
+        async driver the records are fetched in one go on the sync client.
+
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            fetch_size: Records per batch, NEO4J_FETCH_SIZE if None
+
+        Yields:
+            neo4j Records
+        """
+        if not self._uses_driver():
+            for record in await self.fetch_records(query, parameters):
+                yield record
+            return
+
+        async with self.read_session(fetch_size=fetch_size or get_fetch_size()) as session:
+            result = await session.run(query, parameters or {})
+            async for record in result:
+                yield record
+
+    async def close(self) -> None:
+        """Close the async driver; must be awaited on the loop it is bound to."""
+        if self._driver is None or self._loop is not asyncio.get_running_loop():
+            return
+        driver, self._driver = self._driver, None
+        await driver.close()
+        logger.info("Async Neo4j connection closed")
+
+    async def health_check(self) -> bool:
+        """
+        Check if Neo4j is accessible.
+
+        Returns:
+            True if connection is healthy, False otherwise
+        """
+        if not self._uses_driver():
+            return await sync_to_async(get_neo4j_client().health_check, thread_sensitive=False)()
+        try:
+            await self.driver.verify_connectivity()
+            return True
+        except Exception as e:
+            logger.error(f"Async Neo4j health check failed: {e}")
+            return False
+
+
+# Global client instances for convenience
+_async_client: AsyncNeo4jClient | None = None
+
+
 def get_neo4j_client() -> Neo4jClient:
     """Get the singleton Neo4j client instance."""
     return Neo4jClient()
+
+
+def get_async_neo4j_client() -> AsyncNeo4jClient:
+    """Get the singleton async Neo4j client instance."""
+    global _async_client
+    if _async_client is not None and _async_client.pid != os.getpid():
+        reset_neo4j_clients_after_fork()
+    if _async_client is None:
+        _async_client = AsyncNeo4jClient()
+    return _async_client
+
+
+def reset_neo4j_clients_after_fork(*args, **kwargs) -> None:
+    """
+    Discard Neo4j drivers inherited from a parent process.
+
+    Connected to Celery's worker_process_init signal and called from
+    Gunicorn's post_fork hook, so each child process opens its own
+    connections on first use. The drivers also check the process id
+    themselves; the hooks make the reset happen right after the fork.
+    Accepts and ignores signal and hook arguments.
+    """
+    global _async_client
+    if Neo4jClient._instance is not None and Neo4jClient._instance._initialized:
+        Neo4jClient._instance._reset_process_state()
+    # The async driver belongs to the parent's event loop; children run their own
+    if _async_client is not None and _async_client._driver is not None:
+        _inherited_drivers.append(_async_client._driver)
+    _async_client = None
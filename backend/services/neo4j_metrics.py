@@ -0,0 +1,555 @@
+"""
+Neo4j query instrumentation.
+
+Every query run through Neo4jClient sessions is timed and recorded under
+its name: the module constant it came from (MERGE_CONTENT_QUERY,
+GET_MEDIA_GRAPH_BY_KEYWORD_QUERY, ...), registered with register_queries().
+Per name, histograms track client latency (from run to the result being
+consumed), records returned, and the server's result_available_after and
+result_consumed_after. Results that are not read to the end (streams closed
+early, single(), ...) are recorded when their transaction or session closes.
+
+Queries slower than NEO4J_SLOW_QUERY_MS are logged with a redacted view of
+their parameters (numbers and booleans, otherwise only types and sizes).
+With NEO4J_SLOW_QUERY_PROFILE enabled, a slow read query is also re-run
+with PROFILE in a background thread (at most once per
+NEO4J_SLOW_QUERY_PROFILE_INTERVAL per query) and its plan kept with the
+slow query entry.
+
+Metrics are per process, like the single-flight counters; see
+get_query_metrics().
+"""
+
+import functools
+import logging
+import re
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from typing import Any, Callable
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Histogram bucket upper bounds; values above the last bound fall in an overflow bucket
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+RECORD_BUCKETS = (0, 1, 10, 100, 1000, 10000, 100000)
+
+# Query names tracked per process; further unregistered queries share one name
+MAX_QUERY_NAMES = 200
+OTHER_QUERY_NAME = "other"
+
+# Slow queries kept for get_query_metrics (newest last)
+MAX_SLOW_QUERIES = 50
+
+# Queries already asking for a plan; prefixing PROFILE would be invalid
+_PLANNED_QUERY = re.compile(r"\s*(PROFILE|EXPLAIN)\b", re.IGNORECASE)
+
+_query_names: dict[str, str] = {}
+
+
+def register_query(name: str, query: str) -> None:
+    """Record metrics of a query under name."""
+    _query_names[query] = name
+
+
+def register_queries(namespace: dict[str, Any]) -> None:
+    """
+    Register the query constants of a module.
+
+    Names ending in _QUERY with a string value are registered as is; dicts
+    ending in _QUERIES are registered as NAME[key], for string values or
+    tuples holding the query string.
+
+    Usage:
+        register_queries(globals())
+    """
+    for name, value in namespace.items():
+        if name.endswith("_QUERY") and isinstance(value, str):
+            register_query(name, value)
+        elif name.endswith("_QUERIES") and isinstance(value, dict):
+            for key, entry in value.items():
+                for query in entry if isinstance(entry, tuple) else (entry,):
+                    if isinstance(query, str):
+                        register_query(f"{name}[{key}]", query)
+
+
+def get_query_name(query: str) -> str:
+    """Get the registered name of a query, or a short prefix of its text."""
+    name = _query_names.get(query)
+    if name is None:
+        name = " ".join(query.split())[:60]
+    return name
+
+
+# ============================================================================
+# Histograms
+# ============================================================================
+
+class Histogram:
+    """Fixed-bucket histogram with count, sum and max."""
+
+    def __init__(self, bounds: tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float | None:
+        """Upper bound of the bucket holding the q-quantile (max if it overflows)."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return float(min(bound, self.max))
+        return self.max
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 3),
+            "max": round(self.max, 3),
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "bounds": list(self.bounds),
+            "counts": list(self.counts),
+        }
+
+
+class _QueryStats:
+    """Histograms of one named query."""
+
+    def __init__(self):
+        self.errors = 0
+        self.latency_ms = Histogram(LATENCY_BUCKETS_MS)
+        self.records = Histogram(RECORD_BUCKETS)
+        self.available_after_ms = Histogram(LATENCY_BUCKETS_MS)
+        self.consumed_after_ms = Histogram(LATENCY_BUCKETS_MS)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "count": self.latency_ms.count,
+            "errors": self.errors,
+            "latencyMs": self.latency_ms.snapshot(),
+            "records": self.records.snapshot(),
+            "resultAvailableAfterMs": self.available_after_ms.snapshot(),
+            "resultConsumedAfterMs": self.consumed_after_ms.snapshot(),
+        }
+
+
+_stats: dict[str, _QueryStats] = {}
+_slow_queries: deque[dict[str, Any]] = deque(maxlen=MAX_SLOW_QUERIES)
+_last_profiled: dict[str, float] = {}
+_lock = threading.Lock()
+
+
+def _is_enabled() -> bool:
+    return bool(getattr(settings, "NEO4J_QUERY_METRICS", True))
+
+
+def _get_slow_query_ms() -> float:
+    return float(getattr(settings, "NEO4J_SLOW_QUERY_MS", 500))
+
+
+def _query_stats(name: str) -> _QueryStats:
+    """Get the stats of a name; call with _lock held."""
+    stats = _stats.get(name)
+    if stats is None:
+        if len(_stats) >= MAX_QUERY_NAMES and name not in _query_names.values():
+            name = OTHER_QUERY_NAME
+        stats = _stats.setdefault(name, _QueryStats())
+    return stats
+
+
+def _describe_params(parameters: dict[str, Any] | None) -> dict[str, Any]:
+    """
+    Describe parameters for logs and the metrics endpoint without their values.
+
+    Numbers, booleans and None (limits, depths) are kept; strings and
+    collections, which may hold user input or crawled content, become their
+    type and size.
+    """
+    described = {}
+    for key, value in (parameters or {}).items():
+        if value is None or isinstance(value, (bool, int, float)):
+            described[key] = value
+        elif isinstance(value, (str, list, tuple, dict)):
+            described[key] = f"<{type(value).__name__} of {len(value)}>"
+        else:
+            described[key] = f"<{type(value).__name__}>"
+    return described
+
+
+def record_query(
+    query: str,
+    parameters: dict[str, Any] | None,
+    seconds: float,
+    records: int,
+    summary=None,
+) -> None:
+    """
+    Record one executed query.
+
+    Args:
+        query: Cypher query string
+        parameters: Query parameters
+        seconds: Client latency from run to the result being consumed
+        records: Records the caller read
+        summary: neo4j ResultSummary, if available
+    """
+    name = get_query_name(query)
+    latency_ms = seconds * 1000
+    with _lock:
+        stats = _query_stats(name)
+        stats.latency_ms.observe(latency_ms)
+        stats.records.observe(records)
+        if summary is not None:
+            if summary.result_available_after is not None:
+                stats.available_after_ms.observe(summary.result_available_after)
+            if summary.result_consumed_after is not None:
+                stats.consumed_after_ms.observe(summary.result_consumed_after)
+
+    if latency_ms >= _get_slow_query_ms():
+        _record_slow_query(name, query, parameters, latency_ms, records, summary)
+
+
+def record_query_error(query: str) -> None:
+    """Record a query that failed."""
+    with _lock:
+        _query_stats(get_query_name(query)).errors += 1
+
+
+def _record_slow_query(
+    name: str,
+    query: str,
+    parameters: dict[str, Any] | None,
+    latency_ms: float,
+    records: int,
+    summary,
+) -> None:
+    params = _describe_params(parameters)
+    logger.warning(
+        f"Slow Neo4j query {name}: {latency_ms:.0f} ms, {records} records, params: {params}"
+    )
+    entry = {
+        "name": name,
+        "at": time.time(),
+        "latencyMs": round(latency_ms, 3),
+        "records": records,
+        "parameters": params,
+        "plan": None,
+    }
+    with _lock:
+        _slow_queries.append(entry)
+
+    is_read = summary is not None and summary.query_type == "r"
+    if is_read and not _PLANNED_QUERY.match(query) and getattr(settings, "NEO4J_SLOW_QUERY_PROFILE", False):
+        interval = float(getattr(settings, "NEO4J_SLOW_QUERY_PROFILE_INTERVAL", 300))
+        now = time.monotonic()
+        with _lock:
+            last = _last_profiled.get(name)
+            if last is not None and now - last < interval:
+                return
+            _last_profiled[name] = now
+        threading.Thread(
+            target=_profile_query,
+            args=(entry, query, parameters or {}),
+            name="neo4j-profile-slow-query",
+            daemon=True,
+        ).start()
+
+
+def _compact_plan(plan: dict[str, Any]) -> dict[str, Any]:
+    """Keep the operator, rows and db hits of each profiled plan step."""
+    return {
+        "operator": plan.get("operatorType"),
+        "rows": plan.get("rows"),
+        "dbHits": plan.get("dbHits"),
+        "children": [_compact_plan(child) for child in plan.get("children", [])],
+    }
+
+
+def _total_db_hits(plan: dict[str, Any]) -> int:
+    return (plan.get("dbHits") or 0) + sum(_total_db_hits(c) for c in plan.get("children", []))
+
+
+def _profile_query(entry: dict[str, Any], query: str, parameters: dict[str, Any]) -> None:
+    """Re-run a slow read query with PROFILE and attach its plan to the entry."""
+    from neo4j import READ_ACCESS
+
+    from services.neo4j_client import get_neo4j_client
+
+    try:
+        # A plain driver session, so the profile run is not recorded itself
+        with get_neo4j_client().driver.session(default_access_mode=READ_ACCESS) as session:
+            summary = session.run(f"PROFILE {query}", parameters).consume()
+    except Exception as e:
+        logger.error(f"Failed to profile slow Neo4j query {entry['name']}: {e}")
+        return
+
+    if summary.profile:
+        plan = _compact_plan(summary.profile)
+        db_hits = _total_db_hits(summary.profile)
+        with _lock:
+            entry["plan"] = plan
+            entry["dbHits"] = db_hits
+        logger.warning(f"Slow Neo4j query {entry['name']} profile: {db_hits} db hits")
+
+
+def get_query_metrics() -> dict[str, Any]:
+    """Get this process's query histograms and recent slow queries."""
+    with _lock:
+        return {
+            "slowQueryMs": _get_slow_query_ms(),
+            "queries": {name: stats.snapshot() for name, stats in sorted(_stats.items())},
+            "slowQueries": [dict(entry) for entry in _slow_queries],
+        }
+
+
+# ============================================================================
+# Session, transaction and result proxies
+# ============================================================================
+
+class _InstrumentedResult:
+    """
+    Result proxy recording the query once its records are read or consumed.
+
+    A result its caller stops reading early (a stream closed before its end,
+    single(), ...) is recorded when its transaction or session closes, with
+    the records read so far.
+    """
+
+    def __init__(self, result, query: str, parameters: dict[str, Any] | None, started: float):
+        self._result = result
+        self._query = query
+        self._parameters = parameters
+        self._started = started
+        self._records = 0
+        self._recorded = False
+
+    def _finish(self, summary) -> None:
+        if not self._recorded:
+            self._recorded = True
+            record_query(
+                self._query,
+                self._parameters,
+                time.perf_counter() - self._started,
+                self._records,
+                summary,
+            )
+
+    def _fail(self) -> None:
+        if not self._recorded:
+            self._recorded = True
+            record_query_error(self._query)
+
+    def _close(self) -> None:
+        """Record the query if it has not been, with its summary if still available."""
+        if self._recorded:
+            return
+        try:
+            summary = self._result.consume()
+        except Exception:
+            summary = None
+        self._finish(summary)
+
+    def __iter__(self):
+        try:
+            for record in self._result:
+                self._records += 1
+                yield record
+            summary = self._result.consume()
+        except Exception:
+            self._fail()
+            raise
+        self._finish(summary)
+
+    def consume(self):
+        summary = self._result.consume()
+        self._finish(summary)
+        return summary
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._result, name)
+
+
+class _AsyncInstrumentedResult(_InstrumentedResult):
+    """Async variant of _InstrumentedResult."""
+
+    async def _close(self) -> None:
+        if self._recorded:
+            return
+        try:
+            summary = await self._result.consume()
+        except Exception:
+            summary = None
+        self._finish(summary)
+
+    async def __aiter__(self):
+        try:
+            async for record in self._result:
+                self._records += 1
+                yield record
+            summary = await self._result.consume()
+        except Exception:
+            self._fail()
+            raise
+        self._finish(summary)
+
+    async def consume(self):
+        summary = await self._result.consume()
+        self._finish(summary)
+        return summary
+
+
+class _ResultTracker:
+    """Keeps the results of a session or transaction until they are recorded."""
+
+    def __init__(self):
+        self._results: list[_InstrumentedResult] = []
+
+    def _track(self, result: _InstrumentedResult) -> _InstrumentedResult:
+        self._results = [pending for pending in self._results if not pending._recorded]
+        self._results.append(result)
+        return result
+
+    def _close_results(self) -> None:
+        results, self._results = self._results, []
+        for result in results:
+            result._close()
+
+    async def _aclose_results(self) -> None:
+        results, self._results = self._results, []
+        for result in results:
+            await result._close()
+
+
+def _run(run: Callable, query: str, parameters: dict[str, Any] | None, **kwargs):
+    started = time.perf_counter()
+    try:
+        result = run(query, parameters, **kwargs)
+    except Exception:
+        record_query_error(query)
+        raise
+    return _InstrumentedResult(result, query, parameters, started)
+
+
+async def _arun(run: Callable, query: str, parameters: dict[str, Any] | None, **kwargs):
+    started = time.perf_counter()
+    try:
+        result = await run(query, parameters, **kwargs)
+    except Exception:
+        record_query_error(query)
+        raise
+    return _AsyncInstrumentedResult(result, query, parameters, started)
+
+
+class _InstrumentedTransaction(_ResultTracker):
+    """Transaction proxy whose queries are recorded."""
+
+    def __init__(self, tx):
+        super().__init__()
+        self._tx = tx
+
+    def run(self, query: str, parameters: dict[str, Any] | None = None, **kwargs):
+        return self._track(_run(self._tx.run, query, parameters, **kwargs))
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._tx, name)
+
+
+class _AsyncInstrumentedTransaction(_InstrumentedTransaction):
+    """Async variant of _InstrumentedTransaction."""
+
+    async def run(self, query: str, parameters: dict[str, Any] | None = None, **kwargs):
+        return self._track(await _arun(self._tx.run, query, parameters, **kwargs))
+
+
+class _InstrumentedSession(_ResultTracker):
+    """Session proxy recording auto-commit queries and transaction function queries."""
+
+    def __init__(self, session):
+        super().__init__()
+        self._session = session
+
+    def run(self, query: str, parameters: dict[str, Any] | None = None, **kwargs):
+        return self._track(_run(self._session.run, query, parameters, **kwargs))
+
+    def _instrument_work(self, work: Callable) -> Callable:
+        @functools.wraps(work)
+        def instrumented_work(tx, *args, **kwargs):
+            instrumented = _InstrumentedTransaction(tx)
+            try:
+                return work(instrumented, *args, **kwargs)
+            finally:
+                instrumented._close_results()
+
+        return instrumented_work
+
+    def execute_read(self, work: Callable, *args, **kwargs) -> Any:
+        return self._session.execute_read(self._instrument_work(work), *args, **kwargs)
+
+    def execute_write(self, work: Callable, *args, **kwargs) -> Any:
+        return self._session.execute_write(self._instrument_work(work), *args, **kwargs)
+
+    def close(self) -> None:
+        try:
+            self._close_results()
+        finally:
+            self._session.close()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._session, name)
+
+
+class _AsyncInstrumentedSession(_InstrumentedSession):
+    """Async variant of _InstrumentedSession."""
+
+    async def run(self, query: str, parameters: dict[str, Any] | None = None, **kwargs):
+        return self._track(await _arun(self._session.run, query, parameters, **kwargs))
+
+    def _instrument_work(self, work: Callable) -> Callable:
+        @functools.wraps(work)
+        async def instrumented_work(tx, *args, **kwargs):
+            instrumented = _AsyncInstrumentedTransaction(tx)
+            try:
+                return await work(instrumented, *args, **kwargs)
+            finally:
+                await instrumented._aclose_results()
+
+        return instrumented_work
+
+    async def execute_read(self, work: Callable, *args, **kwargs) -> Any:
+        return await self._session.execute_read(self._instrument_work(work), *args, **kwargs)
+
+    async def execute_write(self, work: Callable, *args, **kwargs) -> Any:
+        return await self._session.execute_write(self._instrument_work(work), *args, **kwargs)
+
+    async def close(self) -> None:
+        try:
+            await self._aclose_results()
+        finally:
+            await self._session.close()
+
+
+def instrument_session(session):
+    """Wrap a Neo4j session so its queries are recorded (unless NEO4J_QUERY_METRICS is off)."""
+    return _InstrumentedSession(session) if _is_enabled() else session
+
+
+def ainstrument_session(session):
+    """Async variant of instrument_session."""
+    return _AsyncInstrumentedSession(session) if _is_enabled() else session
@@ -0,0 +1,246 @@
+"""
+Neo4j schema bootstrap service.
+
+Creates the uniqueness constraints and indexes backing every MERGE key and
+hot lookup property used by the sync and graph services. All statements use
+IF NOT EXISTS, so bootstrapping is idempotent and cheap to repeat.
+"""
+
+import logging
+import re
+from typing import Any
+
+from services.neo4j_client import get_neo4j_client
+
+logger = logging.getLogger(__name__)
+
+# Uniqueness constraints (each one is backed by a range index)
+SCHEMA_CONSTRAINTS: dict[str, str] = {
+    "website_domain": (
+        "CREATE CONSTRAINT website_domain IF NOT EXISTS "
+        "FOR (w:Website) REQUIRE w.domain IS UNIQUE"
+    ),
+    "channel_node_id": (
+        "CREATE CONSTRAINT channel_node_id IF NOT EXISTS "
+        "FOR (c:Channel) REQUIRE c.nodeId IS UNIQUE"
+    ),
+    "article_cont_id": (
+        "CREATE CONSTRAINT article_cont_id IF NOT EXISTS "
+        "FOR (a:Article) REQUIRE a.contId IS UNIQUE"
+    ),
+    "tag_tag_id": (
+        "CREATE CONSTRAINT tag_tag_id IF NOT EXISTS "
+        "FOR (t:Tag) REQUIRE t.tagId IS UNIQUE"
+    ),
+    "media_platform_name": (
+        "CREATE CONSTRAINT media_platform_name IF NOT EXISTS "
+        "FOR (p:MediaPlatform) REQUIRE p.name IS UNIQUE"
+    ),
+    "media_content_key": (
+        "CREATE CONSTRAINT media_content_key IF NOT EXISTS "
+        "FOR (c:MediaContent) REQUIRE (c.contentId, c.platform) IS UNIQUE"
+    ),
+    "media_keyword_name": (
+        "CREATE CONSTRAINT media_keyword_name IF NOT EXISTS "
+        "FOR (k:MediaKeyword) REQUIRE k.name IS UNIQUE"
+    ),
+    "media_comment_key": (
+        "CREATE CONSTRAINT media_comment_key IF NOT EXISTS "
+        "FOR (cm:MediaComment) REQUIRE (cm.commentId, cm.platform) IS UNIQUE"
+    ),
+}
+
+# Range indexes for non-unique lookup properties
+SCHEMA_RANGE_INDEXES: dict[str, str] = {
+    "article_task_id": (
+        "CREATE INDEX article_task_id IF NOT EXISTS "
+        "FOR (a:Article) ON (a.taskId)"
+    ),
+    "media_content_platform": (
+        "CREATE INDEX media_content_platform IF NOT EXISTS "
+        "FOR (c:MediaContent) ON (c.platform)"
+    ),
+    "media_content_liked_count": (
+        "CREATE INDEX media_content_liked_count IF NOT EXISTS "
+        "FOR (c:MediaContent) ON (c.likedCount)"
+    ),
+    # Composite: equality on platform, then likedCount in index order
+    "media_content_platform_liked_count": (
+        "CREATE INDEX media_content_platform_liked_count IF NOT EXISTS "
+        "FOR (c:MediaContent) ON (c.platform, c.likedCount)"
+    ),
+    "media_keyword_content_count": (
+        "CREATE INDEX media_keyword_content_count IF NOT EXISTS "
+        "FOR (k:MediaKeyword) ON (k.contentCount)"
+    ),
+    "tag_content_count": (
+        "CREATE INDEX tag_content_count IF NOT EXISTS "
+        "FOR (t:Tag) ON (t.contentCount)"
+    ),
+    "media_keyword_key": (
+        "CREATE INDEX media_keyword_key IF NOT EXISTS "
+        "FOR (k:MediaKeyword) ON (k.key)"
+    ),
+}
+
+# Fulltext indexes (CJK analyzer so Chinese titles tokenize into bigrams)
+SCHEMA_FULLTEXT_INDEXES: dict[str, str] = {
+    "article_title_fulltext": (
+        "CREATE FULLTEXT INDEX article_title_fulltext IF NOT EXISTS "
+        "FOR (a:Article) ON EACH [a.title] "
+        "OPTIONS {indexConfig: {`fulltext.analyzer`: 'cjk'}}"
+    ),
+    "tag_name_fulltext": (
+        "CREATE FULLTEXT INDEX tag_name_fulltext IF NOT EXISTS "
+        "FOR (t:Tag) ON EACH [t.name] "
+        "OPTIONS {indexConfig: {`fulltext.analyzer`: 'cjk'}}"
+    ),
+    "media_keyword_name_fulltext": (
+        "CREATE FULLTEXT INDEX media_keyword_name_fulltext IF NOT EXISTS "
+        "FOR (k:MediaKeyword) ON EACH [k.name] "
+        "OPTIONS {indexConfig: {`fulltext.analyzer`: 'cjk'}}"
+    ),
+}
+
+# Fulltext search modes: whole terms, term prefixes, or fuzzy (edit distance) terms
+SEARCH_MODES = ("exact", "prefix", "fuzzy")
+
+# Characters with a meaning in Lucene query syntax
+_LUCENE_SPECIAL = re.compile(r'([+\-&|!(){}\[\]^"~*?:\\/])')
+
+# Runs of characters the cjk analyzer indexes as bigrams (Han, kana, Hangul)
+_CJK_RUN = re.compile(r"([\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff\uac00-\ud7af]+)")
+
+# Set once the schema has been ensured in this process
+_schema_ready = False
+
+
+def bootstrap_schema() -> dict[str, list[str]]:
+    """
+    Create all constraints and indexes that do not exist yet.
+
+    A failing statement (for example a uniqueness constraint over data that
+    already contains duplicates) is logged and reported without aborting
+    the remaining statements.
+
+    Returns:
+        Names of schema objects that were "added", already "existing" or "failed"
+    """
+    client = get_neo4j_client()
+    report: dict[str, list[str]] = {"added": [], "existing": [], "failed": []}
+
+    statements = {
+        **SCHEMA_CONSTRAINTS,
+        **SCHEMA_RANGE_INDEXES,
+        **SCHEMA_FULLTEXT_INDEXES,
+    }
+    for name, statement in statements.items():
+        try:
+            summary = client.run_write_query(statement)
+        except Exception as e:
+            logger.error(f"Failed to create Neo4j schema object {name}: {e}")
+            report["failed"].append(name)
+            continue
+
+        if summary["constraints_added"] or summary["indexes_added"]:
+            logger.info(f"Created Neo4j schema object: {name}")
+            report["added"].append(name)
+        else:
+            report["existing"].append(name)
+
+    return report
+
+
+def ensure_schema() -> None:
+    """
+    Bootstrap the schema once per process before the first sync.
+
+    Failures are logged but never block the sync itself.
+    """
+    global _schema_ready
+    if _schema_ready:
+        return
+
+    try:
+        report = bootstrap_schema()
+    except Exception as e:
+        logger.error(f"Neo4j schema bootstrap failed: {e}")
+        return
+
+    if report["added"]:
+        logger.info(f"Neo4j schema bootstrap added: {', '.join(report['added'])}")
+    _schema_ready = not report["failed"]
+
+
+def _cjk_bigrams(run: str) -> list[str]:
+    """Split a CJK run into the overlapping bigrams the cjk analyzer indexes."""
+    if len(run) == 1:
+        return [run]
+    return [run[i : i + 2] for i in range(len(run) - 1)]
+
+
+def _term_clauses(term: str, mode: str) -> list[str]:
+    """
+    Turn one whitespace-separated input term into Lucene clauses.
+
+    The cjk analyzer indexes CJK text as bigrams, so a wildcard or fuzzy
+    suffix on a longer CJK term can never match a token. CJK runs are split
+    into bigrams instead; in prefix mode only the term's last bigram gets a
+    wildcard, and fuzzy matching applies to non-CJK parts only.
+    """
+    # Keep bare operator words from being parsed as boolean operators
+    if term in ("AND", "OR", "NOT"):
+        parts = [term.lower()]
+    else:
+        parts = [part for part in _CJK_RUN.split(term) if part]
+
+    clauses: list[tuple[str, bool]] = []
+    for part in parts:
+        if _CJK_RUN.fullmatch(part):
+            clauses.extend((bigram, True) for bigram in _cjk_bigrams(part))
+        else:
+            clauses.append((_LUCENE_SPECIAL.sub(r"\\\1", part), False))
+
+    result = []
+    for index, (clause, is_cjk) in enumerate(clauses):
+        if mode == "prefix" and index == len(clauses) - 1:
+            clause = f"{clause}*"
+        elif mode == "fuzzy" and not is_cjk:
+            clause = f"{clause}~"
+        result.append(clause)
+    return result
+
+
+def build_fulltext_query(text: str, mode: str = "exact") -> str:
+    """
+    Build a Lucene query for the fulltext indexes from user input.
+
+    User input is split on whitespace and Lucene syntax is escaped, so it is
+    always matched as plain terms. CJK text is matched as the bigrams the
+    cjk analyzer indexes. Every term must match.
+
+    Args:
+        text: Search text
+        mode: "exact" matches whole terms, "prefix" also matches terms
+              starting with each input term, "fuzzy" tolerates typos
+              (in non-CJK terms)
+
+    Returns:
+        Lucene query string, empty if the text has no terms
+    """
+    if mode not in SEARCH_MODES:
+        raise ValueError(f"Unknown search mode: {mode}. Supported: {SEARCH_MODES}")
+
+    return " AND ".join(
+        clause for term in text.split() for clause in _term_clauses(term, mode)
+    )
+
+
+def get_schema_status() -> list[dict[str, Any]]:
+    """List existing constraints and indexes with their state."""
+    client = get_neo4j_client()
+    return client.run_query(
+        "SHOW INDEXES YIELD name, type, labelsOrTypes, properties, state, owningConstraint "
+        "RETURN name, type, labelsOrTypes, properties, state, owningConstraint "
+        "ORDER BY name"
+    )
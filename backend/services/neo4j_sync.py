@@ -5,11 +5,19 @@ Syncs crawled data from PostgreSQL to Neo4j as graph nodes and relationships.
 """
 
 import logging
-from typing import Any
+from contextlib import aclosing, closing
+from typing import Any, Iterator
 from uuid import UUID
 
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
 from apps.crawl.models import CrawlItem, CrawlTask
-from services.neo4j_client import get_neo4j_client
+from services.keyword_popularity import keyword_counts_reconciled
+from services.neo4j_client import get_async_neo4j_client, get_neo4j_client
+from services.neo4j_metrics import register_queries
+from services.neo4j_schema import build_fulltext_query, ensure_schema
+from services.single_flight import single_flight
 
 logger = logging.getLogger(__name__)
 
@@ -20,100 +28,106 @@ SET w.name = $name
 RETURN w
 """
 
-MERGE_CHANNEL_QUERY = """
-MERGE (c:Channel {nodeId: $nodeId})
-SET c.name = $name, c.desc = $desc
+MERGE_CHANNELS_QUERY = """
+UNWIND $rows AS row
+MERGE (c:Channel {nodeId: row.nodeId})
+SET c.name = row.name, c.desc = row.desc
 WITH c
 MATCH (w:Website {domain: 'thepaper.cn'})
 MERGE (w)-[:HAS_CHANNEL]->(c)
-RETURN c
 """
 
-MERGE_ARTICLE_QUERY = """
-MERGE (a:Article {contId: $contId})
-SET a.title = $title,
-    a.author = $author,
-    a.url = $url,
-    a.summary = $summary,
-    a.pubTime = $pubTime,
-    a.taskId = $taskId
-WITH a
-MATCH (c:Channel {nodeId: $channelId})
+MERGE_ARTICLES_QUERY = """
+UNWIND $rows AS row
+MERGE (a:Article {contId: row.contId})
+SET a.title = row.title,
+    a.author = row.author,
+    a.url = row.url,
+    a.summary = row.summary,
+    a.pubTime = row.pubTime,
+    a.taskId = row.taskId
+WITH a, row
+MATCH (c:Channel {nodeId: row.channelId})
 MERGE (c)-[:CONTAINS]->(a)
-RETURN a
 """
 
-MERGE_TAG_QUERY = """
-MERGE (t:Tag {tagId: $tagId})
-SET t.name = $name
-WITH t
-MATCH (a:Article {contId: $contId})
-MERGE (a)-[:HAS_TAG]->(t)
-RETURN t
+# New HAS_TAG relationships also bump the tag's maintained contentCount
+MERGE_TAGS_QUERY = """
+UNWIND $rows AS row
+MERGE (t:Tag {tagId: row.tagId})
+SET t.name = row.name
+WITH t, row
+MATCH (a:Article {contId: row.contId})
+WHERE NOT EXISTS { (a)-[:HAS_TAG]->(t) }
+CREATE (a)-[:HAS_TAG]->(t)
+SET t.contentCount = coalesce(t.contentCount, 0) + 1
 """
 
 
-def sync_task_to_neo4j(task_id: str | UUID) -> dict[str, Any]:
+def get_sync_batch_size() -> int:
+    """Get the configured number of CrawlItems written per chunk."""
+    return max(1, int(getattr(settings, "NEO4J_SYNC_BATCH_SIZE", 500)))
+
+
+def sync_task_to_neo4j(task_id: str | UUID, batch_size: int | None = None) -> dict[str, Any]:
     """
     Sync all items from a CrawlTask to Neo4j.
 
+    Items are written in chunks: channels, articles and tags of a chunk are
+    each written with one UNWIND statement inside a single transaction, and
+    the chunk's items are then marked as synced with one UPDATE. A chunk that
+    fails to write is logged and left unsynced, so it is retried by the next
+    sync while the committed chunks stay marked.
+
     Args:
         task_id: UUID of the CrawlTask
+        batch_size: Items per chunk (defaults to NEO4J_SYNC_BATCH_SIZE)
 
     Returns:
-        Summary of sync operation
+        Summary of sync operation; tags_synced counts HAS_TAG relationships created
     """
     logger.info(f"Starting Neo4j sync for task {task_id}")
 
     client = get_neo4j_client()
+    batch_size = batch_size or get_sync_batch_size()
 
     # Get items that haven't been synced yet
     items = CrawlItem.objects.filter(
         task_id=task_id,
         neo4j_synced=False,
-    ).select_related("task")
+    ).order_by("pk")
 
     if not items.exists():
         logger.info(f"No items to sync for task {task_id}")
         return {"items_synced": 0, "task_id": str(task_id)}
 
-    # Ensure Website node exists
+    # Ensure constraints/indexes and the Website node exist
+    ensure_schema()
     _ensure_website_node(client)
 
     # Track unique channels to sync
     channels_synced: set[int] = set()
     items_synced = 0
     tags_synced = 0
+    chunks_failed = 0
 
     with client.session() as session:
-        for item in items:
-            try:
-                # Sync channel if not already done
-                if item.channel_id and item.channel_id not in channels_synced:
-                    _sync_channel(session, item.channel_id, item.channel_name)
-                    channels_synced.add(item.channel_id)
-
-                # Sync article
-                _sync_article(session, item)
-
-                # Sync tags
-                for tag in item.tags:
-                    if tag.get("tagId") and tag.get("tag"):
-                        _sync_tag(session, item.cont_id, tag)
-                        tags_synced += 1
-
-                # Mark item as synced
-                item.neo4j_synced = True
-                item.save(update_fields=["neo4j_synced"])
-                items_synced += 1
-
-            except Exception as e:
-                logger.error(f"Error syncing item {item.cont_id}: {e}")
+        for chunk in _iter_chunks(items, batch_size):
+            written = _sync_item_chunk(session, chunk, channels_synced)
+            if written is None:
+                chunks_failed += 1
                 continue
+            items_synced += written[0]
+            tags_synced += written[1]
+
+    if items_synced:
+        # Let graph reads in other processes observe this sync
+        client.publish_bookmarks()
 
     logger.info(
         f"Neo4j sync completed for task {task_id}: "
-        f"{items_synced} items, {len(channels_synced)} channels, {tags_synced} tags"
+        f"{items_synced} items, {len(channels_synced)} channels, {tags_synced} new tag links, "
+        f"{chunks_failed} failed chunks"
     )
 
     return {
@@ -121,6 +135,7 @@ def sync_task_to_neo4j(task_id: str | UUID) -> dict[str, Any]:
         "items_synced": items_synced,
         "channels_synced": len(channels_synced),
         "tags_synced": tags_synced,
+        "chunks_failed": chunks_failed,
     }
 
 
@@ -132,219 +147,489 @@ def _ensure_website_node(client) -> None:
     )
 
 
-def _sync_channel(session, channel_id: int, channel_name: str) -> None:
-    """Sync a channel node to Neo4j."""
-    session.run(
-        MERGE_CHANNEL_QUERY,
-        {
-            "nodeId": channel_id,
-            "name": channel_name,
-            "desc": "",
-        },
-    )
+def _iter_chunks(items, batch_size: int) -> Iterator[list[CrawlItem]]:
+    """Stream a queryset in lists of at most batch_size items."""
+    chunk: list[CrawlItem] = []
+    for item in items.iterator(chunk_size=batch_size):
+        chunk.append(item)
+        if len(chunk) >= batch_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
 
 
-def _sync_article(session, item: CrawlItem) -> None:
-    """Sync an article node to Neo4j."""
+def _sync_item_chunk(
+    session,
+    items: list[CrawlItem],
+    channels_synced: set[int],
+) -> tuple[int, int] | None:
+    """
+    Write one chunk of CrawlItems and mark them as synced.
+
+    Args:
+        session: Neo4j session
+        items: CrawlItems of the chunk
+        channels_synced: Channel ids written so far; updated once the chunk commits
+
+    Returns:
+        Number of items written and HAS_TAG relationships created, or None
+        if the chunk failed
+    """
+    channels: dict[int, dict[str, Any]] = {}
+    articles: list[dict[str, Any]] = []
+    tags: list[dict[str, Any]] = []
+    item_ids = []
+
+    for item in items:
+        try:
+            if item.channel_id and item.channel_id not in channels_synced:
+                channels[item.channel_id] = _channel_row(item)
+            articles.append(_article_row(item))
+            tags.extend(
+                _tag_row(item.cont_id, tag)
+                for tag in item.tags
+                if tag.get("tagId") and tag.get("tag")
+            )
+            item_ids.append(item.pk)
+        except Exception as e:
+            logger.error(f"Error syncing item {item.cont_id}: {e}")
+
+    if not item_ids:
+        return 0, 0
+
+    try:
+        tags_linked = session.execute_write(
+            _write_item_chunk_tx, list(channels.values()), articles, tags
+        )
+    except Exception as e:
+        logger.error(f"Error writing chunk of {len(item_ids)} items: {e}")
+        return None
+
+    CrawlItem.objects.filter(pk__in=item_ids).update(neo4j_synced=True)
+    channels_synced.update(channels)
+    return len(item_ids), tags_linked
+
+
+def _write_item_chunk_tx(
+    tx,
+    channels: list[dict[str, Any]],
+    articles: list[dict[str, Any]],
+    tags: list[dict[str, Any]],
+) -> int:
+    """
+    Write one chunk of channel, article and tag rows in a single transaction.
+
+    Returns:
+        Number of HAS_TAG relationships created
+    """
+    if channels:
+        tx.run(MERGE_CHANNELS_QUERY, {"rows": channels}).consume()
+    tx.run(MERGE_ARTICLES_QUERY, {"rows": articles}).consume()
+    if not tags:
+        return 0
+    summary = tx.run(MERGE_TAGS_QUERY, {"rows": tags}).consume()
+    return summary.counters.relationships_created
+
+
+def _channel_row(item: CrawlItem) -> dict[str, Any]:
+    """Map a CrawlItem's channel to Channel properties."""
+    return {
+        "nodeId": item.channel_id,
+        "name": item.channel_name,
+        "desc": "",
+    }
+
+
+def _article_row(item: CrawlItem) -> dict[str, Any]:
+    """Map a CrawlItem to Article properties."""
     pub_time = item.publish_time.isoformat() if item.publish_time else ""
 
-    session.run(
-        MERGE_ARTICLE_QUERY,
-        {
-            "contId": item.cont_id,
-            "title": item.title,
-            "author": item.author,
-            "url": item.url,
-            "summary": item.summary[:500] if item.summary else "",
-            "pubTime": pub_time,
-            "taskId": str(item.task_id),
-            "channelId": item.channel_id,
-        },
-    )
+    return {
+        "contId": item.cont_id,
+        "title": item.title,
+        "author": item.author,
+        "url": item.url,
+        "summary": item.summary[:500] if item.summary else "",
+        "pubTime": pub_time,
+        "taskId": str(item.task_id),
+        "channelId": item.channel_id,
+    }
 
 
-def _sync_tag(session, cont_id: str, tag: dict[str, Any]) -> None:
-    """Sync a tag node and relationship to Neo4j."""
-    session.run(
-        MERGE_TAG_QUERY,
-        {
-            "tagId": tag["tagId"],
-            "name": tag["tag"],
-            "contId": cont_id,
-        },
-    )
+# Article properties the task graph can return
+TASK_GRAPH_ARTICLE_FIELDS = ("contId", "title", "author", "url", "summary", "pubTime", "taskId")
 
+# Article properties returned when no fields are requested (enough to render)
+TASK_GRAPH_DEFAULT_FIELDS = ("author", "pubTime")
 
-def get_task_graph_data(task_id: str | UUID) -> dict[str, Any]:
-    """
-    Fetch graph data for a specific task from Neo4j.
+# Task graph nodes are map projections of the properties needed to render
+# them plus the requested $fields; full properties come from the node queries
+GET_TASK_GRAPH_QUERY = """
+MATCH (c:Channel)-[:CONTAINS]->(a:Article {taskId: $taskId})
+OPTIONAL MATCH (a)-[:HAS_TAG]->(t:Tag)
+RETURN c {.nodeId, .name} as c,
+       a {.contId, .title} as a,
+       [field IN $fields | a[field]] as fieldValues,
+       collect(DISTINCT t {.tagId, .name}) as tags
+"""
 
-    Args:
-        task_id: UUID of the CrawlTask
+# Full node lookups by graph node id prefix
+GET_NODE_QUERIES: dict[str, tuple[str, str]] = {
+    "channel": ("Channel", "MATCH (n:Channel {nodeId: $id}) RETURN n"),
+    "article": ("Article", "MATCH (n:Article {contId: $id}) RETURN n"),
+    "tag": ("Tag", "MATCH (n:Tag {tagId: $id}) RETURN n"),
+}
+
+GET_TASK_TAGS_QUERY = """
+MATCH (a:Article {taskId: $taskId})-[:HAS_TAG]->(t:Tag)
+RETURN t.tagId as tagId, t.name as name, count(a) as count
+ORDER BY count DESC
+LIMIT $limit
+"""
 
-    Returns:
-        Graph data with nodes and edges
-    """
-    client = get_neo4j_client()
+# Maintained counter, read through the tag_content_count index
+GET_POPULAR_TAGS_QUERY = """
+MATCH (t:Tag)
+WHERE t.contentCount > 0
+RETURN t.tagId as tagId, t.name as name, t.contentCount as count
+ORDER BY t.contentCount DESC
+LIMIT $limit
+"""
+
+# Relationship aggregation, used until the counters have been reconciled
+COUNT_POPULAR_TAGS_QUERY = """
+MATCH (a:Article)-[:HAS_TAG]->(t:Tag)
+RETURN t.tagId as tagId, t.name as name, count(a) as count
+ORDER BY count DESC
+LIMIT $limit
+"""
+
+SEARCH_NODES_QUERY = """
+CALL {
+    CALL db.index.fulltext.queryNodes('article_title_fulltext', $query, {limit: $limit})
+    YIELD node, score
+    RETURN node.contId as id, 'Article' as type, node.title as label, node, score
+    UNION ALL
+    CALL db.index.fulltext.queryNodes('tag_name_fulltext', $query, {limit: $limit})
+    YIELD node, score
+    RETURN toString(node.tagId) as id, 'Tag' as type, node.name as label, node, score
+}
+RETURN id, type, label, properties(node) as properties, score
+ORDER BY score DESC
+LIMIT $limit
+"""
+
+register_queries(globals())
+
+
+def _tag_row(cont_id: str, tag: dict[str, Any]) -> dict[str, Any]:
+    """Map a tag object to Tag properties and its article."""
+    return {
+        "tagId": tag["tagId"],
+        "name": tag["tag"],
+        "contId": cont_id,
+    }
+
+
+def _task_graph_fields(fields: list[str] | None) -> list[str]:
+    """Select the requested article properties, or the defaults."""
+    return [
+        field
+        for field in dict.fromkeys(fields or TASK_GRAPH_DEFAULT_FIELDS)
+        if field in TASK_GRAPH_ARTICLE_FIELDS
+    ]
 
-    # Query for articles, channels, and tags related to this task
-    query = """
-    MATCH (c:Channel)-[:CONTAINS]->(a:Article {taskId: $taskId})
-    OPTIONAL MATCH (a)-[:HAS_TAG]->(t:Tag)
-    RETURN c, a, collect(DISTINCT t) as tags
+
+class _TaskGraphBuilder:
     """
+    Build graph nodes, edges and stats from task graph query records.
 
-    nodes: list[dict[str, Any]] = []
-    edges: list[dict[str, Any]] = []
-    node_ids: set[str] = set()
+    Records are added one at a time as they stream in from Neo4j.
+    """
 
-    with client.session() as session:
-        result = session.run(query, {"taskId": str(task_id)})
-
-        for record in result:
-            channel = record.get("c")
-            article = record.get("a")
-            tags = record.get("tags", [])
-
-            # Add channel node
-            if channel:
-                channel_id = f"channel_{channel.get('nodeId')}"
-                if channel_id not in node_ids:
-                    nodes.append({
-                        "id": channel_id,
-                        "type": "Channel",
-                        "label": channel.get("name", "Unknown"),
-                        "properties": dict(channel),
-                    })
-                    node_ids.add(channel_id)
-
-            # Add article node
-            if article:
-                article_id = f"article_{article.get('contId')}"
-                if article_id not in node_ids:
-                    nodes.append({
-                        "id": article_id,
-                        "type": "Article",
-                        "label": article.get("title", "")[:50],
-                        "properties": dict(article),
+    def __init__(self, article_fields: list[str]):
+        self.article_fields = article_fields
+        self.nodes: list[dict[str, Any]] = []
+        self.edges: list[dict[str, Any]] = []
+        self.node_ids: set[str] = set()
+        self.nodes_by_type: dict[str, int] = {}
+
+    def _add_node(self, node: dict[str, Any]) -> None:
+        self.nodes.append(node)
+        self.node_ids.add(node["id"])
+        self.nodes_by_type[node["type"]] = self.nodes_by_type.get(node["type"], 0) + 1
+
+    def add(self, record) -> None:
+        """Add the nodes and edges of one query record."""
+        channel = record.get("c")
+        article = record.get("a")
+        tags = record.get("tags", [])
+
+        # Add channel node
+        if channel:
+            channel_id = f"channel_{channel.get('nodeId')}"
+            if channel_id not in self.node_ids:
+                self._add_node({
+                    "id": channel_id,
+                    "type": "Channel",
+                    "label": channel.get("name") or "Unknown",
+                    "properties": dict(channel),
+                })
+
+        # Add article node
+        if article:
+            article_id = f"article_{article.get('contId')}"
+            if article_id not in self.node_ids:
+                self._add_node({
+                    "id": article_id,
+                    "type": "Article",
+                    "label": (article.get("title") or "")[:50],
+                    "properties": dict(zip(self.article_fields, record.get("fieldValues", []))),
+                })
+
+                # Add CONTAINS edge
+                if channel:
+                    channel_id = f"channel_{channel.get('nodeId')}"
+                    self.edges.append({
+                        "source": channel_id,
+                        "target": article_id,
+                        "type": "CONTAINS",
                     })
-                    node_ids.add(article_id)
-
-                    # Add CONTAINS edge
-                    if channel:
-                        channel_id = f"channel_{channel.get('nodeId')}"
-                        edges.append({
-                            "source": channel_id,
-                            "target": article_id,
-                            "type": "CONTAINS",
-                        })
 
-                # Add tag nodes and edges
-                for tag in tags:
-                    if tag:
-                        tag_id = f"tag_{tag.get('tagId')}"
-                        if tag_id not in node_ids:
-                            nodes.append({
-                                "id": tag_id,
-                                "type": "Tag",
-                                "label": tag.get("name", ""),
-                                "properties": dict(tag),
-                            })
-                            node_ids.add(tag_id)
-
-                        edges.append({
-                            "source": article_id,
-                            "target": tag_id,
-                            "type": "HAS_TAG",
+            # Add tag nodes and edges
+            for tag in tags:
+                if tag:
+                    tag_id = f"tag_{tag.get('tagId')}"
+                    if tag_id not in self.node_ids:
+                        self._add_node({
+                            "id": tag_id,
+                            "type": "Tag",
+                            "label": tag.get("name", ""),
+                            "properties": dict(tag),
                         })
 
-    # Calculate stats
-    stats = {
-        "totalNodes": len(nodes),
-        "totalEdges": len(edges),
-        "nodesByType": {},
-    }
-    for node in nodes:
-        node_type = node["type"]
-        stats["nodesByType"][node_type] = stats["nodesByType"].get(node_type, 0) + 1
+                    self.edges.append({
+                        "source": article_id,
+                        "target": tag_id,
+                        "type": "HAS_TAG",
+                    })
 
-    return {
-        "nodes": nodes,
-        "edges": edges,
-        "stats": stats,
-    }
+    def build(self) -> dict[str, Any]:
+        """Get the graph data with stats."""
+        return {
+            "nodes": self.nodes,
+            "edges": self.edges,
+            "stats": {
+                "totalNodes": len(self.nodes),
+                "totalEdges": len(self.edges),
+                "nodesByType": self.nodes_by_type,
+            },
+        }
 
 
-def get_popular_keywords(limit: int = 50, task_id: str | None = None) -> list[dict[str, Any]]:
+@single_flight("task_graph")
+def get_task_graph_data(task_id: str | UUID, fields: list[str] | None = None) -> dict[str, Any]:
     """
-    Get popular tags/keywords ordered by article count.
+    Fetch graph data for a specific task from Neo4j.
+
+    Nodes carry only the properties needed to render them; use
+    get_node_detail for the full properties of a node.
 
     Args:
-        limit: Maximum number of keywords to return
-        task_id: Optional task ID to filter by
+        task_id: UUID of the CrawlTask
+        fields: Article properties to return (TASK_GRAPH_ARTICLE_FIELDS),
+                TASK_GRAPH_DEFAULT_FIELDS if None
 
     Returns:
-        List of keywords with counts
+        Graph data with nodes and edges
     """
     client = get_neo4j_client()
-
-    if task_id:
-        query = """
-        MATCH (a:Article {taskId: $taskId})-[:HAS_TAG]->(t:Tag)
-        RETURN t.tagId as tagId, t.name as name, count(a) as count
-        ORDER BY count DESC
-        LIMIT $limit
-        """
-        params = {"taskId": str(task_id), "limit": limit}
+    article_fields = _task_graph_fields(fields)
+
+    builder = _TaskGraphBuilder(article_fields)
+    params = {"taskId": str(task_id), "fields": article_fields}
+    with closing(client.stream_query(GET_TASK_GRAPH_QUERY, params)) as records:
+        for record in records:
+            builder.add(record)
+    return builder.build()
+
+
+@single_flight("task_graph")
+async def aget_task_graph_data(
+    task_id: str | UUID,
+    fields: list[str] | None = None,
+) -> dict[str, Any]:
+    """Async variant of get_task_graph_data on the async Neo4j driver."""
+    client = get_async_neo4j_client()
+    article_fields = _task_graph_fields(fields)
+
+    builder = _TaskGraphBuilder(article_fields)
+    params = {"taskId": str(task_id), "fields": article_fields}
+    async with aclosing(client.astream_query(GET_TASK_GRAPH_QUERY, params)) as records:
+        async for record in records:
+            builder.add(record)
+    return builder.build()
+
+
+def _node_lookup(node_id: str) -> tuple[str, str, str | int] | None:
+    """Resolve a task graph node id to its type, query and key."""
+    kind, _, key = node_id.partition("_")
+    if kind not in GET_NODE_QUERIES or not key:
+        return None
+
+    node_type, query = GET_NODE_QUERIES[kind]
+    if kind in ("channel", "tag"):
+        # Channel and tag ids are stored as integers
+        try:
+            return node_type, query, int(key)
+        except ValueError:
+            return None
+    return node_type, query, key
+
+
+def _node_detail(node_id: str, node_type: str, properties: dict[str, Any]) -> dict[str, Any]:
+    """Shape a task graph node with full properties."""
+    if node_type == "Article":
+        label = (properties.get("title") or "")[:50]
     else:
-        query = """
-        MATCH (a:Article)-[:HAS_TAG]->(t:Tag)
-        RETURN t.tagId as tagId, t.name as name, count(a) as count
-        ORDER BY count DESC
-        LIMIT $limit
-        """
-        params = {"limit": limit}
+        label = properties.get("name") or ""
 
-    return client.run_query(query, params)
+    return {
+        "id": node_id,
+        "type": node_type,
+        "label": label,
+        "properties": properties,
+    }
 
 
-def search_nodes(query_text: str, limit: int = 20) -> list[dict[str, Any]]:
+def get_node_detail(node_id: str) -> dict[str, Any] | None:
     """
-    Search nodes by text matching article titles and tag names.
+    Fetch a single task graph node with all of its properties.
 
     Args:
-        query_text: Search query
-        limit: Maximum results to return
+        node_id: Graph node id (channel_<nodeId>, article_<contId> or tag_<tagId>)
 
     Returns:
-        List of matching nodes
+        Node with full properties, or None if the id is unknown or not found
     """
-    client = get_neo4j_client()
+    lookup = _node_lookup(node_id)
+    if lookup is None:
+        return None
+
+    node_type, query, key = lookup
+    records = get_neo4j_client().run_query(query, {"id": key})
+    if not records:
+        return None
+    return _node_detail(node_id, node_type, records[0]["n"])
+
+
+async def aget_node_detail(node_id: str) -> dict[str, Any] | None:
+    """Async variant of get_node_detail on the async Neo4j driver."""
+    lookup = _node_lookup(node_id)
+    if lookup is None:
+        return None
+
+    node_type, query, key = lookup
+    records = await get_async_neo4j_client().run_query(query, {"id": key})
+    if not records:
+        return None
+    return _node_detail(node_id, node_type, records[0]["n"])
+
+
+def _popular_keywords_query(
+    limit: int,
+    task_id: str | None,
+    reconciled: bool,
+) -> tuple[str, dict[str, Any]]:
+    """Select the popular tags query and params, on counters once reconciled."""
+    if task_id:
+        return GET_TASK_TAGS_QUERY, {"taskId": str(task_id), "limit": limit}
+    if not reconciled:
+        return COUNT_POPULAR_TAGS_QUERY, {"limit": limit}
+    return GET_POPULAR_TAGS_QUERY, {"limit": limit}
 
-    # Use case-insensitive contains search
-    query = """
-    CALL {
-        MATCH (a:Article)
-        WHERE toLower(a.title) CONTAINS toLower($query)
-        RETURN a.contId as id, 'Article' as type, a.title as label, a as node
-        UNION
-        MATCH (t:Tag)
-        WHERE toLower(t.name) CONTAINS toLower($query)
-        RETURN toString(t.tagId) as id, 'Tag' as type, t.name as label, t as node
-    }
-    RETURN id, type, label, properties(node) as properties
-    LIMIT $limit
+
+def get_popular_keywords(limit: int = 50, task_id: str | None = None) -> list[dict[str, Any]]:
     """
+    Get popular tags/keywords ordered by article count.
+
+    Args:
+        limit: Maximum number of keywords to return
+        task_id: Optional task ID to filter by
+
+    Returns:
+        List of keywords with counts
+    """
+    reconciled = task_id is not None or keyword_counts_reconciled()
+    query, params = _popular_keywords_query(limit, task_id, reconciled)
+    return get_neo4j_client().run_query(query, params)
+
 
-    results = client.run_query(query, {"query": query_text, "limit": limit})
+async def aget_popular_keywords(
+    limit: int = 50,
+    task_id: str | None = None,
+) -> list[dict[str, Any]]:
+    """Async variant of get_popular_keywords on the async Neo4j driver."""
+    reconciled = task_id is not None or await sync_to_async(
+        keyword_counts_reconciled, thread_sensitive=False
+    )()
+    query, params = _popular_keywords_query(limit, task_id, reconciled)
+    return await get_async_neo4j_client().run_query(query, params)
 
+
+def _search_results(results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Shape node search records."""
     return [
         {
             "id": r["id"],
             "type": r["type"],
             "label": r["label"],
             "properties": r["properties"],
+            "score": r["score"],
         }
         for r in results
     ]
 
+
+def search_nodes(
+    query_text: str,
+    limit: int = 20,
+    mode: str = "exact",
+) -> list[dict[str, Any]]:
+    """
+    Search article titles and tag names, most relevant first.
+
+    Uses the article_title_fulltext and tag_name_fulltext indexes (CJK
+    analyzer), so latency does not grow with the number of nodes.
+
+    Args:
+        query_text: Search query
+        limit: Maximum results to return
+        mode: "exact", "prefix" or "fuzzy" term matching
+
+    Returns:
+        List of matching nodes with their relevance score
+    """
+    lucene_query = build_fulltext_query(query_text, mode)
+    if not lucene_query:
+        return []
+
+    client = get_neo4j_client()
+    results = client.run_query(SEARCH_NODES_QUERY, {"query": lucene_query, "limit": limit})
+    return _search_results(results)
+
+
+async def asearch_nodes(
+    query_text: str,
+    limit: int = 20,
+    mode: str = "exact",
+) -> list[dict[str, Any]]:
+    """Async variant of search_nodes on the async Neo4j driver."""
+    lucene_query = build_fulltext_query(query_text, mode)
+    if not lucene_query:
+        return []
+
+    client = get_async_neo4j_client()
+    results = await client.run_query(SEARCH_NODES_QUERY, {"query": lucene_query, "limit": limit})
+    return _search_results(results)
@@ -0,0 +1,45 @@
+"""
+Redis client service.
+
+Provides a shared Redis client for data structures the Django cache API
+cannot express (sorted sets, pipelines), and an asyncio client for async
+views.
+"""
+
+import asyncio
+import weakref
+
+import redis
+import redis.asyncio
+from django.conf import settings
+
+_redis_client: redis.Redis | None = None
+
+# asyncio clients are bound to the event loop they were created on
+_async_redis_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, redis.asyncio.Redis] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_redis_client() -> redis.Redis:
+    """Get the shared Redis client (responses decoded to str)."""
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.Redis.from_url(
+            getattr(settings, "REDIS_URL", "redis://localhost:6379/0"),
+            decode_responses=True,
+        )
+    return _redis_client
+
+
+def get_async_redis_client() -> redis.asyncio.Redis:
+    """Get the asyncio Redis client of the running event loop (responses decoded to str)."""
+    loop = asyncio.get_running_loop()
+    client = _async_redis_clients.get(loop)
+    if client is None:
+        client = redis.asyncio.Redis.from_url(
+            getattr(settings, "REDIS_URL", "redis://localhost:6379/0"),
+            decode_responses=True,
+        )
+        _async_redis_clients[loop] = client
+    return client
@@ -0,0 +1,332 @@
+"""
+Single-flight coalescing of identical graph queries.
+
+When several requests ask for the same graph data at once (a dashboard
+opened in many tabs, or every client refetching after a sync), only the
+first one runs the Neo4j query; the others wait for it and share its result.
+
+Within a process, concurrent calls with equal arguments share one execution
+(per event loop for async functions, across threads for sync ones). An
+async query runs in its own task, so cancelling any caller, including the
+one that started it, leaves the query running for the others. With
+GRAPH_SINGLE_FLIGHT_DISTRIBUTED enabled, processes also coordinate through
+a Redis lock: the lock holder publishes its result under a short-lived key
+that followers in other processes pick up instead of querying themselves.
+A follower that waits longer than GRAPH_SINGLE_FLIGHT_TIMEOUT, or any Redis
+failure, falls back to running the query locally.
+
+Flight keys include the graph generation, so once a sync has bumped it no
+call joins a query started, or picks up a result published, before the sync.
+
+Coalesced callers receive the same result object, which must therefore be
+treated as read-only. With distributed coalescing every caller receives the
+JSON-decoded result, whichever process ran the query, so results have the
+same types on every path.
+"""
+
+import asyncio
+import hashlib
+import inspect
+import json
+import logging
+import threading
+import time
+import uuid
+import weakref
+from collections import Counter
+from functools import wraps
+from typing import Any, Callable
+
+import orjson
+from django.conf import settings
+
+from core.renderers import render_json
+from services.graph_cache import aget_graph_generation, get_graph_generation
+from services.redis_client import get_async_redis_client, get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# Redis lock held by the process executing a query
+SINGLE_FLIGHT_LOCK_KEY = "graph_single_flight:lock:{key}"
+
+# Redis key holding the executing process's result for followers
+SINGLE_FLIGHT_RESULT_KEY = "graph_single_flight:result:{key}"
+
+# How long a published result stays readable by followers (milliseconds)
+RESULT_TTL_MS = 2000
+
+# Follower poll interval for a remote result (seconds)
+POLL_INTERVAL = 0.05
+
+# Deletes the lock only if it still holds this process's token, atomically
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# Counter names reported by get_single_flight_stats
+STAT_KEYS = (
+    "calls",            # every call of a single-flight function
+    "executed",         # calls that ran the query (misses)
+    "coalesced",        # calls that shared an in-flight query of this process
+    "remote_hits",      # calls that received another process's result
+    "remote_timeouts",  # remote waits that gave up and ran the query
+)
+
+_stats: Counter[str] = Counter()
+_stats_lock = threading.Lock()
+
+
+class _Flight:
+    """An in-flight sync call that other threads can wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+_sync_flights: dict[str, _Flight] = {}
+_sync_flights_lock = threading.Lock()
+
+# In-flight async calls, per event loop (futures are bound to their loop)
+_async_flights: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, asyncio.Task]
+] = weakref.WeakKeyDictionary()
+
+
+def _count(stat: str) -> None:
+    with _stats_lock:
+        _stats[stat] += 1
+
+
+def get_single_flight_stats() -> dict[str, int]:
+    """Get this process's single-flight counters."""
+    with _stats_lock:
+        return {stat: _stats[stat] for stat in STAT_KEYS}
+
+
+def _is_distributed() -> bool:
+    return bool(getattr(settings, "GRAPH_SINGLE_FLIGHT_DISTRIBUTED", False))
+
+
+def _get_timeout() -> float:
+    return float(getattr(settings, "GRAPH_SINGLE_FLIGHT_TIMEOUT", 30))
+
+
+def _flight_key(name: str, generation: int | None, args: tuple, kwargs: dict[str, Any]) -> str:
+    """Identify a call by function name, graph generation and arguments."""
+    params = json.dumps([args, kwargs], sort_keys=True, default=str)
+    digest = hashlib.blake2b(params.encode("utf-8"), digest_size=12).hexdigest()
+    return f"{name}:{generation}:{digest}"
+
+
+def _get_generation() -> int | None:
+    """Get the graph generation for flight keys, None if unavailable."""
+    try:
+        return get_graph_generation()
+    except Exception as e:
+        logger.error(f"Failed to read graph generation for single-flight: {e}")
+        return None
+
+
+async def _aget_generation() -> int | None:
+    """Async variant of _get_generation."""
+    try:
+        return await aget_graph_generation()
+    except Exception as e:
+        logger.error(f"Failed to read graph generation for single-flight: {e}")
+        return None
+
+
+# ============================================================================
+# Cross-process coordination
+# ============================================================================
+
+def _run_distributed(key: str, call: Callable[[], Any]) -> Any:
+    """Run a call once across processes, or wait for the process running it."""
+    r = get_redis_client()
+    lock_key = SINGLE_FLIGHT_LOCK_KEY.format(key=key)
+    result_key = SINGLE_FLIGHT_RESULT_KEY.format(key=key)
+    token = uuid.uuid4().hex
+    timeout = _get_timeout()
+    deadline = time.monotonic() + timeout
+
+    try:
+        while True:
+            published = r.get(result_key)
+            if published is not None:
+                _count("remote_hits")
+                return orjson.loads(published)
+            if r.set(lock_key, token, nx=True, px=int(timeout * 1000)):
+                break
+            if time.monotonic() >= deadline:
+                _count("remote_timeouts")
+                _count("executed")
+                return orjson.loads(render_json(call()))
+            time.sleep(POLL_INTERVAL)
+    except Exception as e:
+        logger.error(f"Single-flight Redis coordination failed for {key}: {e}")
+        _count("executed")
+        return orjson.loads(render_json(call()))
+
+    try:
+        _count("executed")
+        published = render_json(call())
+        try:
+            r.set(result_key, published, px=RESULT_TTL_MS)
+        except Exception as e:
+            logger.error(f"Failed to publish single-flight result for {key}: {e}")
+        # Decoded like a remote result, so every caller gets the same types
+        return orjson.loads(published)
+    finally:
+        try:
+            r.register_script(RELEASE_LOCK_SCRIPT)(keys=[lock_key], args=[token])
+        except Exception as e:
+            logger.error(f"Failed to release single-flight lock for {key}: {e}")
+
+
+async def _arun_distributed(key: str, call: Callable[[], Any]) -> Any:
+    """Async variant of _run_distributed; call returns an awaitable."""
+    r = get_async_redis_client()
+    lock_key = SINGLE_FLIGHT_LOCK_KEY.format(key=key)
+    result_key = SINGLE_FLIGHT_RESULT_KEY.format(key=key)
+    token = uuid.uuid4().hex
+    timeout = _get_timeout()
+    deadline = time.monotonic() + timeout
+
+    try:
+        while True:
+            published = await r.get(result_key)
+            if published is not None:
+                _count("remote_hits")
+                return orjson.loads(published)
+            if await r.set(lock_key, token, nx=True, px=int(timeout * 1000)):
+                break
+            if time.monotonic() >= deadline:
+                _count("remote_timeouts")
+                _count("executed")
+                return orjson.loads(render_json(await call()))
+            await asyncio.sleep(POLL_INTERVAL)
+    except Exception as e:
+        logger.error(f"Single-flight Redis coordination failed for {key}: {e}")
+        _count("executed")
+        return orjson.loads(render_json(await call()))
+
+    try:
+        _count("executed")
+        published = render_json(await call())
+        try:
+            await r.set(result_key, published, px=RESULT_TTL_MS)
+        except Exception as e:
+            logger.error(f"Failed to publish single-flight result for {key}: {e}")
+        # Decoded like a remote result, so every caller gets the same types
+        return orjson.loads(published)
+    finally:
+        try:
+            await r.register_script(RELEASE_LOCK_SCRIPT)(keys=[lock_key], args=[token])
+        except Exception as e:
+            logger.error(f"Failed to release single-flight lock for {key}: {e}")
+
+
+# ============================================================================
+# Decorator
+# ============================================================================
+
+async def _arun(key: str, func: Callable, args: tuple, kwargs: dict[str, Any]) -> Any:
+    """Run an async single-flight query, across processes if enabled."""
+    if _is_distributed():
+        return await _arun_distributed(key, lambda: func(*args, **kwargs))
+    _count("executed")
+    return await func(*args, **kwargs)
+
+
+def _end_async_flight(flights: dict[str, asyncio.Task], key: str, task: asyncio.Task) -> None:
+    """Forget a finished async flight so later calls run the query again."""
+    if flights.get(key) is task:
+        del flights[key]
+    if not task.cancelled():
+        # Callers re-raise it; mark it retrieved if they were all cancelled
+        task.exception()
+
+
+def single_flight(name: str) -> Callable:
+    """
+    Coalesce concurrent calls of a function that have equal arguments.
+
+    Works on sync and async functions. Arguments must be JSON-serializable
+    (or have a stable str()); with distributed coalescing the result must be
+    JSON-serializable too.
+
+    Args:
+        name: Name identifying the function in flight keys
+
+    Usage:
+        @single_flight("media_graph")
+        async def aget_media_graph_data(platform=None, ...):
+            ...
+    """
+
+    def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                _count("calls")
+                key = _flight_key(name, await _aget_generation(), args, kwargs)
+                loop = asyncio.get_running_loop()
+                flights = _async_flights.setdefault(loop, {})
+
+                task = flights.get(key)
+                if task is not None:
+                    _count("coalesced")
+                else:
+                    task = loop.create_task(_arun(key, func, args, kwargs))
+                    flights[key] = task
+                    task.add_done_callback(lambda done: _end_async_flight(flights, key, done))
+
+                # Shielded so a cancelled caller, the first one included,
+                # does not cancel the query the others wait on
+                return await asyncio.shield(task)
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            _count("calls")
+            key = _flight_key(name, _get_generation(), args, kwargs)
+
+            with _sync_flights_lock:
+                flight = _sync_flights.get(key)
+                leader = flight is None
+                if leader:
+                    flight = _Flight()
+                    _sync_flights[key] = flight
+
+            if not leader:
+                _count("coalesced")
+                flight.done.wait()
+                if flight.error is not None:
+                    raise flight.error
+                return flight.result
+
+            try:
+                if _is_distributed():
+                    flight.result = _run_distributed(key, lambda: func(*args, **kwargs))
+                else:
+                    _count("executed")
+                    flight.result = func(*args, **kwargs)
+                return flight.result
+            except BaseException as e:
+                flight.error = e
+                raise
+            finally:
+                with _sync_flights_lock:
+                    _sync_flights.pop(key, None)
+                flight.done.set()
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,116 @@
+"""Shared test fixtures."""
+
+import pytest
+
+from services import redis_client
+
+
+class FakeRedis:
+    """In-memory stand-in for the Redis commands the services use."""
+
+    def __init__(self):
+        self.data = {}
+        self.expiry = {}
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+    def exists(self, *keys):
+        return sum(key in self.data for key in keys)
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, nx=False, ex=None, px=None):
+        if nx and key in self.data:
+            return None
+        # Values come back decoded, as with decode_responses=True
+        self.data[key] = value.decode() if isinstance(value, bytes) else str(value)
+        return True
+
+    def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        return int(self.data[key])
+
+    def delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    unlink = delete
+
+    def register_script(self, script):
+        # Only the compare-and-delete lock release script is registered
+        def release(keys, args):
+            return self.delete(keys[0]) if self.data.get(keys[0]) == args[0] else 0
+
+        return release
+
+    def rename(self, src, dst):
+        self.data[dst] = self.data.pop(src)
+        return True
+
+    def expire(self, key, seconds):
+        self.expiry[key] = seconds
+        return key in self.data
+
+    def zincrby(self, key, amount, member):
+        zset = self.data.setdefault(key, {})
+        zset[member] = zset.get(member, 0) + amount
+        return float(zset[member])
+
+    def zadd(self, key, mapping):
+        self.data.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    def zrevrange(self, key, start, end, withscores=False):
+        entries = sorted(
+            self.data.get(key, {}).items(), key=lambda entry: (entry[1], entry[0]), reverse=True
+        )
+        entries = entries[start:] if end == -1 else entries[start : end + 1]
+        if withscores:
+            return [(member, float(score)) for member, score in entries]
+        return [member for member, _ in entries]
+
+    def zremrangebyrank(self, key, start, end):
+        ranked = sorted(self.data.get(key, {}).items(), key=lambda entry: (entry[1], entry[0]))
+        start = start + len(ranked) if start < 0 else start
+        end = end + len(ranked) if end < 0 else end
+        removed = ranked[max(start, 0) : end + 1]
+        for member, _ in removed:
+            del self.data[key][member]
+        return len(removed)
+
+    def sadd(self, key, *members):
+        self.data.setdefault(key, set()).update(members)
+        return len(members)
+
+    def sscan_iter(self, key, count=None):
+        return iter(list(self.data.get(key, ())))
+
+
+class _FakePipeline:
+    """Queues FakeRedis commands until execute()."""
+
+    def __init__(self, redis):
+        self._redis = redis
+        self._commands = []
+
+    def __getattr__(self, name):
+        command = getattr(self._redis, name)
+
+        def queue(*args, **kwargs):
+            self._commands.append((command, args, kwargs))
+            return self
+
+        return queue
+
+    def execute(self):
+        commands, self._commands = self._commands, []
+        return [command(*args, **kwargs) for command, args, kwargs in commands]
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """Serve get_redis_client() from an in-memory FakeRedis."""
+    fake = FakeRedis()
+    monkeypatch.setattr(redis_client, "_redis_client", fake)
+    return fake
@@ -0,0 +1,90 @@
+"""Tests for the graph response cache."""
+
+import gzip
+
+import pytest
+from django.core.cache import cache
+from django.test import RequestFactory
+
+from services.graph_cache import (
+    bump_graph_generation,
+    cached_graph_response,
+    get_graph_generation,
+)
+
+
+@pytest.fixture(autouse=True)
+def local_cache(settings):
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+    cache.clear()
+
+
+@pytest.fixture
+def view():
+    calls = []
+
+    @cached_graph_response("test")
+    def graph_view(request, limit=10):
+        calls.append(limit)
+        return {"nodes": ["n" * 2000], "limit": limit}
+
+    graph_view.calls = calls
+    return graph_view
+
+
+def _get(**headers):
+    return RequestFactory().get("/", **{f"HTTP_{k.upper()}": v for k, v in headers.items()})
+
+
+def test_response_is_cached_until_the_generation_changes(view):
+    first = view(_get(), limit=10)
+    assert view(_get(), limit=10).content == first.content
+    assert view.calls == [10]
+
+    bump_graph_generation()
+    assert view(_get(), limit=10)["ETag"] != first["ETag"]
+    assert view.calls == [10, 10]
+
+
+def test_a_restarted_generation_counter_does_not_repeat_etags(view):
+    bump_graph_generation()
+    before = view(_get(), limit=10)["ETag"]
+
+    # The counter is flushed or evicted and starts over
+    cache.clear()
+    generation = get_graph_generation()
+
+    assert generation != 1
+    assert view(_get(), limit=10)["ETag"] != before
+    assert bump_graph_generation() == generation + 1
+
+
+def test_gzip_and_identity_bodies_have_distinct_etags(view):
+    identity = view(_get(), limit=10)
+    compressed = view(_get(accept_encoding="gzip, br"), limit=10)
+
+    assert compressed["Content-Encoding"] == "gzip"
+    assert gzip.decompress(compressed.content) == identity.content
+    assert not identity.has_header("Content-Encoding")
+    assert compressed["ETag"] == identity["ETag"][:-1] + '-gz"'
+
+
+def test_if_none_match_revalidates_each_encoding(view):
+    identity = view(_get(), limit=10)["ETag"]
+    compressed = view(_get(accept_encoding="gzip"), limit=10)["ETag"]
+
+    assert view(_get(if_none_match=identity), limit=10).status_code == 304
+    assert view(_get(if_none_match=f"W/{identity}"), limit=10).status_code == 304
+    response = view(_get(if_none_match=compressed, accept_encoding="gzip"), limit=10)
+    assert response.status_code == 304
+    assert response["ETag"] == compressed
+
+
+def test_gzip_etag_does_not_match_without_gzip(view):
+    compressed = view(_get(accept_encoding="gzip"), limit=10)["ETag"]
+
+    response = view(_get(if_none_match=compressed), limit=10)
+    assert response.status_code == 200
+    assert not response.has_header("Content-Encoding")
@@ -0,0 +1,59 @@
+"""Tests for the columnar graph format."""
+
+from services.graph_format import to_columnar
+
+
+def _graph():
+    return {
+        "nodes": [
+            {"id": "content_1", "type": "content", "label": "A", "properties": {"likes": 3}},
+            {"id": "keyword_x", "type": "keyword", "label": "x"},
+            {"id": "content_2", "type": "content", "label": "B", "properties": {}},
+        ],
+        "edges": [
+            {"source": "content_1", "target": "keyword_x", "type": "HAS_KEYWORD"},
+            {"source": "content_2", "target": "keyword_x", "type": "HAS_KEYWORD"},
+            {"source": "content_2", "target": "content_1", "type": "RELATED"},
+        ],
+        "stats": {"nodeCount": 3, "edgeCount": 3},
+    }
+
+
+def test_nodes_become_parallel_arrays_with_type_tables():
+    columnar = to_columnar(_graph())
+
+    assert columnar["format"] == "columnar"
+    assert columnar["nodeTypes"] == ["content", "keyword"]
+    assert columnar["nodes"] == {
+        "ids": ["content_1", "keyword_x", "content_2"],
+        "types": [0, 1, 0],
+        "labels": ["A", "x", "B"],
+        "properties": [{"likes": 3}, {}, {}],
+    }
+    assert columnar["stats"] == {"nodeCount": 3, "edgeCount": 3}
+
+
+def test_edges_become_node_index_pairs():
+    columnar = to_columnar(_graph())
+
+    assert columnar["edgeTypes"] == ["HAS_KEYWORD", "RELATED"]
+    assert columnar["edges"] == {
+        "source": [0, 2, 2],
+        "target": [1, 1, 0],
+        "types": [0, 0, 1],
+    }
+
+
+def test_edges_to_missing_nodes_are_dropped():
+    graph = _graph()
+    graph["edges"].append({"source": "content_1", "target": "keyword_gone", "type": "HAS_KEYWORD"})
+
+    assert to_columnar(graph)["edges"]["source"] == [0, 2, 2]
+
+
+def test_empty_graph():
+    columnar = to_columnar({"nodes": [], "edges": [], "stats": {}})
+
+    assert columnar["nodeTypes"] == []
+    assert columnar["nodes"]["ids"] == []
+    assert columnar["edges"]["source"] == []
@@ -0,0 +1,107 @@
+"""Tests for the keyword autocomplete index."""
+
+import pytest
+
+from services import keyword_autocomplete as ac
+from services.keyword_popularity import KEYWORD_COUNTS_RECONCILED_KEY
+
+
+class _FakeNeo4jClient:
+    """Serves keyword counts and records the queries run."""
+
+    def __init__(self, records):
+        self.records = records
+        self.queries = []
+
+    def run_query(self, query, parameters=None):
+        self.queries.append(query)
+        return self.records
+
+
+@pytest.fixture
+def neo4j(monkeypatch):
+    client = _FakeNeo4jClient([
+        {"name": "美食推荐", "count": 9},
+        {"name": "美食", "count": 5},
+        {"name": "MacBook Pro", "count": 3},
+    ])
+    monkeypatch.setattr(ac, "get_neo4j_client", lambda: client)
+    return client
+
+
+def test_index_serves_prefix_and_substring_completions(fake_redis, neo4j):
+    assert ac.autocomplete_keywords("美") is None
+
+    ac.rebuild_autocomplete_index()
+
+    assert ac.autocomplete_keywords("美") == [
+        {"name": "美食推荐", "count": 9},
+        {"name": "美食", "count": 5},
+    ]
+    assert ac.autocomplete_keywords("ＭＡＣ") == [{"name": "MacBook Pro", "count": 3}]
+    assert ac.autocomplete_keywords("推荐", mode="substring") == [{"name": "美食推荐", "count": 9}]
+    assert ac.autocomplete_keywords("推荐") == []
+
+
+def test_rebuild_counts_links_until_counters_are_reconciled(fake_redis, neo4j):
+    ac.rebuild_autocomplete_index()
+    fake_redis.set(KEYWORD_COUNTS_RECONCILED_KEY, "1")
+    ac.rebuild_autocomplete_index()
+
+    assert neo4j.queries == [ac.COUNT_KEYWORD_LINKS_QUERY, ac.FETCH_KEYWORD_COUNTS_QUERY]
+
+
+def test_rebuild_expires_the_replaced_version(fake_redis, neo4j):
+    first = ac.rebuild_autocomplete_index()["version"]
+    second = ac.rebuild_autocomplete_index()["version"]
+
+    first_keys_key = ac.AUTOCOMPLETE_VERSION_KEYS_KEY.format(version=first)
+    second_keys_key = ac.AUTOCOMPLETE_VERSION_KEYS_KEY.format(version=second)
+    retired = fake_redis.data[first_keys_key] | {first_keys_key}
+    assert {key: fake_redis.expiry[key] for key in retired} == dict.fromkeys(
+        retired, ac.RETIRED_VERSION_TTL
+    )
+    assert not fake_redis.data[second_keys_key] & set(fake_redis.expiry)
+    assert fake_redis.get(ac.AUTOCOMPLETE_VERSION_KEY) == second
+
+
+def test_sync_counts_update_the_current_index_in_place(fake_redis, neo4j, settings):
+    settings.KEYWORD_AUTOCOMPLETE_SIZE = 2
+    fake_redis.set(KEYWORD_COUNTS_RECONCILED_KEY, "1")
+    version = ac.rebuild_autocomplete_index()["version"]
+
+    ac.update_autocomplete_counts({"美食": 12, "美味": 7})
+
+    assert ac.autocomplete_keywords("美") == [
+        {"name": "美食", "count": 12},
+        {"name": "美食推荐", "count": 9},
+    ]
+    assert ac.autocomplete_keywords("味", mode="substring") == [{"name": "美味", "count": 7}]
+    assert fake_redis.get(ac.AUTOCOMPLETE_VERSION_KEY) == version
+    # New fragment sets are tracked, so they are retired with their version
+    new_key = ac.AUTOCOMPLETE_FRAGMENT_KEY.format(version=version, kind="s", fragment="味")
+    assert new_key in fake_redis.data[ac.AUTOCOMPLETE_VERSION_KEYS_KEY.format(version=version)]
+
+
+def test_sync_counts_wait_for_reconciled_counters(fake_redis, neo4j):
+    ac.rebuild_autocomplete_index()
+
+    ac.update_autocomplete_counts({"美食": 12})
+
+    assert ac.autocomplete_keywords("美食") == [
+        {"name": "美食推荐", "count": 9},
+        {"name": "美食", "count": 5},
+    ]
+
+
+def test_rebuild_is_needed_only_when_sync_counts_could_not_be_applied(fake_redis, neo4j):
+    wrote = {"content_synced": 3, "keywords_synced": 4}
+
+    assert not ac.autocomplete_needs_rebuild({"content_synced": 0, "keywords_synced": 0})
+    # No index yet
+    assert ac.autocomplete_needs_rebuild(wrote)
+    ac.rebuild_autocomplete_index()
+    # Counters not reconciled
+    assert ac.autocomplete_needs_rebuild(wrote)
+    fake_redis.set(KEYWORD_COUNTS_RECONCILED_KEY, "1")
+    assert not ac.autocomplete_needs_rebuild(wrote)
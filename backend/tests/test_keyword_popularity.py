@@ -0,0 +1,66 @@
+"""Tests for the keyword popularity counters."""
+
+from services import keyword_popularity as kp
+from services import media_neo4j_sync, neo4j_sync
+
+
+class _FakeNeo4jClient:
+    """Serves keyword link counts and checks the marker is set last."""
+
+    def __init__(self, redis, records):
+        self.redis = redis
+        self.records = records
+        self.writes = []
+
+    def run_query(self, query, parameters=None):
+        return self.records
+
+    def run_write_query(self, query, parameters=None):
+        assert not self.redis.exists(kp.KEYWORD_COUNTS_RECONCILED_KEY)
+        self.writes.append(query)
+        return {"properties_set": 2}
+
+
+def test_top_keywords_are_read_only_once_reconciled(fake_redis, monkeypatch):
+    # Increments after an upgrade only cover links synced since
+    assert kp.record_keyword_links("xhs", ["美食", "美食", "旅行"]) == {"美食": 2, "旅行": 1}
+    assert not kp.keyword_counts_reconciled()
+    assert kp.get_top_keywords() is None
+
+    client = _FakeNeo4jClient(fake_redis, [
+        {"name": "美食", "platform": "xhs", "count": 5},
+        {"name": "美食", "platform": "douyin", "count": 1},
+        {"name": "旅行", "platform": "xhs", "count": 2},
+        {"name": "冷门", "platform": None, "count": 0},
+    ])
+    monkeypatch.setattr(kp, "get_neo4j_client", lambda: client)
+    kp.reconcile_keyword_counts(["xhs", "douyin"])
+
+    assert client.writes == [kp.SET_KEYWORD_COUNTS_QUERY, kp.RECONCILE_TAG_COUNTS_QUERY]
+    assert kp.keyword_counts_reconciled()
+    assert kp.get_top_keywords() == [{"name": "美食", "count": 6}, {"name": "旅行", "count": 2}]
+    assert kp.get_top_keywords(platform="douyin") == [{"name": "美食", "count": 1}]
+
+
+def test_unreadable_marker_counts_as_not_reconciled(monkeypatch):
+    def unavailable():
+        raise ConnectionError("Redis unavailable")
+
+    monkeypatch.setattr(kp, "get_redis_client", unavailable)
+
+    assert kp.keyword_counts_reconciled() is False
+
+
+def test_popular_keywords_count_relationships_until_reconciled():
+    query, params = media_neo4j_sync._popular_keywords_query("xhs", 10, reconciled=False)
+    assert query == media_neo4j_sync.COUNT_POPULAR_KEYWORDS_BY_PLATFORM_QUERY
+    assert params == {"platform": "xhs", "limit": 10}
+    query, _ = media_neo4j_sync._popular_keywords_query(None, 10, reconciled=False)
+    assert query == media_neo4j_sync.COUNT_POPULAR_KEYWORDS_ALL_QUERY
+    query, _ = media_neo4j_sync._popular_keywords_query(None, 10, reconciled=True)
+    assert query == media_neo4j_sync.GET_POPULAR_KEYWORDS_ALL_QUERY
+
+    assert neo4j_sync._popular_keywords_query(10, None, False)[0] == neo4j_sync.COUNT_POPULAR_TAGS_QUERY
+    assert neo4j_sync._popular_keywords_query(10, None, True)[0] == neo4j_sync.GET_POPULAR_TAGS_QUERY
+    # Task-scoped tags are always counted from relationships
+    assert neo4j_sync._popular_keywords_query(10, "t1", True)[0] == neo4j_sync.GET_TASK_TAGS_QUERY
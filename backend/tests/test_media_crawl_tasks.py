@@ -0,0 +1,99 @@
+"""Tests for the media Neo4j sync Celery tasks."""
+
+import pytest
+from django.core.cache import cache
+
+from apps.media_crawl import tasks
+from core.exceptions import SyncError
+from services.media_neo4j_sync import SUPPORTED_PLATFORMS
+
+
+@pytest.fixture(autouse=True)
+def statuses(settings, monkeypatch):
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+    cache.clear()
+    recorded = []
+    monkeypatch.setattr(
+        tasks, "update_sync_status", lambda status, **kwargs: recorded.append((status, kwargs))
+    )
+    monkeypatch.setattr(tasks, "autocomplete_needs_rebuild", lambda totals: False)
+    return recorded
+
+
+def test_all_platform_sync_fans_out_into_lanes(settings, monkeypatch):
+    settings.MEDIA_NEO4J_SYNC_CONCURRENCY = 3
+    dispatched = []
+    monkeypatch.setattr(tasks, "chord", lambda header: dispatched.append)
+
+    result = tasks.sync_media_to_neo4j()
+
+    lanes = result["subtasks"]
+    assert result["status"] == "dispatched"
+    assert len(lanes) == 3
+    assert sorted(p for lane in lanes for p in lane) == sorted(SUPPORTED_PLATFORMS)
+    assert len(dispatched) == 1
+
+
+def test_chord_merge_sums_totals_and_reports_failed_platforms(statuses):
+    lanes = [
+        {"xhs": {"content_synced": 3, "keywords_synced": 5, "comments_synced": 7}},
+        {
+            "douyin": {"content_synced": 2, "keywords_synced": 1, "comments_synced": 0},
+            "weibo": {"error": "Neo4j unavailable"},
+        },
+    ]
+
+    results = tasks.merge_media_sync_results(lanes, task_id="sync-1")
+
+    assert results["task_id"] == "sync-1"
+    assert set(results["platforms"]) == {"xhs", "douyin", "weibo"}
+    assert results["totals"]["content_synced"] == 5
+    assert results["totals"]["keywords_synced"] == 6
+    assert results["totals"]["comments_synced"] == 7
+    assert results["error"] == "Sync failed for platforms: weibo"
+    assert statuses == [("idle", {"progress": 100, "last_result": results})]
+
+
+def test_retry_skips_platforms_completed_by_the_same_task(monkeypatch):
+    calls = []
+    failing = {"weibo"}
+
+    def sync_platform_content(platform, limit, full):
+        calls.append(platform)
+        if platform in failing:
+            return {"platforms": {platform: {"error": "Neo4j unavailable"}}}
+        return {"platforms": {platform: {"content_synced": 1}}}
+
+    monkeypatch.setattr(tasks, "sync_platform_content", sync_platform_content)
+
+    with pytest.raises(SyncError):
+        tasks._sync_platforms("task-1", ["xhs", "weibo"], None, False)
+
+    failing.clear()
+    completed = tasks._sync_platforms("task-1", ["xhs", "weibo"], None, False)
+
+    assert calls == ["xhs", "weibo", "weibo"]
+    assert completed == {"xhs": {"content_synced": 1}, "weibo": {"content_synced": 1}}
+
+
+def test_autocomplete_rebuilds_are_debounced_into_a_task(settings, monkeypatch):
+    settings.KEYWORD_AUTOCOMPLETE_REBUILD_DELAY = 30
+    scheduled = []
+    rebuilt = []
+    monkeypatch.setattr(tasks, "autocomplete_needs_rebuild", lambda totals: True)
+    monkeypatch.setattr(
+        tasks.rebuild_keyword_autocomplete, "apply_async", lambda **kwargs: scheduled.append(kwargs)
+    )
+    monkeypatch.setattr(tasks, "rebuild_autocomplete_index", lambda: rebuilt.append(1) or {"version": "2"})
+
+    tasks.schedule_autocomplete_rebuild({"keywords_synced": 1})
+    tasks.schedule_autocomplete_rebuild({"keywords_synced": 2})
+    assert scheduled == [{"countdown": 30}]
+    assert rebuilt == []
+
+    assert tasks.rebuild_keyword_autocomplete() == {"version": "2"}
+    # A sync finishing once the rebuild has started schedules the next one
+    tasks.schedule_autocomplete_rebuild({"keywords_synced": 1})
+    assert scheduled == [{"countdown": 30}] * 2
@@ -0,0 +1,437 @@
+"""Tests for the media Neo4j sync helpers."""
+
+import re
+from types import SimpleNamespace
+
+import pytest
+from django.core.cache import cache
+
+from core.exceptions import SyncError
+from services import media_neo4j_sync as sync
+from services.media_neo4j_sync import (
+    FETCH_SYNC_HASHES_QUERY,
+    GET_MEDIA_GRAPH_BY_KEYWORD_QUERY,
+    GET_MEDIA_GRAPH_BY_PLATFORM_AND_KEYWORD_QUERY,
+    _iter_rows_by_pk,
+    _sync_hash,
+    _write_chunk_tx,
+    normalize_keyword,
+)
+from services.neo4j_schema import SCHEMA_RANGE_INDEXES
+
+
+def test_normalize_keyword_folds_width_and_case():
+    assert normalize_keyword("ＡＢＣ１２３") == "abc123"
+    assert normalize_keyword("iPhone") == "iphone"
+    assert normalize_keyword("Straße") == "strasse"
+
+
+def test_normalize_keyword_collapses_whitespace():
+    assert normalize_keyword("  mac　 book\tpro \n") == "mac book pro"
+
+
+def test_normalize_keyword_keeps_cjk():
+    assert normalize_keyword("美食推荐") == "美食推荐"
+
+
+def test_normalize_keyword_of_empty_text():
+    assert normalize_keyword(None) == ""
+    assert normalize_keyword("") == ""
+    assert normalize_keyword("   ") == ""
+
+
+def test_keyword_graph_queries_match_on_the_indexed_key():
+    for query in (GET_MEDIA_GRAPH_BY_KEYWORD_QUERY, GET_MEDIA_GRAPH_BY_PLATFORM_AND_KEYWORD_QUERY):
+        assert re.search(r"\(\w*:MediaKeyword \{key: \$key\}\)", query)
+        assert "toLower" not in query
+    assert "FOR (k:MediaKeyword) ON (k.key)" in SCHEMA_RANGE_INDEXES["media_keyword_key"]
+
+
+def test_profile_keyword_lookup_lists_the_plan_operators(monkeypatch):
+    params = {}
+    plan = {
+        "operatorType": "ProduceResults@neo4j",
+        "children": [{
+            "operatorType": "EagerAggregation@neo4j",
+            "children": [{"operatorType": "NodeIndexSeek@neo4j", "children": []}],
+        }],
+    }
+
+    class _Tx:
+        def run(self, query, parameters):
+            assert query == sync.PROFILE_KEYWORD_LOOKUP_QUERY
+            params.update(parameters)
+            return SimpleNamespace(consume=lambda: SimpleNamespace(profile=plan))
+
+    client = SimpleNamespace(execute_read=lambda work: work(_Tx()))
+    monkeypatch.setattr(sync, "get_neo4j_client", lambda: client)
+
+    operators = sync.profile_keyword_lookup("ＩＰｈｏｎｅ")
+
+    assert operators == ["ProduceResults@neo4j", "EagerAggregation@neo4j", "NodeIndexSeek@neo4j"]
+    # The lookup runs on the normalized key, as the graph queries do
+    assert params == {"key": "iphone"}
+
+
+def test_liked_count_ordering_can_be_served_by_the_range_indexes():
+    for query in (
+        sync.GET_MEDIA_GRAPH_BY_PLATFORM_QUERY,
+        sync.GET_MEDIA_GRAPH_ALL_PLATFORMS_QUERY,
+        GET_MEDIA_GRAPH_BY_KEYWORD_QUERY,
+        GET_MEDIA_GRAPH_BY_PLATFORM_AND_KEYWORD_QUERY,
+    ):
+        assert "WHERE c.likedCount IS NOT NULL" in query
+    assert "ON (c.platform, c.likedCount)" in SCHEMA_RANGE_INDEXES["media_content_platform_liked_count"]
+
+
+def test_profile_media_graph_profiles_the_selected_query(monkeypatch):
+    runs = []
+    plan = {
+        "operatorType": "ProduceResults@neo4j",
+        "children": [{"operatorType": "NodeIndexSeekByRange@neo4j", "children": []}],
+    }
+
+    class _Tx:
+        def run(self, query, parameters):
+            runs.append((query, parameters))
+            return SimpleNamespace(consume=lambda: SimpleNamespace(profile=plan))
+
+    client = SimpleNamespace(execute_read=lambda work: work(_Tx()))
+    monkeypatch.setattr(sync, "get_neo4j_client", lambda: client)
+
+    operators = sync.profile_media_graph(platform="xhs", limit=5)
+
+    assert operators == ["ProduceResults@neo4j", "NodeIndexSeekByRange@neo4j"]
+    assert runs[0][0] == f"PROFILE {sync.GET_MEDIA_GRAPH_BY_PLATFORM_QUERY}"
+    assert runs[0][1]["platform"] == "xhs"
+    assert runs[0][1]["limit"] == 5
+
+
+class _FakeQuerySet:
+    """In-memory stand-in for the queryset calls made by _iter_rows_by_pk."""
+
+    def __init__(self, rows, queries, after=None):
+        self._rows = rows
+        self._queries = queries
+        self._after = after
+
+    def order_by(self, field):
+        assert field == "pk"
+        return _FakeQuerySet(sorted(self._rows, key=lambda row: row["pk"]), self._queries)
+
+    def values(self, *fields):
+        rows = [{field: row[field] for field in fields} for row in self._rows]
+        return _FakeQuerySet(rows, self._queries)
+
+    def filter(self, pk__gt):
+        return _FakeQuerySet(self._rows, self._queries, after=pk__gt)
+
+    def count(self):
+        return len(self._rows)
+
+    def __getitem__(self, page):
+        self._queries.append((self._after, page.stop))
+        rows = [row for row in self._rows if self._after is None or row["pk"] > self._after]
+        return rows[page]
+
+
+def _source(count):
+    # Gaps in the primary keys, as after deletes
+    rows = [{"pk": pk * 3, "title": f"t{pk}"} for pk in range(count, 0, -1)]
+    return _FakeQuerySet(rows, [])
+
+
+def test_iter_rows_by_pk_pages_by_last_primary_key():
+    source = _source(7)
+
+    rows = list(_iter_rows_by_pk(source, ["title"], page_size=3))
+
+    assert [row["pk"] for row in rows] == [3, 6, 9, 12, 15, 18, 21]
+    assert rows[0] == {"pk": 3, "title": "t1"}
+    # A short last page ends the scan without an extra empty query
+    assert source._queries == [(None, 3), (9, 3), (18, 3)]
+
+
+def test_iter_rows_by_pk_stops_at_limit():
+    source = _source(7)
+
+    rows = list(_iter_rows_by_pk(source, ["title"], page_size=3, limit=4))
+
+    assert [row["pk"] for row in rows] == [3, 6, 9, 12]
+    assert source._queries == [(None, 3), (9, 1)]
+
+
+def test_iter_rows_by_pk_resumes_after_a_primary_key():
+    source = _source(7)
+
+    rows = list(_iter_rows_by_pk(source, ["title"], page_size=3, after_pk=12))
+
+    assert [row["pk"] for row in rows] == [15, 18, 21]
+    assert source._queries == [(12, 3), (21, 3)]
+
+
+def test_iter_rows_by_pk_of_empty_source():
+    source = _source(0)
+
+    assert list(_iter_rows_by_pk(source, ["title"], page_size=3)) == []
+    assert source._queries == [(None, 3)]
+
+
+
+class _FakeWriter:
+    """Batch writer committing a chunk every batch_size rows."""
+
+    fail_on = None
+
+    def __init__(self, client, platform, load_comments, batch_size, on_commit=None):
+        self.batch_size = batch_size
+        self.on_commit = on_commit
+        self.buffer = []
+        self.written = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.flush()
+
+    def add(self, content_data, keywords, source_id):
+        if source_id == self.fail_on:
+            raise RuntimeError("Neo4j unavailable")
+        self.buffer.append(source_id)
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self.buffer:
+            return
+        chunk, self.buffer = self.buffer, []
+        _written.extend(chunk)
+        self.on_commit({"content_synced": len(chunk), "keywords_synced": 0, "comments_synced": 0})
+
+    def result(self):
+        return {}
+
+
+_written = []
+
+_SPEC = SimpleNamespace(
+    platform="xhs",
+    display_name="Xiaohongshu",
+    id_field="note_id",
+    comment_join_field="note_id",
+    content_columns=["note_id"],
+    get_models=lambda: (
+        SimpleNamespace(objects=SimpleNamespace(using=lambda alias: SimpleNamespace(all=list))),
+        None,
+    ),
+    map_content=lambda row: {"contentId": row["note_id"]},
+    extract_keywords=lambda row: [],
+)
+
+
+@pytest.fixture
+def sync_env(settings, monkeypatch):
+    """Run sync_platform_spec over five source rows with fake Neo4j writes."""
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+    cache.clear()
+    env = SimpleNamespace(since=[], watermark={"content": 100, "comment": 50})
+    rows = [{"pk": pk, "note_id": f"n{pk}"} for pk in range(1, 6)]
+
+    def changed_since(queryset, comment_model, id_field, join_field, since):
+        env.since.append(since)
+        return _FakeQuerySet(rows, [])
+
+    monkeypatch.setattr(sync, "_changed_since", changed_since)
+    monkeypatch.setattr(sync, "_current_watermark", lambda *models: dict(env.watermark))
+    monkeypatch.setattr(sync, "get_neo4j_client", lambda: None)
+    monkeypatch.setattr(sync, "_ensure_platform_node", lambda *args: None)
+    monkeypatch.setattr(sync, "MediaBatchWriter", _FakeWriter)
+    monkeypatch.setattr(_FakeWriter, "fail_on", None)
+    _written.clear()
+    yield env
+    _written.clear()
+
+
+def test_first_sync_is_full_and_stores_the_watermark(sync_env):
+    result = sync.sync_platform_spec(_SPEC, batch_size=2)
+
+    assert sync_env.since == [None]
+    assert _written == ["n1", "n2", "n3", "n4", "n5"]
+    assert result["mode"] == "full"
+    assert result["content_synced"] == 5
+    assert sync.get_sync_watermark("xhs") == {"content": 100, "comment": 50}
+    assert sync.get_sync_checkpoint("xhs") is None
+
+
+def test_next_sync_reads_rows_changed_since_the_watermark(sync_env):
+    sync.set_sync_watermark("xhs", {"content": 80, "comment": 40})
+
+    result = sync.sync_platform_spec(_SPEC, batch_size=2)
+
+    assert sync_env.since == [{"content": 80, "comment": 40}]
+    assert result["mode"] == "incremental"
+    assert sync.get_sync_watermark("xhs") == {"content": 100, "comment": 50}
+
+
+def test_failed_sync_resumes_after_the_last_committed_chunk(sync_env, monkeypatch):
+    sync.set_sync_watermark("xhs", {"content": 80, "comment": 40})
+    monkeypatch.setattr(_FakeWriter, "fail_on", "n4")
+
+    with pytest.raises(RuntimeError):
+        sync.sync_platform_spec(_SPEC, batch_size=2)
+
+    checkpoint = sync.get_sync_checkpoint("xhs")
+    assert checkpoint["last_pk"] == 2
+    assert checkpoint["synced"]["content_synced"] == 2
+    # The watermark only moves once a run has finished
+    assert sync.get_sync_watermark("xhs") == {"content": 80, "comment": 40}
+
+    monkeypatch.setattr(_FakeWriter, "fail_on", None)
+    sync_env.watermark = {"content": 120, "comment": 60}
+    result = sync.sync_platform_spec(_SPEC, batch_size=2)
+
+    assert result["resumed"] is True
+    assert _written == ["n1", "n2", "n3", "n4", "n5"]
+    assert result["content_synced"] == 5
+    # Same range as the failed run; later changes are left for the next sync
+    assert sync_env.since[-1] == {"content": 80, "comment": 40}
+    assert sync.get_sync_watermark("xhs") == {"content": 100, "comment": 50}
+    assert sync.get_sync_checkpoint("xhs") is None
+
+
+def test_limited_sync_neither_checkpoints_nor_moves_the_watermark(sync_env, monkeypatch):
+    monkeypatch.setattr(_FakeWriter, "fail_on", "n2")
+
+    with pytest.raises(RuntimeError):
+        sync.sync_platform_spec(_SPEC, limit=3, batch_size=1)
+    assert sync.get_sync_checkpoint("xhs") is None
+
+    monkeypatch.setattr(_FakeWriter, "fail_on", None)
+    sync.sync_platform_spec(_SPEC, limit=3, batch_size=1)
+    assert sync.get_sync_watermark("xhs") is None
+
+
+def test_sync_is_refused_while_another_run_holds_the_lock(sync_env):
+    token = sync.acquire_sync_lock("xhs")
+
+    with pytest.raises(SyncError):
+        sync.sync_platform_spec(_SPEC, batch_size=2)
+    assert _written == []
+
+    sync.release_sync_lock("xhs", token)
+    assert sync.sync_platform_spec(_SPEC, batch_size=2)["content_synced"] == 5
+    assert cache.get(sync.SYNC_LOCK_CACHE_KEY.format(platform="xhs")) is None
+
+
+class _LockLosingWriter(_FakeWriter):
+    """Writer whose second chunk commits after another run took the lock."""
+
+    def flush(self):
+        if _written:
+            cache.set(sync.SYNC_LOCK_CACHE_KEY.format(platform="xhs"), "other-run")
+        super().flush()
+
+
+def test_run_that_lost_its_lock_leaves_the_checkpoint_alone(sync_env, monkeypatch):
+    monkeypatch.setattr(sync, "MediaBatchWriter", _LockLosingWriter)
+
+    with pytest.raises(SyncError):
+        sync.sync_platform_spec(_SPEC, batch_size=2)
+
+    assert sync.get_sync_checkpoint("xhs")["last_pk"] == 2
+    assert sync.get_sync_watermark("xhs") is None
+    # The lock now belongs to the other run and is not released
+    assert cache.get(sync.SYNC_LOCK_CACHE_KEY.format(platform="xhs")) == "other-run"
+
+
+class _FakeResult(list):
+    def consume(self):
+        return None
+
+
+class _FakeTx:
+    """Transaction serving stored sync hashes and recording the writes."""
+
+    def __init__(self, stored):
+        self.stored = stored
+        self.writes = []
+
+    def run(self, query, parameters):
+        if query == FETCH_SYNC_HASHES_QUERY:
+            return _FakeResult(
+                {"kind": kind, "id": id_, "hash": hash_}
+                for (kind, id_), hash_ in self.stored.items()
+            )
+        rows = parameters["rows"]
+        self.writes.append((query, rows))
+        # The keyword write returns the names of the relationships it created
+        return _FakeResult({"name": row["name"]} for row in rows if "name" in row)
+
+
+def _content(content_id, title):
+    data = {"contentId": content_id, "title": title}
+    return {**data, "syncHash": _sync_hash(data)}
+
+
+def _comment(comment_id, text):
+    data = {"commentId": comment_id, "content": text}
+    return {**data, "syncHash": _sync_hash(data)}
+
+
+def test_sync_hash_is_stable_and_order_independent():
+    assert _sync_hash({"a": 1, "b": "美食"}) == _sync_hash({"b": "美食", "a": 1})
+    assert _sync_hash({"a": 1}) != _sync_hash({"a": 2})
+
+
+def test_write_chunk_skips_unchanged_rows():
+    unchanged, changed = _content("c1", "same"), _content("c2", "new title")
+    old_comment, new_comment = _comment("m1", "same"), _comment("m2", "new")
+    tx = _FakeTx({
+        ("content", "c1"): unchanged["syncHash"],
+        ("content", "c2"): _content("c2", "old title")["syncHash"],
+        ("comment", "m1"): old_comment["syncHash"],
+    })
+    keywords = [{"contentId": "c1", "name": "a"}, {"contentId": "c2", "name": "b"}]
+
+    contents, written_keywords, comments, linked = _write_chunk_tx(
+        tx, "xhs", [unchanged, changed], keywords, [old_comment, new_comment]
+    )
+
+    assert contents == [changed]
+    # Keyword rows are only written along with their changed content
+    assert written_keywords == [{"contentId": "c2", "name": "b"}]
+    assert comments == [new_comment]
+    assert linked == ["b"]
+    assert [rows for _, rows in tx.writes] == [[changed], written_keywords, [new_comment]]
+
+
+def test_platform_count_queries_are_built_once_per_platform(monkeypatch):
+    registered = []
+    monkeypatch.setattr(sync, "_platform_count_queries", {})
+    monkeypatch.setattr(sync, "register_query", lambda name, query: registered.append(name))
+
+    first = sync._with_platform_count(sync.MERGE_KEYWORD_QUERY, "xhs")
+    again = sync._with_platform_count(sync.MERGE_KEYWORD_QUERY, "xhs")
+    other = sync._with_platform_count(sync.MERGE_KEYWORD_QUERY, "douyin")
+
+    assert again is first
+    assert "`xhsCount`" in first and "`platformCount`" not in first
+    assert "`douyinCount`" in other
+    assert registered == ["MERGE_KEYWORD_QUERY", "MERGE_KEYWORD_QUERY"]
+
+
+def test_write_chunk_writes_nothing_when_all_rows_are_unchanged():
+    content, comment = _content("c1", "same"), _comment("m1", "same")
+    tx = _FakeTx({
+        ("content", "c1"): content["syncHash"],
+        ("comment", "m1"): comment["syncHash"],
+    })
+
+    result = _write_chunk_tx(tx, "xhs", [content], [{"contentId": "c1", "name": "a"}], [comment])
+
+    assert result == ([], [], [], [])
+    assert tx.writes == []
@@ -0,0 +1,94 @@
+"""Tests for per-process Neo4j driver management."""
+
+from types import SimpleNamespace
+
+import pytest
+from django.core.cache import cache
+
+from services import neo4j_client as nc
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """A fresh Neo4jClient whose drivers are plain objects."""
+    monkeypatch.setattr(nc.Neo4jClient, "_instance", None)
+    monkeypatch.setattr(nc, "_async_client", None)
+    monkeypatch.setattr(nc, "_inherited_drivers", [])
+    created = []
+
+    def connect(self):
+        self._driver = object()
+        created.append(self._driver)
+
+    monkeypatch.setattr(nc.Neo4jClient, "_connect", connect)
+    client = nc.Neo4jClient()
+    client.created = created
+    return client
+
+
+def test_driver_is_created_on_first_use(client):
+    assert client._driver is None
+
+    driver = client.driver
+
+    assert client.driver is driver
+    assert client.created == [driver]
+
+
+def test_a_forked_process_creates_its_own_driver(client, monkeypatch):
+    parent_driver = client.driver
+    monkeypatch.setattr(nc.os, "getpid", lambda: client._pid + 1)
+
+    child_driver = client.driver
+
+    assert child_driver is not parent_driver
+    # The parent's driver is kept open, not closed from the child
+    assert nc._inherited_drivers == [parent_driver]
+
+
+def test_reset_after_fork_discards_both_clients(client):
+    driver = client.driver
+    async_client = nc.get_async_neo4j_client()
+
+    nc.reset_neo4j_clients_after_fork()
+
+    assert client._driver is None
+    assert nc._inherited_drivers == [driver]
+    assert nc.get_async_neo4j_client() is not async_client
+
+
+@pytest.fixture
+def bookmark_cache(settings, monkeypatch):
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+    settings.NEO4J_BOOKMARKS_LOCAL_TTL = 60
+    cache.clear()
+    monkeypatch.setattr(nc, "_local_bookmarks", None)
+    return cache
+
+
+def test_published_bookmarks_are_reused_for_the_local_ttl(bookmark_cache, settings):
+    bookmark_cache.set(nc.NEO4J_BOOKMARKS_CACHE_KEY, ["bm:1"])
+    assert nc.get_shared_bookmarks().raw_values == frozenset({"bm:1"})
+
+    bookmark_cache.set(nc.NEO4J_BOOKMARKS_CACHE_KEY, ["bm:2"])
+    assert nc.get_shared_bookmarks().raw_values == frozenset({"bm:1"})
+
+    settings.NEO4J_BOOKMARKS_LOCAL_TTL = 0
+    assert nc.get_shared_bookmarks().raw_values == frozenset({"bm:2"})
+
+
+def test_published_bookmarks_expire(bookmark_cache, settings, monkeypatch):
+    settings.NEO4J_BOOKMARKS_TIMEOUT = 120
+    timeouts = []
+    monkeypatch.setattr(
+        nc.cache, "set", lambda key, value, timeout: timeouts.append((key, value, timeout))
+    )
+    client = SimpleNamespace(_write_bookmarks=SimpleNamespace(get_bookmarks=lambda: ["bm:3"]))
+
+    nc.Neo4jClient.publish_bookmarks(client)
+
+    assert timeouts == [(nc.NEO4J_BOOKMARKS_CACHE_KEY, ["bm:3"], 120)]
+    # The publishing process reads its own bookmarks without waiting for the TTL
+    assert nc.get_shared_bookmarks().raw_values == frozenset({"bm:3"})
@@ -0,0 +1,136 @@
+"""Tests for Neo4j query instrumentation."""
+
+import time
+from collections import deque
+from types import SimpleNamespace
+
+import pytest
+from django.test import Client
+
+from apps.graph.api import _staff_auth
+from services import neo4j_metrics as metrics
+
+
+@pytest.fixture(autouse=True)
+def fresh_metrics(monkeypatch):
+    monkeypatch.setattr(metrics, "_stats", {})
+    monkeypatch.setattr(metrics, "_slow_queries", deque(maxlen=metrics.MAX_SLOW_QUERIES))
+    monkeypatch.setattr(metrics, "_last_profiled", {})
+
+
+def test_described_params_keep_numbers_and_hide_text():
+    described = metrics._describe_params({
+        "limit": 50,
+        "ratio": 0.5,
+        "full": True,
+        "after": None,
+        "keyword": "private search",
+        "ids": ["c1", "c2"],
+        "row": {"title": "t"},
+        "at": object(),
+    })
+
+    assert described == {
+        "limit": 50,
+        "ratio": 0.5,
+        "full": True,
+        "after": None,
+        "keyword": "<str of 14>",
+        "ids": "<list of 2>",
+        "row": "<dict of 1>",
+        "at": "<object>",
+    }
+
+
+def test_slow_queries_are_kept_with_redacted_params(settings):
+    settings.NEO4J_SLOW_QUERY_MS = 0
+
+    metrics.record_query("MATCH (k {key: $key}) RETURN k", {"key": "private search", "limit": 5}, 0.01, 3)
+
+    snapshot = metrics.get_query_metrics()
+    assert snapshot["slowQueries"][-1]["parameters"] == {"key": "<str of 14>", "limit": 5}
+    assert "private" not in str(snapshot)
+
+
+def test_queries_asking_for_a_plan_are_not_profiled(settings, monkeypatch):
+    settings.NEO4J_SLOW_QUERY_MS = 0
+    settings.NEO4J_SLOW_QUERY_PROFILE = True
+    profiled = []
+    monkeypatch.setattr(
+        metrics, "_profile_query", lambda entry, query, parameters: profiled.append(query)
+    )
+    summary = SimpleNamespace(query_type="r", result_available_after=1, result_consumed_after=1)
+
+    metrics.record_query("PROFILE MATCH (n) RETURN n", None, 0.01, 1, summary)
+    metrics.record_query("  explain MATCH (n) RETURN n", None, 0.01, 1, summary)
+    metrics.record_query("MATCH (n) RETURN n", None, 0.01, 1, summary)
+
+    deadline = time.monotonic() + 5
+    while not profiled and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert profiled == ["MATCH (n) RETURN n"]
+
+
+class _FakeResult:
+    def __init__(self, records):
+        self._records = records
+
+    def __iter__(self):
+        return iter(self._records)
+
+    def consume(self):
+        return SimpleNamespace(result_available_after=1, result_consumed_after=2)
+
+
+class _FakeSession:
+    def run(self, query, parameters=None):
+        return _FakeResult([1, 2, 3])
+
+    def execute_read(self, work):
+        return work(SimpleNamespace(run=lambda query, parameters=None: _FakeResult([1, 2])))
+
+    def close(self):
+        pass
+
+
+def test_a_stream_closed_early_is_recorded_when_its_session_closes(settings):
+    settings.NEO4J_SLOW_QUERY_MS = 10000
+    session = metrics.instrument_session(_FakeSession())
+
+    stream = iter(session.run("MATCH (n) RETURN n"))
+    next(stream)
+    stream.close()
+    assert metrics.get_query_metrics()["queries"] == {}
+
+    session.close()
+    stats = metrics.get_query_metrics()["queries"]["MATCH (n) RETURN n"]
+    assert stats["count"] == 1
+    assert stats["records"]["sum"] == 1
+    assert stats["resultConsumedAfterMs"]["count"] == 1
+
+
+def test_unread_results_are_recorded_when_their_transaction_ends(settings):
+    settings.NEO4J_SLOW_QUERY_MS = 10000
+    session = metrics.instrument_session(_FakeSession())
+
+    session.execute_read(lambda tx: tx.run("MATCH (k) RETURN k") and None)
+
+    assert metrics.get_query_metrics()["queries"]["MATCH (k) RETURN k"]["count"] == 1
+
+
+def test_metrics_endpoint_requires_staff(settings):
+    settings.ALLOWED_HOSTS = ["testserver"]
+
+    response = Client().get("/api/v1/graph/metrics/neo4j")
+
+    assert response.status_code == 401
+
+
+def test_staff_auth_accepts_only_staff_users():
+    def request(**user):
+        return SimpleNamespace(user=SimpleNamespace(**user))
+
+    assert _staff_auth(request(is_authenticated=True, is_staff=True))
+    assert not _staff_auth(request(is_authenticated=True, is_staff=False))
+    assert not _staff_auth(request(is_authenticated=False, is_staff=False))
+    assert not _staff_auth(SimpleNamespace())
@@ -0,0 +1,44 @@
+"""Tests for the fulltext query builder."""
+
+import pytest
+
+from services.neo4j_schema import build_fulltext_query
+
+
+def test_exact_terms_are_escaped_and_anded():
+    assert build_fulltext_query("foo a+b") == "foo AND a\\+b"
+
+
+def test_operator_words_are_not_operators():
+    assert build_fulltext_query("cats AND dogs") == "cats AND and AND dogs"
+
+
+def test_prefix_and_fuzzy_latin_terms():
+    assert build_fulltext_query("foo bar", mode="prefix") == "foo* AND bar*"
+    assert build_fulltext_query("foo bar", mode="fuzzy") == "foo~ AND bar~"
+
+
+def test_cjk_prefix_query_uses_bigrams():
+    # The cjk analyzer indexes 美食推荐 as 美食/食推/推荐; "美食推荐*" matches no token
+    assert build_fulltext_query("美食推荐", mode="prefix") == "美食 AND 食推 AND 推荐*"
+
+
+def test_cjk_single_character_prefix():
+    assert build_fulltext_query("美", mode="prefix") == "美*"
+
+
+def test_cjk_fuzzy_only_applies_to_latin_parts():
+    assert build_fulltext_query("iPhone手机", mode="fuzzy") == "iPhone~ AND 手机"
+
+
+def test_mixed_term_wildcard_goes_on_last_part():
+    assert build_fulltext_query("手机壳iPhone", mode="prefix") == "手机 AND 机壳 AND iPhone*"
+
+
+def test_blank_text_builds_empty_query():
+    assert build_fulltext_query("   ", mode="prefix") == ""
+
+
+def test_unknown_mode_raises():
+    with pytest.raises(ValueError):
+        build_fulltext_query("foo", mode="regex")
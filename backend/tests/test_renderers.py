@@ -0,0 +1,31 @@
+"""Tests for the orjson graph renderer."""
+
+import datetime
+import json
+import uuid
+from decimal import Decimal
+
+from ninja.responses import NinjaJSONEncoder
+
+from config.urls import api
+from core.renderers import render_json
+
+
+def test_output_matches_the_default_renderer():
+    payload = {
+        "at": datetime.datetime(2026, 10, 17, 8, 30, 15, 123456, tzinfo=datetime.timezone.utc),
+        "naive": datetime.datetime(2026, 10, 17, 8, 30, 15, 999999),
+        "day": datetime.date(2026, 10, 17),
+        "time": datetime.time(8, 30, 15, 500000),
+        "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        "amount": Decimal("1.50"),
+        "byType": {1: "content", 2.5: "keyword"},
+        "nodes": [{"label": "美食", "likes": 3, "ratio": 0.25}],
+    }
+
+    assert json.loads(render_json(payload)) == json.loads(json.dumps(payload, cls=NinjaJSONEncoder))
+    assert json.loads(render_json(payload))["at"] == "2026-10-17T08:30:15.123Z"
+
+
+def test_other_endpoints_keep_the_default_renderer():
+    assert type(api.renderer).__name__ == "JSONRenderer"
@@ -0,0 +1,167 @@
+"""Tests for single-flight coalescing of graph queries."""
+
+import asyncio
+import datetime
+import threading
+import time
+
+import pytest
+from django.test import Client
+
+from services import single_flight as sf
+from services.graph_cache import bump_graph_generation
+from services.single_flight import SINGLE_FLIGHT_LOCK_KEY
+
+
+@pytest.fixture(autouse=True)
+def local_cache(settings):
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+    settings.GRAPH_SINGLE_FLIGHT_DISTRIBUTED = False
+
+
+def test_flight_key_ignores_kwarg_order():
+    a = sf._flight_key("media_graph", 3, (), {"platform": "xhs", "limit": 10})
+    b = sf._flight_key("media_graph", 3, (), {"limit": 10, "platform": "xhs"})
+    assert a == b
+    assert a.startswith("media_graph:3:")
+
+
+def test_flight_key_differs_by_name_generation_and_args():
+    key = sf._flight_key("media_graph", 3, (), {"limit": 10})
+    assert sf._flight_key("task_graph", 3, (), {"limit": 10}) != key
+    assert sf._flight_key("media_graph", 4, (), {"limit": 10}) != key
+    assert sf._flight_key("media_graph", 3, (), {"limit": 20}) != key
+
+
+def test_concurrent_sync_calls_share_one_execution():
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    @sf.single_flight("test_sync")
+    def query(limit):
+        calls.append(limit)
+        started.set()
+        release.wait(5)
+        return {"limit": limit}
+
+    coalesced = sf.get_single_flight_stats()["coalesced"]
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(query(10))) for _ in range(4)]
+    threads[0].start()
+    started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    # Let the leader finish only once every follower waits on its flight
+    deadline = time.monotonic() + 5
+    while sf.get_single_flight_stats()["coalesced"] < coalesced + 3:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert calls == [10]
+    assert results == [{"limit": 10}] * 4
+
+
+def test_sync_errors_reach_every_caller():
+    @sf.single_flight("test_error")
+    def query():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        query()
+    assert not sf._sync_flights
+
+
+def test_concurrent_async_calls_share_one_execution():
+    calls = []
+
+    @sf.single_flight("test_async")
+    async def query(limit):
+        calls.append(limit)
+        await asyncio.sleep(0.01)
+        return {"limit": limit}
+
+    async def run():
+        return await asyncio.gather(query(10), query(10), query(20))
+
+    results = asyncio.run(run())
+    assert sorted(calls) == [10, 20]
+    assert results == [{"limit": 10}, {"limit": 10}, {"limit": 20}]
+
+
+def test_calls_after_a_generation_bump_do_not_join_older_flights():
+    calls = []
+
+    @sf.single_flight("test_generation")
+    async def query():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return len(calls)
+
+    async def run():
+        first = asyncio.ensure_future(query())
+        while not calls:
+            await asyncio.sleep(0.001)
+        # A sync lands while the first query is still running
+        bump_graph_generation()
+        return await asyncio.gather(first, query())
+
+    assert asyncio.run(run()) == [2, 2]
+    assert len(calls) == 2
+
+
+def test_cancelling_the_first_caller_does_not_cancel_the_others():
+    calls = []
+
+    @sf.single_flight("test_cancel")
+    async def query():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"rows": 1}
+
+    async def run():
+        coalesced = sf.get_single_flight_stats()["coalesced"]
+        first = asyncio.ensure_future(query())
+        while not calls:
+            await asyncio.sleep(0.001)
+        second = asyncio.ensure_future(query())
+        while sf.get_single_flight_stats()["coalesced"] == coalesced:
+            await asyncio.sleep(0.001)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(run()) == {"rows": 1}
+    assert calls == [1]
+
+
+def test_distributed_results_have_the_same_types_on_every_path(settings, fake_redis):
+    settings.GRAPH_SINGLE_FLIGHT_DISTRIBUTED = True
+    calls = []
+
+    @sf.single_flight("test_decoded")
+    def query():
+        calls.append(1)
+        return {"pair": (1, 2), "day": datetime.date(2026, 10, 17)}
+
+    remote_hits = sf.get_single_flight_stats()["remote_hits"]
+    executed = query()
+    # The result is still published, as for a process joining the flight
+    published = query()
+
+    assert executed == published == {"pair": [1, 2], "day": "2026-10-17"}
+    assert calls == [1]
+    assert sf.get_single_flight_stats()["remote_hits"] == remote_hits + 1
+    assert not any(key.startswith(SINGLE_FLIGHT_LOCK_KEY.format(key="")) for key in fake_redis.data)
+
+
+def test_stats_endpoint_requires_staff(settings):
+    settings.ALLOWED_HOSTS = ["testserver"]
+
+    assert Client().get("/api/v1/graph/single-flight/stats").status_code == 401
@@ -3,7 +3,7 @@
  */
 
 import request from './request'
-import type { GraphData, KeywordListResponse, SearchResponse } from '@/types/graph'
+import type { GraphData, GraphNode, KeywordListResponse, SearchResponse } from '@/types/graph'
 
 /**
  * Get graph data for a specific task.
@@ -12,6 +12,13 @@ export async function getTaskGraph(taskId: string): Promise<GraphData> {
   return request.get(`/graph/task/${taskId}`)
 }
 
+/**
+ * Get a graph node with all of its properties.
+ */
+export async function getGraphNode(nodeId: string): Promise<GraphNode> {
+  return request.get(`/graph/node/${encodeURIComponent(nodeId)}`)
+}
+
 /**
  * Get popular keywords/tags.
  */
@@ -5,6 +5,7 @@
 import request from './request'
 import type {
   MediaGraphData,
+  MediaGraphNode,
   MediaKeywordListResponse,
   MediaSearchResponse,
   SyncNeo4jRequest,
@@ -23,6 +24,13 @@ export async function getMediaGraph(params?: {
   return request.get('/graph/media', { params })
 }
 
+/**
+ * Get a media graph node with all of its properties.
+ */
+export async function getMediaGraphNode(nodeId: string): Promise<MediaGraphNode> {
+  return request.get(`/graph/node/${encodeURIComponent(nodeId)}`)
+}
+
 /**
  * Get popular media keywords.
  */
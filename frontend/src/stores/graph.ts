@@ -5,7 +5,7 @@
 import { defineStore } from 'pinia'
 import { ref, computed } from 'vue'
 import type { GraphData, GraphNode, Keyword, SearchResult } from '@/types/graph'
-import { getTaskGraph, getKeywords, searchNodes } from '@/api/graph'
+import { getTaskGraph, getGraphNode, getKeywords, searchNodes } from '@/api/graph'
 
 export const useGraphStore = defineStore('graph', () => {
   // State
@@ -84,8 +84,19 @@ export const useGraphStore = defineStore('graph', () => {
     }
   }
 
-  function selectNode(node: GraphNode | null) {
+  async function selectNode(node: GraphNode | null) {
     selectedNode.value = node
+    if (!node) return
+
+    // Graph nodes only carry display properties; load the full ones
+    try {
+      const detail = await getGraphNode(node.id)
+      if (selectedNode.value?.id === node.id) {
+        selectedNode.value = { ...node, properties: detail.properties }
+      }
+    } catch (e) {
+      console.error('Failed to load node details:', e)
+    }
   }
 
   function clearGraph() {
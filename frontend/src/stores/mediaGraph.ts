@@ -6,6 +6,7 @@ import { defineStore } from 'pinia'
 import { ref, computed } from 'vue'
 import {
   getMediaGraph,
+  getMediaGraphNode,
   getMediaKeywords,
   searchMediaKeywords,
   triggerMediaSync,
@@ -146,8 +147,19 @@ export const useMediaGraphStore = defineStore('mediaGraph', () => {
     fetchGraphData(selectedPlatform.value || undefined, keyword || undefined)
   }
 
-  function selectNode(node: MediaGraphNode | null) {
+  async function selectNode(node: MediaGraphNode | null) {
     selectedNode.value = node
+    if (!node) return
+
+    // Graph nodes only carry display properties; load the full ones
+    try {
+      const detail = await getMediaGraphNode(node.id)
+      if (selectedNode.value?.id === node.id) {
+        selectedNode.value = { ...node, properties: detail.properties }
+      }
+    } catch (e) {
+      console.error('Failed to load node details:', e)
+    }
   }
 
   async function triggerSync(platform?: MediaPlatform, limit?: number) {
@@ -17,6 +17,10 @@ echo "Waiting for Neo4j..."
 echo "Running database migrations..."
 python manage.py migrate --noinput
 
+# Create Neo4j constraints and indexes (idempotent)
+echo "Bootstrapping Neo4j schema..."
+python manage.py bootstrap_neo4j_schema || echo "Neo4j schema bootstrap failed, continuing"
+
 # Collect static files (production only)
 if [ "$DJANGO_ENV" = "production" ]; then
     echo "Collecting static files..."